@@ -0,0 +1,103 @@
+"""
+Columnar event buffers for the backtesting strategies.
+
+Signals are written into preallocated NumPy columns instead of one dict per
+event, which keeps per-event memory small and avoids dict hashing on the
+strategy's per-bar path.
+"""
+from typing import Any, Dict, List, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+
+class SignalBuffer:
+    """
+    Append-only store of fixed-schema events, one NumPy array per column.
+
+    Columns that an append doesn't mention are left as NaN (or NaT), so event
+    types with optional fields can share one schema.
+    """
+
+    def __init__(
+        self,
+        columns: Mapping[str, str],
+        labels: Optional[Mapping[str, Mapping[int, str]]] = None,
+        capacity: int = 256
+    ):
+        """
+        Initialize the buffer.
+
+        Args:
+            columns: Column name to NumPy dtype
+            labels: Optional code-to-label mapping per integer column, used by to_frame()
+            capacity: Initial number of rows to allocate
+        """
+        self._dtypes = dict(columns)
+        self._labels = dict(labels or {})
+        self._columns = {name: self._allocate(dtype, capacity) for name, dtype in self._dtypes.items()}
+        self._capacity = capacity
+        self._size = 0
+
+    @staticmethod
+    def _allocate(dtype: str, capacity: int) -> np.ndarray:
+        """Allocate a column pre-filled with its missing-value marker."""
+        dtype = np.dtype(dtype)
+        if dtype.kind == 'M':
+            return np.full(capacity, np.datetime64('NaT'), dtype=dtype)
+        if dtype.kind == 'f':
+            return np.full(capacity, np.nan, dtype=dtype)
+        return np.zeros(capacity, dtype=dtype)
+
+    def _grow(self) -> None:
+        """Double the capacity of every column."""
+        self._resize(self._capacity * 2)
+
+    def reserve(self, capacity: int) -> None:
+        """
+        Make room for at least capacity rows, e.g. once the run length is known.
+
+        Args:
+            capacity: Number of rows to allocate; smaller values are ignored
+        """
+        if capacity > self._capacity:
+            self._resize(capacity)
+
+    def _resize(self, capacity: int) -> None:
+        """Reallocate every column with the given capacity, keeping the filled rows."""
+        for name, dtype in self._dtypes.items():
+            column = self._allocate(dtype, capacity)
+            column[:self._size] = self._columns[name][:self._size]
+            self._columns[name] = column
+        self._capacity = capacity
+
+    def append(self, **values: Any) -> None:
+        """Write one event; unknown column names raise KeyError."""
+        if self._size == self._capacity:
+            self._grow()
+        row = self._size
+        columns = self._columns
+        for name, value in values.items():
+            columns[name][row] = value
+        self._size = row + 1
+
+    def __len__(self) -> int:
+        return self._size
+
+    def column(self, name: str) -> np.ndarray:
+        """Return a view of the filled part of a column."""
+        return self._columns[name][:self._size]
+
+    def to_frame(self) -> pd.DataFrame:
+        """Build a DataFrame over the recorded events, mapping labelled codes to strings."""
+        data = {}
+        for name in self._dtypes:
+            column = self.column(name)
+            if name in self._labels:
+                column = pd.Series(column).map(self._labels[name])
+            data[name] = column
+        return pd.DataFrame(data)
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Return the events as a list of dicts, e.g. for JSON export."""
+        return self.to_frame().to_dict('records')
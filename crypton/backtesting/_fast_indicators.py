@@ -0,0 +1,153 @@
+"""
+Vectorized indicator calculations for the backtesting strategies.
+
+The formulas match backtrader's BollingerBands (population standard
+deviation) and RelativeStrengthIndex (Wilder smoothing seeded with a simple
+average), so a strategy can compute them once over the preloaded feed
+instead of updating indicator lines bar by bar. Rolling windows use
+bottleneck, or a streaming numba kernel without it, and the RSI is a single
+fused numba pass when those optional packages are installed (pip install
+crypton[fast]), with pandas otherwise.
+"""
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+from crypton.backtesting._kernels import HAVE_NUMBA, njit
+
+try:
+    import bottleneck as bn
+except ImportError:
+    bn = None
+
+
+def bollinger_bands(
+    close: np.ndarray,
+    length: int,
+    std: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculate Bollinger Bands over a close price array.
+
+    Args:
+        close: Close prices
+        length: Moving average window
+        std: Number of standard deviations for the bands
+
+    Returns:
+        Tuple of (upper, middle, lower) arrays, NaN during the warmup period
+    """
+    if bn is not None:
+        close = np.asarray(close, dtype=np.float64)
+        middle = bn.move_mean(close, length, min_count=length)
+        deviation = bn.move_std(close, length, min_count=length, ddof=0)
+    elif HAVE_NUMBA:
+        middle, deviation = _rolling_mean_std_fused(np.asarray(close, dtype=np.float64), length)
+    else:
+        rolling = pd.Series(close, dtype=np.float64).rolling(length)
+        middle = rolling.mean().to_numpy()
+        deviation = rolling.std(ddof=0).to_numpy()
+    return middle + std * deviation, middle, middle - std * deviation
+
+
+@njit(cache=True, nogil=True)
+def _rolling_mean_std_fused(close: np.ndarray, length: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Rolling mean and population standard deviation in one pass.
+
+    Keeps a running sum and sum of squares, so each bar costs one add and
+    one subtract instead of a pass over the window. Prices are offset by the
+    first close to keep the sum of squares from cancelling out.
+    """
+    n = len(close)
+    middle = np.full(n, np.nan)
+    deviation = np.full(n, np.nan)
+    if n < length:
+        return middle, deviation
+    shift = close[0]
+    total = 0.0
+    total_sq = 0.0
+    for i in range(n):
+        value = close[i] - shift
+        total += value
+        total_sq += value * value
+        if i >= length:
+            old = close[i - length] - shift
+            total -= old
+            total_sq -= old * old
+        if i >= length - 1:
+            mean = total / length
+            middle[i] = mean + shift
+            deviation[i] = np.sqrt(max(total_sq / length - mean * mean, 0.0))
+    return middle, deviation
+
+
+def wilder_rsi(close: np.ndarray, length: int) -> np.ndarray:
+    """
+    Calculate the Relative Strength Index with Wilder's smoothing.
+
+    Args:
+        close: Close prices
+        length: RSI period
+
+    Returns:
+        RSI array, NaN during the warmup period
+    """
+    close = np.asarray(close, dtype=np.float64)
+    if len(close) <= length:
+        return np.full(close.shape, np.nan)
+    if HAVE_NUMBA:
+        return _wilder_rsi_fused(close, length)
+
+    rsi = np.full(close.shape, np.nan)
+    delta = np.diff(close, prepend=close[0])
+    avg_up = _wilder_smooth(np.maximum(delta, 0.0), length)
+    avg_down = _wilder_smooth(np.maximum(-delta, 0.0), length)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rsi[length:] = 100.0 - 100.0 / (1.0 + avg_up / avg_down)
+    return rsi
+
+
+def _wilder_smooth(values: np.ndarray, length: int) -> np.ndarray:
+    """Smooth price moves with alpha=1/length, seeded by the mean of the first window."""
+    seeded = values[length:].copy()
+    seeded[0] = values[1:length + 1].mean()
+    return pd.Series(seeded).ewm(alpha=1.0 / length, adjust=False).mean().to_numpy()
+
+
+@njit(cache=True, nogil=True)
+def _wilder_rsi_fused(close: np.ndarray, length: int) -> np.ndarray:
+    """
+    Wilder RSI in one pass over the close prices.
+
+    The price move, both smoothed averages and the RSI are updated in the
+    same loop body, instead of materializing the deltas and smoothing gains
+    and losses in separate passes. Requires len(close) > length.
+    """
+    n = len(close)
+    rsi = np.full(n, np.nan)
+    avg_up = 0.0
+    avg_down = 0.0
+    for i in range(1, length + 1):
+        delta = close[i] - close[i - 1]
+        if delta > 0:
+            avg_up += delta
+        else:
+            avg_down -= delta
+    avg_up /= length
+    avg_down /= length
+
+    alpha = 1.0 / length
+    for i in range(length, n):
+        if i > length:
+            delta = close[i] - close[i - 1]
+            avg_up += alpha * (max(delta, 0.0) - avg_up)
+            avg_down += alpha * (max(-delta, 0.0) - avg_down)
+        # Same results as the array division: no losses gives 100, no moves at all NaN
+        if avg_down > 0:
+            rsi[i] = 100.0 - 100.0 / (1.0 + avg_up / avg_down)
+        elif avg_up > 0:
+            rsi[i] = 100.0
+    return rsi
@@ -0,0 +1,125 @@
+"""
+Memoized indicator calculations for parameter sweeps.
+
+Backtests over the same price series with different take-profit or stop-loss
+settings reuse the same Bollinger Bands and RSI. Results are cached in memory
+per process, keyed by a hash of the close prices and the indicator
+parameters. Setting CRYPTON_INDICATOR_CACHE_DIR also keeps them on disk so
+sweeps running in several processes share the work.
+"""
+import hashlib
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+from crypton.backtesting._fast_indicators import bollinger_bands, wilder_rsi
+
+
+class _HashedArray:
+    """Hashable wrapper that identifies an array by a digest of its contents."""
+
+    __slots__ = ('array', 'digest')
+
+    def __init__(self, array: np.ndarray):
+        self.array = np.ascontiguousarray(array, dtype=np.float64)
+        self.digest = hashlib.blake2b(self.array.tobytes(), digest_size=16).hexdigest()
+
+    def __hash__(self) -> int:
+        return hash(self.digest)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _HashedArray) and self.digest == other.digest
+
+
+def _disk_cache_dir() -> Optional[Path]:
+    """Return the on-disk cache directory, or None when disk caching is off."""
+    cache_dir = os.getenv("CRYPTON_INDICATOR_CACHE_DIR")
+    return Path(cache_dir) if cache_dir else None
+
+
+def _load_or_compute(name: str, compute: Callable[[], Tuple[np.ndarray, ...]]) -> Tuple[np.ndarray, ...]:
+    """Read arrays from the disk cache, computing and storing them on a miss."""
+    cache_dir = _disk_cache_dir()
+    path = cache_dir / f"{name}.npz" if cache_dir else None
+
+    if path is not None:
+        try:
+            with np.load(path) as cached:
+                return tuple(cached[key] for key in sorted(cached.files))
+        except (OSError, ValueError):
+            pass
+
+    arrays = compute()
+
+    if path is not None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so concurrent readers never see a partial file
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                np.savez(f, *arrays)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write indicator cache {path}: {e}")
+
+    return arrays
+
+
+def _read_only(arrays: Tuple[np.ndarray, ...]) -> Tuple[np.ndarray, ...]:
+    """Freeze cached arrays so callers can't corrupt them for later runs."""
+    for array in arrays:
+        array.flags.writeable = False
+    return arrays
+
+
+@lru_cache(maxsize=256)
+def _cached_bollinger_bands(close: _HashedArray, length: int, std: float) -> Tuple[np.ndarray, ...]:
+    return _read_only(_load_or_compute(
+        f"bb_{close.digest}_{length}_{std}",
+        lambda: bollinger_bands(close.array, length, std)
+    ))
+
+
+@lru_cache(maxsize=256)
+def _cached_rsi(close: _HashedArray, length: int) -> np.ndarray:
+    return _read_only(_load_or_compute(
+        f"rsi_{close.digest}_{length}",
+        lambda: (wilder_rsi(close.array, length),)
+    ))[0]
+
+
+def cached_bollinger_bands(
+    close: np.ndarray,
+    length: int,
+    std: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Memoized bollinger_bands().
+
+    Args:
+        close: Close prices
+        length: Moving average window
+        std: Number of standard deviations for the bands
+
+    Returns:
+        Tuple of read-only (upper, middle, lower) arrays
+    """
+    return _cached_bollinger_bands(_HashedArray(close), int(length), float(std))
+
+
+def cached_rsi(close: np.ndarray, length: int) -> np.ndarray:
+    """
+    Memoized wilder_rsi().
+
+    Args:
+        close: Close prices
+        length: RSI period
+
+    Returns:
+        Read-only RSI array
+    """
+    return _cached_rsi(_HashedArray(close), int(length))
@@ -0,0 +1,332 @@
+"""
+Numeric decision kernels for the backtesting strategies.
+
+The kernels are compiled with numba when it is installed (pip install
+crypton[fast]) and run as plain Python functions otherwise.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+# Exit actions returned by decide_exit
+EXIT_NONE = 0
+EXIT_TIER1 = 1
+EXIT_TIER2 = 2
+EXIT_TIER3 = 3
+EXIT_STOP_LOSS = 4
+
+
+@njit(cache=True, nogil=True)
+def decide_exit(
+    close: float,
+    entry_price: float,
+    tier1_hit: bool,
+    tier2_hit: bool,
+    tier3_hit: bool,
+    tier1_pct: float,
+    tier2_pct: float,
+    tier3_pct: float,
+    stop_loss_pct: float
+) -> int:
+    """
+    Decide which graduated take-profit tier or stop loss an open position triggers.
+
+    Higher tiers are checked first, so a bar that clears several thresholds
+    sells at the highest tier that hasn't been taken yet.
+
+    Args:
+        close: Current close price
+        entry_price: Average entry price of the position
+        tier1_hit: Whether tier 1 was already taken for this position
+        tier2_hit: Whether tier 2 was already taken for this position
+        tier3_hit: Whether tier 3 was already taken for this position
+        tier1_pct: Tier 1 profit threshold (0.02 = 2%)
+        tier2_pct: Tier 2 profit threshold
+        tier3_pct: Tier 3 profit threshold
+        stop_loss_pct: Stop loss threshold below the entry price
+
+    Returns:
+        One of the EXIT_* action codes
+    """
+    return decide_exit_at(
+        close, tier1_hit, tier2_hit, tier3_hit,
+        entry_price * (1.0 + tier1_pct), entry_price * (1.0 + tier2_pct),
+        entry_price * (1.0 + tier3_pct), entry_price * (1.0 - stop_loss_pct)
+    )
+
+
+@njit(cache=True, nogil=True)
+def decide_exit_at(
+    close: float,
+    tier1_hit: bool,
+    tier2_hit: bool,
+    tier3_hit: bool,
+    tier1_px: float,
+    tier2_px: float,
+    tier3_px: float,
+    stop_px: float
+) -> int:
+    """
+    Like decide_exit(), against threshold prices computed once per position.
+
+    Args:
+        close: Current close price
+        tier1_hit: Whether tier 1 was already taken for this position
+        tier2_hit: Whether tier 2 was already taken for this position
+        tier3_hit: Whether tier 3 was already taken for this position
+        tier1_px: Tier 1 take-profit price
+        tier2_px: Tier 2 take-profit price
+        tier3_px: Tier 3 take-profit price
+        stop_px: Stop loss price; closes strictly below it trigger
+
+    Returns:
+        One of the EXIT_* action codes
+    """
+    if not tier3_hit and close >= tier3_px:
+        return EXIT_TIER3
+    if not tier2_hit and close >= tier2_px:
+        return EXIT_TIER2
+    if not tier1_hit and close >= tier1_px:
+        return EXIT_TIER1
+    if close < stop_px:
+        return EXIT_STOP_LOSS
+    return EXIT_NONE
+
+
+@njit(cache=True, nogil=True)
+def simulate_trades(
+    open_: np.ndarray,
+    close: np.ndarray,
+    entry_signal: np.ndarray,
+    bar_ns: np.ndarray,
+    position_size_pct: float,
+    stop_loss_pct: float,
+    tier1_pct: float,
+    tier2_pct: float,
+    tier3_pct: float,
+    tier1_size_pct: float,
+    tier2_size_pct: float,
+    tier3_size_pct: float,
+    cool_down_ns: int,
+    initial_cash: float,
+    commission: float
+):
+    """
+    Run the MeanReversionBT entry/exit state machine bar by bar.
+
+    Orders placed on a bar fill at the next bar's open with a percentage
+    commission; buys the cash can't cover are rejected. Every output array
+    is allocated with one slot per bar and only the leading counts are used.
+
+    Args:
+        open_: Open prices
+        close: Close prices
+        entry_signal: Boolean array, True on bars where the entry conditions hold
+        bar_ns: Bar times as POSIX nanoseconds, used for the cool-down
+        position_size_pct: Share of cash spent per entry
+        stop_loss_pct: Stop loss threshold below the entry price
+        tier1_pct: Tier 1 profit threshold
+        tier2_pct: Tier 2 profit threshold
+        tier3_pct: Tier 3 profit threshold
+        tier1_size_pct: Share of the original position sold at tier 1
+        tier2_size_pct: Share of the original position sold at tier 2
+        tier3_size_pct: Share of the original position sold at tier 3
+        cool_down_ns: Cool-down after entries, tier 1 exits and stop losses
+        initial_cash: Initial account balance
+        commission: Commission rate on traded value
+
+    Returns:
+        Tuple of (signal_bar, action, size, fill_bar, fill_price, fill_comm,
+        trade_id, n_orders, trade_pnl, trade_open_value, n_closed, trades_opened)
+    """
+    n = len(close)
+    signal_bar = np.empty(n, dtype=np.int64)
+    action = np.empty(n, dtype=np.int8)
+    size = np.empty(n, dtype=np.float64)
+    fill_bar = np.full(n, -1, dtype=np.int64)
+    fill_price = np.full(n, np.nan)
+    fill_comm = np.full(n, np.nan)
+    trade_id = np.empty(n, dtype=np.int64)
+    trade_pnl = np.empty(n, dtype=np.float64)
+    trade_open_value = np.empty(n, dtype=np.float64)
+
+    cash = initial_cash
+    position = 0.0
+    entry_price = 0.0
+    tier1_px = tier2_px = tier3_px = stop_px = 0.0
+    tier1_size = tier2_size = tier3_size = 0.0
+    tier1_hit = tier2_hit = tier3_hit = False
+    trade_gross = 0.0
+    trade_comm = 0.0
+    trades_opened = 0
+    n_orders = 0
+    n_closed = 0
+    in_cool_down = False
+    cool_down_end = 0
+
+    for i in range(n):
+        # Fill the order placed on the previous bar at this bar's open
+        if n_orders > 0 and signal_bar[n_orders - 1] == i - 1:
+            k = n_orders - 1
+            price = open_[i]
+            value = size[k] * price
+            comm = value * commission
+            if action[k] == EXIT_NONE:
+                if value + comm <= cash:
+                    cash -= value + comm
+                    position = size[k]
+                    tier1_px = price * (1.0 + tier1_pct)
+                    tier2_px = price * (1.0 + tier2_pct)
+                    tier3_px = price * (1.0 + tier3_pct)
+                    stop_px = price * (1.0 - stop_loss_pct)
+                    tier1_size = size[k] * tier1_size_pct
+                    tier2_size = size[k] * tier2_size_pct
+                    tier3_size = size[k] * tier3_size_pct
+                    entry_price = price
+                    tier1_hit = tier2_hit = tier3_hit = False
+                    trade_gross = 0.0
+                    trade_comm = comm
+                    trade_open_value[trades_opened] = value
+                    trades_opened += 1
+                    fill_bar[k] = i
+                    fill_price[k] = price
+                    fill_comm[k] = comm
+            else:
+                cash += value - comm
+                position -= size[k]
+                trade_gross += size[k] * (price - entry_price)
+                trade_comm += comm
+                fill_bar[k] = i
+                fill_price[k] = price
+                fill_comm[k] = comm
+                if position == 0:
+                    trade_pnl[n_closed] = trade_gross - trade_comm
+                    n_closed += 1
+
+        if in_cool_down and bar_ns[i] < cool_down_end:
+            continue
+
+        if position == 0:
+            if not entry_signal[i]:
+                continue
+            order_action = EXIT_NONE
+            order_size = cash * position_size_pct / close[i]
+            in_cool_down = True
+            cool_down_end = bar_ns[i] + cool_down_ns
+            order_trade = trades_opened
+        else:
+            order_action = decide_exit_at(
+                close[i], tier1_hit, tier2_hit, tier3_hit,
+                tier1_px, tier2_px, tier3_px, stop_px
+            )
+            if order_action == EXIT_NONE:
+                continue
+            if order_action == EXIT_STOP_LOSS:
+                order_size = position
+            else:
+                if order_action == EXIT_TIER1:
+                    order_size = tier1_size
+                    tier1_hit = True
+                elif order_action == EXIT_TIER2:
+                    order_size = tier2_size
+                    tier2_hit = True
+                else:
+                    order_size = tier3_size
+                    tier3_hit = True
+                order_size = min(order_size, position)
+            if order_action == EXIT_TIER1 or order_action == EXIT_STOP_LOSS:
+                in_cool_down = True
+                cool_down_end = bar_ns[i] + cool_down_ns
+            order_trade = trades_opened - 1
+
+        signal_bar[n_orders] = i
+        action[n_orders] = order_action
+        size[n_orders] = order_size
+        trade_id[n_orders] = order_trade
+        n_orders += 1
+
+    return (
+        signal_bar, action, size, fill_bar, fill_price, fill_comm, trade_id, n_orders,
+        trade_pnl, trade_open_value, n_closed, trades_opened
+    )
+
+
+@njit(cache=True, nogil=True, parallel=True)
+def sweep_exit_levels(
+    open_: np.ndarray,
+    close: np.ndarray,
+    entry_signal: np.ndarray,
+    bar_ns: np.ndarray,
+    position_size_pct: float,
+    stop_loss_pcts: np.ndarray,
+    tier1_pcts: np.ndarray,
+    tier2_pcts: np.ndarray,
+    tier3_pcts: np.ndarray,
+    tier1_size_pct: float,
+    tier2_size_pct: float,
+    tier3_size_pct: float,
+    cool_down_ns: int,
+    initial_cash: float,
+    commission: float
+) -> np.ndarray:
+    """
+    Run simulate_trades() for every point of a take-profit / stop-loss grid.
+
+    Grid points are independent, so under numba they run on separate
+    threads with prange. The grid is passed flattened: point g uses
+    stop_loss_pcts[g], tier1_pcts[g], tier2_pcts[g] and tier3_pcts[g].
+
+    Args:
+        open_: Open prices
+        close: Close prices
+        entry_signal: Boolean array, True on bars where the entry conditions hold
+        bar_ns: Bar times as POSIX nanoseconds, used for the cool-down
+        position_size_pct: Share of cash spent per entry
+        stop_loss_pcts: Stop loss threshold of each grid point
+        tier1_pcts: Tier 1 profit threshold of each grid point
+        tier2_pcts: Tier 2 profit threshold of each grid point
+        tier3_pcts: Tier 3 profit threshold of each grid point
+        tier1_size_pct: Share of the original position sold at tier 1
+        tier2_size_pct: Share of the original position sold at tier 2
+        tier3_size_pct: Share of the original position sold at tier 3
+        cool_down_ns: Cool-down after entries, tier 1 exits and stop losses
+        initial_cash: Initial account balance
+        commission: Commission rate on traded value
+
+    Returns:
+        Final account value of each grid point, open positions valued at the last close
+    """
+    n_points = len(stop_loss_pcts)
+    final_values = np.empty(n_points, dtype=np.float64)
+    for g in prange(n_points):
+        (signal_bar, action, size, fill_bar, fill_price, fill_comm, trade_id, n_orders,
+         trade_pnl, trade_open_value, n_closed, trades_opened) = simulate_trades(
+            open_, close, entry_signal, bar_ns, position_size_pct, stop_loss_pcts[g],
+            tier1_pcts[g], tier2_pcts[g], tier3_pcts[g],
+            tier1_size_pct, tier2_size_pct, tier3_size_pct,
+            cool_down_ns, initial_cash, commission
+        )
+        cash = initial_cash
+        position = 0.0
+        for k in range(n_orders):
+            if fill_bar[k] < 0:
+                continue
+            if action[k] == EXIT_NONE:
+                cash -= size[k] * fill_price[k] + fill_comm[k]
+                position += size[k]
+            else:
+                cash += size[k] * fill_price[k] - fill_comm[k]
+                position -= size[k]
+        final_values[g] = cash + position * close[len(close) - 1] if len(close) else cash
+    return final_values
@@ -0,0 +1,177 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Cython build of the simulate_trades() kernel in _kernels.py.
+
+Used by the array simulation when numba is not installed. It is compiled by
+setup.py when Cython is available at build time; the build is optional, so
+installs without Cython or a C compiler fall back to the Python simulation.
+"""
+import numpy as np
+
+cimport numpy as cnp
+
+from crypton.backtesting._kernels import (
+    EXIT_NONE,
+    EXIT_STOP_LOSS,
+    EXIT_TIER1,
+    EXIT_TIER2,
+    EXIT_TIER3,
+)
+
+cnp.import_array()
+
+cdef signed char _NONE = EXIT_NONE
+cdef signed char _TIER1 = EXIT_TIER1
+cdef signed char _TIER2 = EXIT_TIER2
+cdef signed char _TIER3 = EXIT_TIER3
+cdef signed char _STOP_LOSS = EXIT_STOP_LOSS
+
+
+def simulate_trades(
+    const double[::1] open_,
+    const double[::1] close,
+    const unsigned char[::1] entry_signal,
+    const cnp.int64_t[::1] bar_ns,
+    double position_size_pct,
+    double stop_loss_pct,
+    double tier1_pct,
+    double tier2_pct,
+    double tier3_pct,
+    double tier1_size_pct,
+    double tier2_size_pct,
+    double tier3_size_pct,
+    cnp.int64_t cool_down_ns,
+    double initial_cash,
+    double commission
+):
+    """
+    Run the MeanReversionBT entry/exit state machine bar by bar.
+
+    Same arguments and return value as _kernels.simulate_trades(), except
+    that entry_signal is passed as a uint8 view of the boolean array.
+    """
+    cdef Py_ssize_t n = close.shape[0]
+    signal_bar_arr = np.empty(n, dtype=np.int64)
+    action_arr = np.empty(n, dtype=np.int8)
+    size_arr = np.empty(n, dtype=np.float64)
+    fill_bar_arr = np.full(n, -1, dtype=np.int64)
+    fill_price_arr = np.full(n, np.nan)
+    fill_comm_arr = np.full(n, np.nan)
+    trade_id_arr = np.empty(n, dtype=np.int64)
+    trade_pnl_arr = np.empty(n, dtype=np.float64)
+    trade_open_value_arr = np.empty(n, dtype=np.float64)
+
+    cdef cnp.int64_t[::1] signal_bar = signal_bar_arr
+    cdef signed char[::1] action = action_arr
+    cdef double[::1] size = size_arr
+    cdef cnp.int64_t[::1] fill_bar = fill_bar_arr
+    cdef double[::1] fill_price = fill_price_arr
+    cdef double[::1] fill_comm = fill_comm_arr
+    cdef cnp.int64_t[::1] trade_id = trade_id_arr
+    cdef double[::1] trade_pnl = trade_pnl_arr
+    cdef double[::1] trade_open_value = trade_open_value_arr
+
+    cdef double cash = initial_cash
+    cdef double position = 0.0
+    cdef double entry_price = 0.0
+    cdef double tier1_px = 0.0, tier2_px = 0.0, tier3_px = 0.0, stop_px = 0.0
+    cdef double tier1_size = 0.0, tier2_size = 0.0, tier3_size = 0.0
+    cdef bint tier1_hit = False, tier2_hit = False, tier3_hit = False
+    cdef double trade_gross = 0.0
+    cdef double trade_comm = 0.0
+    cdef Py_ssize_t trades_opened = 0
+    cdef Py_ssize_t n_orders = 0
+    cdef Py_ssize_t n_closed = 0
+    cdef bint in_cool_down = False
+    cdef cnp.int64_t cool_down_end = 0
+    cdef Py_ssize_t i, k, order_trade
+    cdef double price, value, comm, order_size, c
+    cdef signed char order_action
+
+    for i in range(n):
+        # Fill the order placed on the previous bar at this bar's open
+        if n_orders > 0 and signal_bar[n_orders - 1] == i - 1:
+            k = n_orders - 1
+            price = open_[i]
+            value = size[k] * price
+            comm = value * commission
+            if action[k] == _NONE:
+                if value + comm <= cash:
+                    cash -= value + comm
+                    position = size[k]
+                    tier1_px = price * (1.0 + tier1_pct)
+                    tier2_px = price * (1.0 + tier2_pct)
+                    tier3_px = price * (1.0 + tier3_pct)
+                    stop_px = price * (1.0 - stop_loss_pct)
+                    tier1_size = size[k] * tier1_size_pct
+                    tier2_size = size[k] * tier2_size_pct
+                    tier3_size = size[k] * tier3_size_pct
+                    entry_price = price
+                    tier1_hit = tier2_hit = tier3_hit = False
+                    trade_gross = 0.0
+                    trade_comm = comm
+                    trade_open_value[trades_opened] = value
+                    trades_opened += 1
+                    fill_bar[k] = i
+                    fill_price[k] = price
+                    fill_comm[k] = comm
+            else:
+                cash += value - comm
+                position -= size[k]
+                trade_gross += size[k] * (price - entry_price)
+                trade_comm += comm
+                fill_bar[k] = i
+                fill_price[k] = price
+                fill_comm[k] = comm
+                if position == 0:
+                    trade_pnl[n_closed] = trade_gross - trade_comm
+                    n_closed += 1
+
+        if in_cool_down and bar_ns[i] < cool_down_end:
+            continue
+
+        if position == 0:
+            if not entry_signal[i]:
+                continue
+            order_action = _NONE
+            order_size = cash * position_size_pct / close[i]
+            in_cool_down = True
+            cool_down_end = bar_ns[i] + cool_down_ns
+            order_trade = trades_opened
+        else:
+            # Same order as decide_exit_at(): highest untaken tier first, then the stop loss
+            c = close[i]
+            if not tier3_hit and c >= tier3_px:
+                order_action = _TIER3
+                order_size = tier3_size
+                tier3_hit = True
+            elif not tier2_hit and c >= tier2_px:
+                order_action = _TIER2
+                order_size = tier2_size
+                tier2_hit = True
+            elif not tier1_hit and c >= tier1_px:
+                order_action = _TIER1
+                order_size = tier1_size
+                tier1_hit = True
+            elif c < stop_px:
+                order_action = _STOP_LOSS
+                order_size = position
+            else:
+                continue
+            if order_size > position:
+                order_size = position
+            if order_action == _TIER1 or order_action == _STOP_LOSS:
+                in_cool_down = True
+                cool_down_end = bar_ns[i] + cool_down_ns
+            order_trade = trades_opened - 1
+
+        signal_bar[n_orders] = i
+        action[n_orders] = order_action
+        size[n_orders] = order_size
+        trade_id[n_orders] = order_trade
+        n_orders += 1
+
+    return (
+        signal_bar_arr, action_arr, size_arr, fill_bar_arr, fill_price_arr, fill_comm_arr, trade_id_arr, n_orders,
+        trade_pnl_arr, trade_open_value_arr, n_closed, trades_opened
+    )
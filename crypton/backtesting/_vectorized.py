@@ -0,0 +1,361 @@
+"""
+Array-based simulation of the MeanReversionBT rules for single-symbol runs.
+
+Cerebro calls MeanReversionBT.next() once per bar, although the strategy only
+acts on the few bars where an entry condition, a take-profit tier or the stop
+loss triggers. The simulator jumps straight to those bars: entries are found
+with a binary search over the precomputed entry bars and exits with a
+first-touch search of the close prices against the thresholds of the open
+position. With numba installed, the compiled per-bar kernel in _kernels.py is
+used instead, or its Cython build in _kernels_cy.pyx when that was compiled.
+Orders follow backtrader's defaults for market orders: they fill at the next
+bar's open and pay a percentage commission on the traded value.
+"""
+from dataclasses import dataclass
+from typing import Dict, List
+
+import numpy as np
+
+from crypton.backtesting._kernels import (
+    EXIT_NONE,
+    EXIT_STOP_LOSS,
+    EXIT_TIER1,
+    EXIT_TIER2,
+    EXIT_TIER3,
+    HAVE_NUMBA,
+    decide_exit_at,
+    simulate_trades,
+)
+
+try:
+    from crypton.backtesting._kernels_cy import simulate_trades as _simulate_trades_cy
+except ImportError:
+    _simulate_trades_cy = None
+
+# Action code of an entry signal; exits use the EXIT_* codes, which never include EXIT_NONE
+ACTION_BUY = EXIT_NONE
+
+# Bars scanned per step of the first-touch exit search, doubled up to the maximum
+_SCAN_BLOCK = 256
+_MAX_SCAN_BLOCK = 65536
+
+
+@dataclass(slots=True)
+class SimulationParams:
+    """MeanReversionBT parameters used by the simulation."""
+    position_size_pct: float
+    stop_loss_pct: float
+    take_profit_tier1_pct: float
+    take_profit_tier2_pct: float
+    take_profit_tier3_pct: float
+    take_profit_tier1_size_pct: float
+    take_profit_tier2_size_pct: float
+    take_profit_tier3_size_pct: float
+    cool_down_ns: int
+
+
+@dataclass(slots=True)
+class SimulationResult:
+    """
+    Orders and account history of a simulated backtest.
+
+    Order arrays have one entry per signal; fill_bar is -1 for orders that
+    were never filled (placed on the last bar, or rejected for lack of cash).
+    Closed-trade arrays have one entry per round trip that went back to flat.
+    """
+    signal_bar: np.ndarray
+    action: np.ndarray
+    size: np.ndarray
+    fill_bar: np.ndarray
+    fill_price: np.ndarray
+    commission: np.ndarray
+    trade_id: np.ndarray
+    equity: np.ndarray
+    trade_pnl: np.ndarray
+    trade_open_value: np.ndarray
+    trades_opened: int
+    final_value: float
+
+
+def _first_exit_bar(close: np.ndarray, start: int, take_profit_px: float, stop_px: float) -> int:
+    """Return the first bar from start whose close reaches take_profit_px or drops below stop_px, or -1."""
+    block = _SCAN_BLOCK
+    n = len(close)
+    while start < n:
+        window = close[start:start + block]
+        hit = (window >= take_profit_px) | (window < stop_px)
+        if hit.any():
+            return start + int(hit.argmax())
+        start += block
+        block = min(block * 2, _MAX_SCAN_BLOCK)
+    return -1
+
+
+def simulate_mean_reversion(
+    open_: np.ndarray,
+    close: np.ndarray,
+    entry_signal: np.ndarray,
+    bar_ns: np.ndarray,
+    params: SimulationParams,
+    initial_cash: float,
+    commission: float
+) -> SimulationResult:
+    """
+    Simulate MeanReversionBT's entries, take-profit tiers and stop loss.
+
+    With numba installed, or the Cython kernel built, the compiled
+    simulate_trades() walks every bar; otherwise the simulation jumps
+    between signal bars in Python.
+
+    Args:
+        open_: Open prices
+        close: Close prices
+        entry_signal: Boolean array, True on bars where the entry conditions hold
+        bar_ns: Bar times as POSIX nanoseconds, used for the cool-down
+        params: Strategy parameters
+        initial_cash: Initial account balance
+        commission: Commission rate on traded value
+
+    Returns:
+        SimulationResult with the orders, equity curve and closed trades
+    """
+    open_ = np.ascontiguousarray(open_, dtype=np.float64)
+    close = np.ascontiguousarray(close, dtype=np.float64)
+    entry_signal = np.ascontiguousarray(entry_signal, dtype=np.bool_)
+    bar_ns = np.ascontiguousarray(bar_ns, dtype=np.int64)
+    if HAVE_NUMBA:
+        simulated = _simulate_compiled(
+            simulate_trades, open_, close, entry_signal, bar_ns, params, float(initial_cash), float(commission)
+        )
+    elif _simulate_trades_cy is not None:
+        simulated = _simulate_compiled(
+            _simulate_trades_cy, open_, close, entry_signal.view(np.uint8), bar_ns, params,
+            float(initial_cash), float(commission)
+        )
+    else:
+        simulated = _simulate_event_jumps(
+            open_, close, entry_signal, bar_ns, params, float(initial_cash), float(commission)
+        )
+    orders, trade_pnl, trade_open_value, trades_opened = simulated
+    signal_bar, action, size, fill_bar, fill_price, fill_comm, trade_id = orders
+
+    # Rebuild the per-bar cash and position from the fills, valued at each close
+    n = len(close)
+    done = fill_bar >= 0
+    traded = size[done] * np.where(action[done] == ACTION_BUY, 1.0, -1.0)
+    cash_delta = np.zeros(n)
+    position_delta = np.zeros(n)
+    np.add.at(cash_delta, fill_bar[done], -traded * fill_price[done] - fill_comm[done])
+    np.add.at(position_delta, fill_bar[done], traded)
+    equity = initial_cash + np.cumsum(cash_delta) + np.cumsum(position_delta) * close
+
+    return SimulationResult(
+        signal_bar=signal_bar,
+        action=action,
+        size=size,
+        fill_bar=fill_bar,
+        fill_price=fill_price,
+        commission=fill_comm,
+        trade_id=trade_id,
+        equity=equity,
+        trade_pnl=trade_pnl,
+        trade_open_value=trade_open_value[:len(trade_pnl)],
+        trades_opened=trades_opened,
+        final_value=float(equity[-1]) if n else float(initial_cash)
+    )
+
+
+def _simulate_compiled(kernel, open_, close, entry_signal, bar_ns, params, initial_cash, commission):
+    """Run a simulate_trades() kernel and trim its per-bar output arrays."""
+    (signal_bar, action, size, fill_bar, fill_price, fill_comm, trade_id, n_orders,
+     trade_pnl, trade_open_value, n_closed, trades_opened) = kernel(
+        open_, close, entry_signal, bar_ns,
+        params.position_size_pct, params.stop_loss_pct,
+        params.take_profit_tier1_pct, params.take_profit_tier2_pct, params.take_profit_tier3_pct,
+        params.take_profit_tier1_size_pct, params.take_profit_tier2_size_pct, params.take_profit_tier3_size_pct,
+        params.cool_down_ns, initial_cash, commission
+    )
+    orders = tuple(column[:n_orders] for column in (signal_bar, action, size, fill_bar, fill_price, fill_comm, trade_id))
+    return orders, trade_pnl[:n_closed], trade_open_value[:trades_opened], int(trades_opened)
+
+
+def _simulate_event_jumps(open_, close, entry_signal, bar_ns, params, initial_cash, commission):
+    """Simulate in Python, visiting only the bars where an order is placed."""
+    n = len(close)
+    entry_bars = np.flatnonzero(entry_signal)
+    tier_pcts = (params.take_profit_tier1_pct, params.take_profit_tier2_pct, params.take_profit_tier3_pct)
+    tier_size_pcts = (
+        params.take_profit_tier1_size_pct,
+        params.take_profit_tier2_size_pct,
+        params.take_profit_tier3_size_pct,
+    )
+
+    signal_bar: List[int] = []
+    action: List[int] = []
+    size: List[float] = []
+    fill_bar: List[int] = []
+    fill_price: List[float] = []
+    fill_comm: List[float] = []
+    trade_id: List[int] = []
+    trade_pnl: List[float] = []
+    trade_open_value: List[float] = []
+
+    cash = float(initial_cash)
+    position = 0.0
+    entry_price = 0.0
+    tier_pxs = tier_sizes = ()
+    stop_px = 0.0
+    tiers_hit = [False, False, False]
+    trade_gross = trade_comm = 0.0
+    trades_opened = 0
+    cool_down_end_ns = None
+    bar = 0
+
+    while bar < n:
+        # Bars inside the cool-down are skipped entirely, exits included
+        if cool_down_end_ns is not None:
+            bar = max(bar, int(np.searchsorted(bar_ns, cool_down_end_ns, side='left')))
+
+        if position == 0:
+            k = int(np.searchsorted(entry_bars, bar))
+            if k == len(entry_bars):
+                break
+            bar = int(entry_bars[k])
+            order_action = ACTION_BUY
+            order_size = cash * params.position_size_pct / close[bar]
+            cool_down_end_ns = bar_ns[bar] + params.cool_down_ns
+        else:
+            # Any tier that hasn't been taken can trigger, so the lowest of them bounds the search
+            take_profit_px = min((px for px, hit in zip(tier_pxs, tiers_hit) if not hit), default=np.inf)
+            bar = _first_exit_bar(close, bar, take_profit_px, stop_px)
+            if bar < 0:
+                break
+            order_action = decide_exit_at(close[bar], *tiers_hit, *tier_pxs, stop_px)
+            if order_action == EXIT_STOP_LOSS:
+                order_size = position
+            else:
+                order_size = min(tier_sizes[order_action - EXIT_TIER1], position)
+                tiers_hit[order_action - EXIT_TIER1] = True
+            if order_action in (EXIT_TIER1, EXIT_STOP_LOSS):
+                cool_down_end_ns = bar_ns[bar] + params.cool_down_ns
+
+        signal_bar.append(bar)
+        action.append(order_action)
+        size.append(order_size)
+        trade_id.append(trades_opened if order_action == ACTION_BUY else trades_opened - 1)
+
+        # Market orders fill at the next bar's open
+        filled = bar + 1 < n
+        if filled:
+            price = float(open_[bar + 1])
+            value = order_size * price
+            comm = value * commission
+            if order_action == ACTION_BUY:
+                # backtrader rejects a buy the cash can't cover
+                filled = value + comm <= cash
+                if filled:
+                    cash -= value + comm
+                    position = order_size
+                    entry_price = price
+                    # Thresholds and tier sizes stay fixed for the life of the position
+                    tier_pxs = tuple(price * (1.0 + pct) for pct in tier_pcts)
+                    tier_sizes = tuple(order_size * pct for pct in tier_size_pcts)
+                    stop_px = price * (1.0 - params.stop_loss_pct)
+                    tiers_hit = [False, False, False]
+                    trade_gross, trade_comm = 0.0, comm
+                    trade_open_value.append(value)
+                    trades_opened += 1
+            else:
+                cash += value - comm
+                position -= order_size
+                trade_gross += order_size * (price - entry_price)
+                trade_comm += comm
+                if position == 0:
+                    trade_pnl.append(trade_gross - trade_comm)
+
+        fill_bar.append(bar + 1 if filled else -1)
+        fill_price.append(price if filled else np.nan)
+        fill_comm.append(comm if filled else np.nan)
+        bar += 1
+
+    orders = (
+        np.asarray(signal_bar, dtype=np.int64),
+        np.asarray(action, dtype=np.int8),
+        np.asarray(size, dtype=np.float64),
+        np.asarray(fill_bar, dtype=np.int64),
+        np.asarray(fill_price, dtype=np.float64),
+        np.asarray(fill_comm, dtype=np.float64),
+        np.asarray(trade_id, dtype=np.int64),
+    )
+    return (
+        orders,
+        np.asarray(trade_pnl, dtype=np.float64),
+        np.asarray(trade_open_value, dtype=np.float64),
+        trades_opened
+    )
+
+
+def closed_trades(result: SimulationResult) -> Dict[str, np.ndarray]:
+    """
+    Summarize the round trips of a simulation that went back to flat.
+
+    Args:
+        result: Simulation result
+
+    Returns:
+        Dictionary of per-trade arrays: entry_bar and exit_bar (fill bars of
+        the buy and of the final sell), exit_reason (EXIT_* code of the final
+        sell) and pnl_pct (net P&L relative to the opening value)
+    """
+    n_closed = len(result.trade_pnl)
+    filled = result.fill_bar >= 0
+    buys = filled & (result.action == ACTION_BUY)
+    sells = filled & (result.action != ACTION_BUY)
+
+    # Positions never overlap, so each trade's sells are contiguous and its last one closes it
+    sell_trade = result.trade_id[sells]
+    last_sell = np.append(sell_trade[1:] != sell_trade[:-1], True) if len(sell_trade) else sell_trade.astype(bool)
+    closing = last_sell & (sell_trade < n_closed)
+
+    return {
+        'entry_bar': result.fill_bar[buys][:n_closed],
+        'exit_bar': result.fill_bar[sells][closing],
+        'exit_reason': result.action[sells][closing],
+        'pnl_pct': result.trade_pnl / result.trade_open_value * 100,
+    }
+
+
+_ACTION_LABELS = {
+    ACTION_BUY: 'BUY',
+    EXIT_TIER1: 'TAKE PROFIT TIER 1',
+    EXIT_TIER2: 'TAKE PROFIT TIER 2',
+    EXIT_TIER3: 'TAKE PROFIT TIER 3 (FINAL)',
+    EXIT_STOP_LOSS: 'STOP LOSS',
+}
+
+
+def simulation_event_lines(result: SimulationResult, times: np.ndarray, close: np.ndarray) -> List[str]:
+    """
+    Format the simulated orders like MeanReversionBT's trade event log.
+
+    Args:
+        result: Simulation result
+        times: Bar times as datetime64 values
+        close: Close prices
+
+    Returns:
+        List of event log lines
+    """
+    iso_times = np.datetime_as_string(times, unit='s')
+    lines = []
+    for bar, action, size, fill_bar, price, comm in zip(
+        result.signal_bar, result.action, result.size, result.fill_bar, result.fill_price, result.commission
+    ):
+        lines.append(f"{iso_times[bar]} {_ACTION_LABELS[action]}, Price: {close[bar]:.2f}, Size: {size:.6f}")
+        if fill_bar >= 0:
+            side = 'BUY' if action == ACTION_BUY else 'SELL'
+            lines.append(
+                f"{iso_times[fill_bar]} {side} EXECUTED, Price: {price:.2f}, Size: {size:.6f}, "
+                f"Value: ${price * size:.2f}, Comm: ${comm:.2f}"
+            )
+    return lines
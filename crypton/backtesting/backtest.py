@@ -7,27 +7,487 @@ backtesting capabilities for trading strategies.
 This module integrates with backtrader to provide comprehensive
 backtesting capabilities for trading strategies.
 """
+import atexit
+import csv
+import itertools
 import json
 import os
+import threading
+import weakref
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass, fields
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union, Any
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
 
 # Helper za JSON serijalizaciju datetime objekata
 class DateTimeEncoder(json.JSONEncoder):
     def default(self, obj):
         if isinstance(obj, datetime):
             return obj.strftime('%Y-%m-%d %H:%M:%S')
+        # NumPy values, as orjson's OPT_SERIALIZE_NUMPY writes them
+        if isinstance(obj, np.datetime64):
+            return np.datetime_as_string(obj, unit='s')
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+        if isinstance(obj, np.generic):
+            return obj.item()
         return super().default(obj)
 
 import backtrader as bt
 import pandas as pd
 from loguru import logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from crypton.backtesting._buffers import SignalBuffer
+from crypton.backtesting._indicator_cache import cached_bollinger_bands, cached_rsi
+from crypton.backtesting._vectorized import (
+    ACTION_BUY,
+    SimulationParams,
+    SimulationResult,
+    closed_trades,
+    simulate_mean_reversion,
+    simulation_event_lines,
+)
+from crypton.backtesting._kernels import (
+    EXIT_NONE,
+    EXIT_STOP_LOSS,
+    EXIT_TIER1,
+    EXIT_TIER2,
+    EXIT_TIER3,
+    HAVE_NUMBA,
+    decide_exit_at,
+    sweep_exit_levels,
+)
 from crypton.strategy.mean_reversion import MeanReversionStrategy, SignalType
-from crypton.utils.config import load_config
-import json
-import csv
+from crypton.utils.config import load_config, parse_cool_down
+
+# Take profit settings and their defaults, as keys of the risk.take_profit config section
+_TAKE_PROFIT_DEFAULTS = {
+    'tier1_pct': 0.02,
+    'tier2_pct': 0.03,
+    'tier3_pct': 0.04,
+    'tier1_size_pct': 0.33,
+    'tier2_size_pct': 0.33,
+    'tier3_size_pct': 0.34
+}
+# Options for every Cerebro: the strategies read whole preloaded lines in
+# start(), and no run is plotted, so the default observers are skipped
+_CEREBRO_OPTIONS = {'preload': True, 'runonce': True, 'stdstats': False}
+# Analyzers read by _calculate_metrics(), as (class, keyword arguments)
+_ANALYZERS = (
+    (bt.analyzers.SharpeRatio, {'_name': 'sharpe', 'riskfreerate': 0.0}),
+    (bt.analyzers.Returns, {'_name': 'returns'}),
+    (bt.analyzers.DrawDown, {'_name': 'drawdown'}),
+    (bt.analyzers.TradeAnalyzer, {'_name': 'trades'})
+)
+
+# Queued summary rows that trigger a write to the summary CSV
+_CSV_FLUSH_ROWS = 100
+
+# Deferred console log events that trigger a write through the logger
+_LOG_FLUSH_EVENTS = 1000
+
+# Expected bars per signal, used to size the signal buffers from the feed length
+_BARS_PER_SIGNAL = 50
+
+# Column layouts of the signal buffers, indicator snapshots don't need float64
+BUY_SIGNAL_COLUMNS = {
+    'time': 'datetime64[s]',
+    'price': 'float64',
+    'size': 'float64',
+    'bb_upper': 'float32',
+    'bb_middle': 'float32',
+    'bb_lower': 'float32',
+    'rsi': 'float32'
+}
+SELL_SIGNAL_COLUMNS = {
+    'time': 'datetime64[s]',
+    'price': 'float64',
+    'reason': 'int8',
+    'profit_pct': 'float64',
+    'loss_pct': 'float64',
+    'position_pct': 'float32',
+    'size': 'float64',
+    'bb_upper': 'float32',
+    'bb_middle': 'float32',
+    'bb_lower': 'float32',
+    'rsi': 'float32'
+}
+# MultiAssetMeanReversionBT adds the feed index, labelled with the symbol by to_frame()
+MULTI_BUY_SIGNAL_COLUMNS = {**BUY_SIGNAL_COLUMNS, 'symbol': 'int16'}
+MULTI_SELL_SIGNAL_COLUMNS = {**SELL_SIGNAL_COLUMNS, 'symbol': 'int16'}
+# Entry condition bits packed per bar by MeanReversionBT.start()
+COND_BELOW_BB = 0b01
+COND_RSI_OVERSOLD = 0b10
+ENTRY_CONDITIONS = COND_BELOW_BB | COND_RSI_OVERSOLD
+
+# backtrader stores bar times as float days, with 1970-01-01 at day 719163
+_BT_EPOCH_DAYS = 719163.0
+_MS_PER_DAY = 86_400 * 1000
+# Cool-down end before any trade, so the first bar is never skipped
+_NO_COOL_DOWN = np.iinfo(np.int64).min
+
+EXIT_REASONS = {
+    EXIT_TIER1: 'TAKE_PROFIT',
+    EXIT_TIER2: 'TAKE_PROFIT_TIER2',
+    EXIT_TIER3: 'TAKE_PROFIT_TIER3',
+    EXIT_STOP_LOSS: 'STOP_LOSS'
+}
+
+# Log template of each exit; the stop loss is handled as a fourth tier that sells everything
+_EXIT_LOG = {
+    EXIT_TIER1: 'TAKE PROFIT TIER 1, Price: {:.2f}, Size: {:.6f}, Profit: {:.2f}%, RSI: {:.2f}',
+    EXIT_TIER2: 'TAKE PROFIT TIER 2, Price: {:.2f}, Size: {:.6f}, Profit: {:.2f}%, RSI: {:.2f}',
+    EXIT_TIER3: 'TAKE PROFIT TIER 3 (FINAL), Price: {:.2f}, Size: {:.6f}, Profit: {:.2f}%, RSI: {:.2f}',
+    EXIT_STOP_LOSS: 'STOP LOSS, Price: {:.2f}, Size: {:.6f}, Loss: {:.2f}%, RSI: {:.2f}'
+}
+
+
+@dataclass(slots=True)
+class PosTracker:
+    """
+    Take-profit state of one open position.
+
+    The exit thresholds and tier sizes don't change while the position is
+    open, so they are computed once by open() instead of on every bar.
+    """
+    orig_size: float
+    tp1_px: float
+    tp2_px: float
+    tp3_px: float
+    sl_px: float
+    tp1_sz: float
+    tp2_sz: float
+    tp3_sz: float
+    tier1: bool = False
+    tier2: bool = False
+    tier3: bool = False
+
+    @classmethod
+    def open(cls, strategy, entry_price: float, orig_size: float) -> 'PosTracker':
+        """
+        Start tracking a new position.
+
+        Args:
+            strategy: Strategy holding the hoisted tier and stop-loss parameters
+            entry_price: Average entry price of the position
+            orig_size: Position size right after the entry fill
+
+        Returns:
+            PosTracker with no tier taken yet
+        """
+        return cls(
+            orig_size=orig_size,
+            tp1_px=entry_price * (1 + strategy._tp1_pct),
+            tp2_px=entry_price * (1 + strategy._tp2_pct),
+            tp3_px=entry_price * (1 + strategy._tp3_pct),
+            sl_px=entry_price * (1 - strategy._sl_pct),
+            tp1_sz=orig_size * strategy._tp1_size_pct,
+            tp2_sz=orig_size * strategy._tp2_size_pct,
+            tp3_sz=orig_size * strategy._tp3_size_pct
+        )
+
+    def decide(self, close: float) -> int:
+        """Return the EXIT_* action the close triggers for this position."""
+        return decide_exit_at(
+            close, self.tier1, self.tier2, self.tier3,
+            self.tp1_px, self.tp2_px, self.tp3_px, self.sl_px
+        )
+
+    def take(self, tier: int) -> float:
+        """Mark a take-profit tier as taken and return its size."""
+        if tier == EXIT_TIER1:
+            self.tier1 = True
+            return self.tp1_sz
+        if tier == EXIT_TIER2:
+            self.tier2 = True
+            return self.tp2_sz
+        self.tier3 = True
+        return self.tp3_sz
+
+
+def _bar_times_ns(data) -> np.ndarray:
+    """
+    Bar times of a preloaded feed as POSIX nanoseconds.
+
+    Float days only resolve to about 10 microseconds, so times are rounded to
+    the millisecond to land exactly on the bar boundaries.
+    """
+    days = np.asarray(data.datetime.array) - _BT_EPOCH_DAYS
+    return np.rint(days * _MS_PER_DAY).astype(np.int64) * 1_000_000
+
+
+def _to_datetime(value: Any) -> Any:
+    """Convert a datetime64 bar time to a datetime for export; other values pass through."""
+    if isinstance(value, np.datetime64):
+        return value.astype('datetime64[us]').item()
+    return value
+
+
+def _event_datetime(value: Any) -> datetime:
+    """Convert a logged event time, POSIX nanoseconds or a datetime, to a datetime for formatting."""
+    if isinstance(value, datetime):
+        return value
+    return np.datetime64(int(value), 'ns').astype('datetime64[us]').item()
+
+
+class _ArrayPandasData(bt.feeds.PandasData):
+    """
+    PandasData feed that loads bars from column arrays.
+
+    The stock feed reads every field of every bar with DataFrame.iloc and
+    converts each timestamp through to_pydatetime() and date2num(). Here the
+    columns are extracted once in start(), with the bar times converted to
+    backtrader date numbers in one vectorized step, and _load() only copies
+    list items into the lines.
+    """
+
+    def start(self):
+        """Resolve the column mapping, then extract the columns the lines read."""
+        super().start()
+        df = self.p.dataname
+        self._columns = []
+        for datafield in self.getlinealiases():
+            if datafield == 'datetime':
+                continue
+            colindex = self._colmapping[datafield]
+            if colindex is None:
+                continue
+            values = df.iloc[:, colindex].to_numpy(dtype=np.float64).tolist()
+            self._columns.append((getattr(self.lines, datafield), values))
+
+        coldtime = self._colmapping['datetime']
+        times = pd.DatetimeIndex(df.index if coldtime is None else df.iloc[:, coldtime])
+        if times.tz is not None:
+            # date2num() converts aware datetimes to UTC as well
+            times = times.tz_convert(None)
+        days = times.to_numpy(dtype='datetime64[ns]').astype(np.int64) / (_MS_PER_DAY * 1_000_000) + _BT_EPOCH_DAYS
+        self._dtnums = days.tolist()
+
+    def _load(self):
+        """Load the next bar into the lines; False once the data is exhausted."""
+        self._idx += 1
+        idx = self._idx
+        if idx >= len(self._dtnums):
+            return False
+        for line, values in self._columns:
+            line[0] = values[idx]
+        self.lines.datetime[0] = self._dtnums[idx]
+        return True
+
+
+@dataclass(slots=True)
+class TradeRecord:
+    """
+    A round trip from the entry signal to the executed exit; unset fields stay None.
+
+    Bar times are kept as datetime64 and converted to datetime by to_dict().
+    """
+    entry_time: np.datetime64
+    entry_price: float
+    entry_indicators: Dict[str, float]
+    size: float
+    symbol: Optional[str] = None
+    executed_entry_price: Optional[float] = None
+    executed_size: Optional[float] = None
+    executed_value: Optional[float] = None
+    commission: Optional[float] = None
+    exit_time: Optional[np.datetime64] = None
+    exit_price: Optional[float] = None
+    exit_indicators: Optional[Dict[str, float]] = None
+    exit_reason: Optional[str] = None
+    profit_pct: Optional[float] = None
+    loss_pct: Optional[float] = None
+    position_pct_closed: Optional[float] = None
+    exits: Optional[List[Dict]] = None
+    executed_exit_price: Optional[float] = None
+    executed_exit_value: Optional[float] = None
+    exit_commission: Optional[float] = None
+    realized_profit_pct: Optional[float] = None
+
+    def update(self, **values: Any) -> None:
+        """Set several fields at once; unknown names raise AttributeError."""
+        for name, value in values.items():
+            setattr(self, name, value)
+
+    def add_exit(self, exit_data: Dict) -> None:
+        """Record a partial exit (take-profit tier)."""
+        if self.exits is None:
+            self.exits = []
+        self.exits.append(exit_data)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the fields that are set, e.g. for JSON export."""
+        data = {f.name: getattr(self, f.name) for f in fields(self) if getattr(self, f.name) is not None}
+        for key in ('entry_time', 'exit_time'):
+            if key in data:
+                data[key] = _to_datetime(data[key])
+        if 'exits' in data:
+            data['exits'] = [{**exit_data, 'exit_time': _to_datetime(exit_data['exit_time'])} for exit_data in data['exits']]
+        return data
+
+
+@dataclass(slots=True)
+class VectorizedBacktest:
+    """Outcome of BacktestHarness.vectorized_run(), with the bar data needed to report it."""
+    result: SimulationResult
+    times: np.ndarray
+    close: np.ndarray
+
+    def event_log_lines(self) -> List[str]:
+        """Format the simulated orders for file logging."""
+        return simulation_event_lines(self.result, self.times, self.close)
+
+    def trade_frame(self) -> pd.DataFrame:
+        """
+        Tabulate the closed trades.
+
+        Returns:
+            DataFrame with one row per round trip: entry_time, exit_time,
+            exit_reason, pnl_pct and net_pnl
+        """
+        trades = closed_trades(self.result)
+        return pd.DataFrame({
+            'entry_time': self.times[trades['entry_bar']],
+            'exit_time': self.times[trades['exit_bar']],
+            'exit_reason': [EXIT_REASONS[reason] for reason in trades['exit_reason']],
+            'pnl_pct': trades['pnl_pct'],
+            'net_pnl': self.result.trade_pnl
+        })
+
+
+def _json_default(obj):
+    """Serialize what orjson can't, with datetimes formatted like DateTimeEncoder."""
+    if isinstance(obj, datetime):
+        return obj.strftime('%Y-%m-%d %H:%M:%S')
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _write_json(path: str, data: Dict) -> None:
+    """
+    Write a JSON log, with orjson when it is installed and the json module otherwise.
+
+    Args:
+        path: Output file path
+        data: Log data
+    """
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(
+                data,
+                default=_json_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+            ))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=4, cls=DateTimeEncoder)
+
+
+def _write_jsonl(path: str, records: Iterable[Dict]) -> None:
+    """
+    Write log records as JSON Lines, one compact object per line.
+
+    Records are serialized one at a time, so the log is never held in memory
+    as a single document.
+
+    Args:
+        path: Output file path
+        records: Log records
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        with open(path, 'wb', buffering=1 << 20) as f:
+            for record in records:
+                f.write(orjson.dumps(record, default=_json_default, option=option))
+                f.write(b'\n')
+    else:
+        encoder = DateTimeEncoder()
+        with open(path, 'w', buffering=1 << 20) as f:
+            for record in records:
+                f.write(encoder.encode(record))
+                f.write('\n')
+
+
+def _write_run_logs(
+    json_filepath: str,
+    log_data: Dict,
+    records_path: Optional[str] = None,
+    records: Iterable[Dict] = ()
+) -> None:
+    """
+    Write a run's JSON log, and its JSON Lines records when records_path is set.
+
+    Runs on the shared log writer thread, so failures are logged instead of raised.
+    """
+    try:
+        if records_path is not None:
+            _write_jsonl(records_path, records)
+        _write_json(json_filepath, log_data)
+        logger.info(f"Detailed log saved to {json_filepath}")
+    except Exception as e:
+        logger.error(f"Failed to save JSON log to {json_filepath}: {e}")
+
+
+# One background thread writes the JSON logs of every harness in the process;
+# created on first use and again in a forked child, which doesn't inherit the thread
+_log_writer: Optional[ThreadPoolExecutor] = None
+_log_writer_pid: Optional[int] = None
+_log_writer_lock = threading.Lock()
+
+# Harnesses whose queued summary rows are written at exit, held weakly so
+# the exit hook doesn't keep them alive
+_open_harnesses: 'weakref.WeakSet[BacktestHarness]' = weakref.WeakSet()
+
+# Numbers the runs of every harness in the process, see BacktestHarness._run_id()
+_run_counter = itertools.count()
+
+
+def _get_log_writer() -> ThreadPoolExecutor:
+    """Return the process's JSON log writer, starting it on first use."""
+    global _log_writer, _log_writer_pid
+    with _log_writer_lock:
+        if _log_writer is None or _log_writer_pid != os.getpid():
+            _log_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='backtest-log')
+            _log_writer_pid = os.getpid()
+            atexit.register(_log_writer.shutdown, wait=True)
+        return _log_writer
+
+
+@atexit.register
+def _flush_open_harnesses() -> None:
+    """Write the summary rows still queued by live harnesses when the process exits."""
+    for harness in list(_open_harnesses):
+        harness.flush_csv()
+
+
+def _open_event_log(path: Optional[str], header: Tuple[str, ...]):
+    """
+    Open a CSV file that trade events are streamed to as they happen.
+
+    Args:
+        path: CSV file path, or None to keep events in memory
+        header: Column names written as the first row
+
+    Returns:
+        Tuple of (file, csv writer), both None when path is None
+    """
+    if path is None:
+        return None, None
+    # A large write buffer keeps the per-event cost to a formatted row in memory
+    event_file = open(path, 'w', newline='', buffering=1 << 20)
+    writer = csv.writer(event_file)
+    writer.writerow(header)
+    return event_file, writer
+
 
 class MeanReversionBT(bt.Strategy):
     """Backtrader implementation of Mean Reversion strategy."""
@@ -48,34 +508,142 @@ class MeanReversionBT(bt.Strategy):
         ('take_profit_tier3_size_pct', 0.34),  # Sell 34% at third tier (remaining)
         ('position_size_pct', 0.01),
         ('cool_down_hours', 4), # Default cool-down period in hours
-        ('cool_down_minutes', 0) # Default cool-down period in minutes
+        ('cool_down_minutes', 0), # Default cool-down period in minutes
+        ('verbose', True),  # Log trade events; turn off for parameter sweeps
+        ('event_log_path', None)  # Stream trade events to this CSV instead of keeping them in memory
     )
     
     def __init__(self):
-        """Initialize indicators and variables for the strategy."""
-        # Initialize indicators
-        self.bband = bt.indicators.BollingerBands(
-            self.datas[0], 
-            period=self.params.bb_length, 
-            devfactor=self.params.bb_std
-        )
-        self.rsi = bt.indicators.RelativeStrengthIndex(self.datas[0], period=self.params.rsi_length)
+        """Initialize variables for the strategy."""
+        # Indicators are precomputed in start() once the feed has been preloaded
         self.order = None
         self.buy_price = None
         self.buy_comm = None
-        self.last_trade_time = datetime.min
-        self.trades = []  # To store individual trade P&L
-        self.buy_signals = []
-        self.sell_signals = []
+        self.last_trade_time = np.datetime64('NaT', 'ns')
+        self.current_trade: Optional[TradeRecord] = None  # Open trade record, None when flat
+        self.trades = []  # Completed TradeRecords
+        self.trade_pnls = []  # Net P&L of each closed backtrader trade
+        self._trade_open_value = {}  # Opening value per trade ref, for P&L %
+        # Signals are stored column-wise, use .to_frame() for analysis
+        self.buy_signals = SignalBuffer(BUY_SIGNAL_COLUMNS)
+        self.sell_signals = SignalBuffer(SELL_SIGNAL_COLUMNS, labels={'reason': EXIT_REASONS})
         self.trade_event_logs = [] # For detailed logging of events
-        self.profit_tiers_hit = {}  # To track which tiers have been hit for each position
+        self._log_events = []  # Console log events, written by _flush_log()
+        self._tracker: Optional[PosTracker] = None  # Tiers taken for the open position, None when flat
+        self._event_file = self._event_writer = None  # Streamed event log, opened in start()
+        self._cool_down_end_ns = _NO_COOL_DOWN  # Bar time in ns before which next() is skipped
+
+        # Parameters read on every bar, hoisted out of the AutoInfoClass lookups
+        self._tp1_pct = self.params.take_profit_tier1_pct
+        self._tp2_pct = self.params.take_profit_tier2_pct
+        self._tp3_pct = self.params.take_profit_tier3_pct
+        self._tp1_size_pct = self.params.take_profit_tier1_size_pct
+        self._tp2_size_pct = self.params.take_profit_tier2_size_pct
+        self._tp3_size_pct = self.params.take_profit_tier3_size_pct
+        self._sl_pct = self.params.stop_loss_pct
+        self._position_size_pct = self.params.position_size_pct
+        self._verbose = self.params.verbose  # Checked by every log() call
+        self._rsi_oversold = self.params.rsi_oversold
+        self._tier_size_pcts = {
+            EXIT_TIER1: self._tp1_size_pct,
+            EXIT_TIER2: self._tp2_size_pct,
+            EXIT_TIER3: self._tp3_size_pct
+        }
+        # Cool-down compared as POSIX nanoseconds against the bar time
+        self._cool_down_ns = int(
+            timedelta(hours=self.params.cool_down_hours, minutes=self.params.cool_down_minutes).total_seconds() * 10**9
+        )
+
+    @staticmethod
+    def precompute_signals(
+        close: np.ndarray,
+        bb_length: int,
+        bb_std: float,
+        rsi_length: int,
+        rsi_oversold: float
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Compute the indicators and entry condition bits for a whole close series.
+        
+        Shared by start() and the array simulations, so both enter on exactly
+        the same bars. NaN warmup values compare False, so no bar sets a
+        condition bit before the indicators are ready.
+        
+        Args:
+            close: Close prices
+            bb_length: Bollinger Bands window
+            bb_std: Number of standard deviations for the bands
+            rsi_length: RSI period
+            rsi_oversold: RSI level below which the market is oversold
+            
+        Returns:
+            Tuple of (bb_upper, bb_middle, bb_lower, rsi, entry_cond) arrays;
+            entry_cond holds the COND_* bits of each bar as uint8
+        """
+        # Memoized, so parameter sweeps over the same feed compute each indicator once
+        bb_upper, bb_middle, bb_lower = cached_bollinger_bands(close, bb_length, bb_std)
+        rsi = cached_rsi(close, rsi_length)
+        entry_cond = (
+            (close <= bb_lower).astype(np.uint8) * COND_BELOW_BB
+            | (rsi < rsi_oversold).astype(np.uint8) * COND_RSI_OVERSOLD
+        )
+        return bb_upper, bb_middle, bb_lower, rsi, entry_cond
+
+    def start(self):
+        """Precompute indicators and the buy condition over the preloaded feed."""
+        close = np.asarray(self.data.close.array, dtype=np.float64)
+        self._close = close
+        # The broker updates the Position in place, so it is looked up once instead of through self.position
+        self._position = self.broker.getposition(self.data)
+        self.buy_signals.reserve(len(close) // _BARS_PER_SIGNAL)
+        self.sell_signals.reserve(len(close) // _BARS_PER_SIGNAL)
+        (self._bb_upper, self._bb_middle, self._bb_lower,
+         self._rsi, self._entry_cond) = self.precompute_signals(
+            close, self.params.bb_length, self.params.bb_std,
+            self.params.rsi_length, self.params.rsi_oversold
+        )
+        self._bar_ns = _bar_times_ns(self.data)
+        self._event_file, self._event_writer = _open_event_log(self.params.event_log_path, ('time', 'event'))
+
+    def stop(self):
+        """Write the deferred console log, then flush and close the streamed event log."""
+        self._flush_log()
+        if self._event_file is not None:
+            self._event_file.close()
+            self._event_file = None
+
+    def log(self, txt, *args, dt=None):
+        """
+        Log strategy information with timestamp.
+
+        txt is a str.format template; it is only formatted with args when a
+        log sink accepts the message or the event log is exported. Console
+        output is deferred to _flush_log(), outside of next().
+        """
+        if not self._verbose:
+            return
+        # The bar time stays in nanoseconds until the event is formatted
+        dt = dt or self._bar_ns[len(self) - 1]
+        self._log_events.append((dt, txt, args))
+        if len(self._log_events) >= _LOG_FLUSH_EVENTS:
+            self._flush_log()
+        if self._event_writer is not None:
+            self._event_writer.writerow((_event_datetime(dt).isoformat(), txt.format(*args)))
+        else:
+            self.trade_event_logs.append((dt, txt, args)) # Store for file logging
 
-    def log(self, txt, dt=None):
-        """Log strategy information with timestamp."""
-        dt = dt or self.datas[0].datetime.datetime(0)
-        log_message = f'{dt.isoformat()} {txt}'
-        logger.info(log_message) # Keep console logging if desired
-        self.trade_event_logs.append(log_message) # Store for file logging
+    def _flush_log(self):
+        """Write the deferred console log events through the logger as one message."""
+        events, self._log_events = self._log_events, []
+        if events:
+            # Lazy, so the batch is only formatted when a sink accepts INFO
+            logger.opt(lazy=True).info("{}", lambda: "\n".join(
+                f'{_event_datetime(dt).isoformat()} {txt.format(*args)}' for dt, txt, args in events
+            ))
+
+    def event_log_lines(self) -> List[str]:
+        """Format the recorded trade events for file logging."""
+        return [f'{_event_datetime(dt).isoformat()} {txt.format(*args)}' for dt, txt, args in self.trade_event_logs]
 
     def notify_order(self, order):
         """Handle order status notifications."""
@@ -86,320 +654,194 @@ class MeanReversionBT(bt.Strategy):
         # Check if order has been completed
         if order.status in [order.Completed]:
             if order.isbuy():
-                self.log(f'BUY EXECUTED, Price: {order.executed.price:.2f}, Size: {order.executed.size:.6f}, Value: ${order.executed.value:.2f}, Comm: ${order.executed.comm:.2f}')
+                self.log('BUY EXECUTED, Price: {:.2f}, Size: {:.6f}, Value: ${:.2f}, Comm: ${:.2f}', order.executed.price, order.executed.size, order.executed.value, order.executed.comm)
                 # Update the current trade with actual execution price
-                if hasattr(self, 'current_trade'):
-                    self.current_trade['executed_entry_price'] = order.executed.price
-                    self.current_trade['commission'] = order.executed.comm
+                if self.current_trade is not None:
+                    self.current_trade.executed_entry_price = order.executed.price
+                    self.current_trade.commission = order.executed.comm
             else:
                 # Calculate the actual dollar amount received from the sale
                 sell_value = order.executed.price * order.executed.size
-                self.log(f'SELL EXECUTED, Price: {order.executed.price:.2f}, Size: {order.executed.size:.6f}, Value: ${sell_value:.2f}, Comm: ${order.executed.comm:.2f}')
+                self.log('SELL EXECUTED, Price: {:.2f}, Size: {:.6f}, Value: ${:.2f}, Comm: ${:.2f}', order.executed.price, order.executed.size, sell_value, order.executed.comm)
                 # Add the completed trade to the list when the sell order is executed
-                if hasattr(self, 'current_trade') and 'exit_time' in self.current_trade:
+                if self.current_trade is not None and self.current_trade.exit_time is not None:
                     # Update with actual execution details
-                    self.current_trade['executed_exit_price'] = order.executed.price
-                    self.current_trade['exit_commission'] = order.executed.comm
+                    self.current_trade.executed_exit_price = order.executed.price
+                    self.current_trade.exit_commission = order.executed.comm
                     
-                    # Add to trades list only when the order is executed
-                    self.trades.append(self.current_trade.copy())
+                    # Add to trades list only when the order is executed; the record
+                    # is released below, so it is stored without a copy
+                    self.trades.append(self.current_trade)
                     
                     # Clear current trade to prevent duplicates
-                    delattr(self, 'current_trade')
+                    self.current_trade = None
         
         elif order.status in [order.Canceled, order.Margin, order.Rejected]:
-            self.log(f'Order Canceled/Margin/Rejected: {order.status}')
+            self.log('Order Canceled/Margin/Rejected: {}', order.status)
         
         # Reset order reference
         self.order = None
     
     def notify_trade(self, trade):
-        """Handle trade completed notifications."""
+        """Handle trade opened/closed notifications."""
+        if trade.justopened:
+            # A closed trade reports a value of 0, so keep the opening value for the P&L %
+            self._trade_open_value[trade.ref] = abs(trade.value)
+            return
         if not trade.isclosed:
             return
         
-        self.log(f'TRADE COMPLETED, Gross: {trade.pnl:.2f}, Net: {trade.pnlcomm:.2f}')
-        # Populate self.trades for P&L analysis
-        # trade.value is the initial value of the position
-        # trade.pnlcomm is the net profit/loss
-        if trade.value != 0: # Avoid division by zero if position size was zero for some reason
-            pnl_pct = (trade.pnlcomm / abs(trade.value)) * 100 # abs(trade.value) because value of short position is negative
-            self.trades.append({'pnl_pct': pnl_pct, 'net_pnl': trade.pnlcomm})
-        else:
-            self.trades.append({'pnl_pct': 0, 'net_pnl': trade.pnlcomm})
+        self._tracker = None
+        self.log('TRADE COMPLETED, Gross: {:.2f}, Net: {:.2f}', trade.pnl, trade.pnlcomm)
+        # P&L goes to its own list, the trade record itself is stored by notify_order
+        open_value = self._trade_open_value.pop(trade.ref, 0)
+        pnl_pct = (trade.pnlcomm / open_value) * 100 if open_value else 0
+        self.trade_pnls.append({'pnl_pct': pnl_pct, 'net_pnl': trade.pnlcomm})
 
     def next(self):
         """Strategy logic executed on each bar."""
+        # Index of the current bar in the precomputed arrays; reading close from
+        # the raw array skips the LineBuffer __getitem__ on every access
+        idx = len(self) - 1
+        
         # Skip if in cool-down period
-        current_time = self.datas[0].datetime.datetime(0)
-        if (self.params.cool_down_hours > 0 or self.params.cool_down_minutes > 0) and self.last_trade_time != datetime.min:
-            if (current_time - self.last_trade_time) < timedelta(hours=self.params.cool_down_hours, minutes=self.params.cool_down_minutes):
-                return
+        bar_ns = self._bar_ns[idx]
+        if bar_ns < self._cool_down_end_ns:
+            return
+        
+        close = self._close[idx]
         
         # Check for buy signal
-        if (self.data.close[0] <= self.bband.lines.bot[0] and 
-            self.rsi[0] < self.params.rsi_oversold and 
-            not self.position):
+        position = self._position
+        if self._entry_cond[idx] == ENTRY_CONDITIONS and not position:
+            # The bar's time is only built on bars that place an order
+            current_time = np.datetime64(int(bar_ns), 'ns')
             
             # Calculate position size based on equity percentage
-            size = self.broker.getcash() * self.params.position_size_pct / self.data.close[0]
+            size = self.broker.getcash() * self._position_size_pct / close
             
             # Store detailed indicator values
-            bb_upper = self.bband.lines.top[0]
-            bb_middle = self.bband.lines.mid[0]
-            bb_lower = self.bband.lines.bot[0]
-            rsi_value = self.rsi[0]
-            sma_value = self.data.close[0]
+            bb_upper = self._bb_upper[idx]
+            bb_middle = self._bb_middle[idx]
+            bb_lower = self._bb_lower[idx]
+            rsi_value = self._rsi[idx]
+            sma_value = close
             
             # Place buy order
-            self.log(f'BUY CREATE, Price: {self.data.close[0]:.2f}, Size: {size:.6f}, Value: ${self.data.close[0] * size:.2f}, RSI: {rsi_value:.2f}, BB Lower: {bb_lower:.2f}')
+            self.log('BUY CREATE, Price: {:.2f}, Size: {:.6f}, Value: ${:.2f}, RSI: {:.2f}, BB Lower: {:.2f}', close, size, close * size, rsi_value, bb_lower)
             self.order = self.buy(size=size)
             
             # Record signal with detailed data
-            signal_data = {
-                'time': current_time,
-                'price': self.data.close[0],
-                'action': 'BUY',
-                'bb_upper': bb_upper,
-                'bb_middle': bb_middle,
-                'bb_lower': bb_lower,
-                'rsi': rsi_value,
-                'sma': sma_value,
-                'size': size
-            }
-            self.buy_signals.append(signal_data)
+            self.buy_signals.append(
+                time=current_time,
+                price=close,
+                bb_upper=bb_upper,
+                bb_middle=bb_middle,
+                bb_lower=bb_lower,
+                rsi=rsi_value,
+                size=size
+            )
             
             # Start a new trade record
-            self.current_trade = {
-                'entry_time': current_time,
-                'entry_price': self.data.close[0],
-                'entry_indicators': {
+            self.current_trade = TradeRecord(
+                entry_time=current_time,
+                entry_price=close,
+                entry_indicators={
                     'bb_upper': bb_upper,
                     'bb_middle': bb_middle,
                     'bb_lower': bb_lower,
                     'rsi': rsi_value,
                     'sma': sma_value
                 },
-                'size': size
-            }
+                size=size
+            )
             
             # Update last trade time
             self.last_trade_time = current_time
+            self._cool_down_end_ns = bar_ns + self._cool_down_ns
         
         # If we have a position, check for graduated take profit
-        elif self.position:
-            # Store current indicator values
-            bb_upper = self.bband.lines.top[0]
-            bb_middle = self.bband.lines.mid[0]
-            bb_lower = self.bband.lines.bot[0]
-            rsi_value = self.rsi[0]
-            sma_value = self.data.close[0]
-            current_time = self.data.datetime.datetime(0)
+        elif position:
+            # Start tracking the profit tiers on the first bar of a new position
+            position_tracker = self._tracker
+            if position_tracker is None:
+                position_tracker = self._tracker = PosTracker.open(self, position.price, position.size)
             
-            # Initialize profit tiers tracker for this position if it doesn't exist
-            position_key = f"{current_time.date()}-{self.position.price}"
-            if position_key not in self.profit_tiers_hit:
-                self.profit_tiers_hit[position_key] = {
-                    'tier1': False,
-                    'tier2': False,
-                    'tier3': False,
-                    'original_size': self.position.size
-                }
+            exit_action = position_tracker.decide(close)
+            if exit_action == EXIT_NONE:
+                return
             
-            position_tracker = self.profit_tiers_hit[position_key]
-            original_size = position_tracker['original_size']
+            # Store current indicator values
+            indicators = {
+                'bb_upper': self._bb_upper[idx],
+                'bb_middle': self._bb_middle[idx],
+                'bb_lower': self._bb_lower[idx],
+                'rsi': self._rsi[idx]
+            }
             
-            # Check for tier 3 (highest) if not already hit
-            if not position_tracker['tier3'] and self.data.close[0] >= self.position.price * (1 + self.params.take_profit_tier3_pct):
-                tier3_size = original_size * self.params.take_profit_tier3_size_pct
-                if tier3_size > self.position.size:
-                    tier3_size = self.position.size  # Ensure we don't sell more than we have
-                    
-                profit_pct = (self.data.close[0] / self.position.price - 1) * 100
-                self.log(f'TAKE PROFIT TIER 3 (FINAL), Price: {self.data.close[0]:.2f}, Size: {tier3_size:.6f}, Profit: {profit_pct:.2f}%, RSI: {rsi_value:.2f}')
-                
-                # Create sell order for tier 3
-                self.order = self.sell(size=tier3_size)
-                position_tracker['tier3'] = True
-                
-                # Record signal with detailed data
-                signal_data = {
-                    'time': current_time,
-                    'price': self.data.close[0],
-                    'action': 'SELL',
-                    'reason': 'TAKE_PROFIT_TIER3',
-                    'profit_pct': profit_pct,
-                    'position_pct': self.params.take_profit_tier3_size_pct * 100,
-                    'size': tier3_size,
-                    'bb_upper': bb_upper,
-                    'bb_middle': bb_middle,
-                    'bb_lower': bb_lower,
-                    'rsi': rsi_value
-                }
-                self.sell_signals.append(signal_data)
-                
-                # Update current trade record
-                exit_data = {
-                    'exit_time': current_time,
-                    'exit_price': self.data.close[0],
-                    'exit_indicators': {
-                        'bb_upper': bb_upper,
-                        'bb_middle': bb_middle,
-                        'bb_lower': bb_lower,
-                        'rsi': rsi_value
-                    },
-                    'profit_pct': profit_pct,
-                    'exit_reason': 'TAKE_PROFIT_TIER3',
-                    'position_pct_closed': self.params.take_profit_tier3_size_pct * 100
-                }
-                
-                # If we haven't recorded any exit yet, create a new exit record
-                if not hasattr(self, 'current_trade') or 'exits' not in self.current_trade:
-                    self.current_trade['exits'] = []
-                
-                self.current_trade['exits'].append(exit_data)
-                
-            # Check for tier 2 if not already hit
-            elif not position_tracker['tier2'] and self.data.close[0] >= self.position.price * (1 + self.params.take_profit_tier2_pct):
-                tier2_size = original_size * self.params.take_profit_tier2_size_pct
-                if tier2_size > self.position.size:
-                    tier2_size = self.position.size  # Ensure we don't sell more than we have
-                    
-                profit_pct = (self.data.close[0] / self.position.price - 1) * 100
-                self.log(f'TAKE PROFIT TIER 2, Price: {self.data.close[0]:.2f}, Size: {tier2_size:.6f}, Profit: {profit_pct:.2f}%, RSI: {rsi_value:.2f}')
-                
-                # Create sell order for tier 2
-                self.order = self.sell(size=tier2_size)
-                position_tracker['tier2'] = True
-                
-                # Record signal with detailed data
-                signal_data = {
-                    'time': current_time,
-                    'price': self.data.close[0],
-                    'action': 'SELL',
-                    'reason': 'TAKE_PROFIT_TIER2',
-                    'profit_pct': profit_pct,
-                    'position_pct': self.params.take_profit_tier2_size_pct * 100,
-                    'size': tier2_size,
-                    'bb_upper': bb_upper,
-                    'bb_middle': bb_middle,
-                    'bb_lower': bb_lower,
-                    'rsi': rsi_value
-                }
-                self.sell_signals.append(signal_data)
-                
-                # Update current trade record
-                exit_data = {
-                    'exit_time': current_time,
-                    'exit_price': self.data.close[0],
-                    'exit_indicators': {
-                        'bb_upper': bb_upper,
-                        'bb_middle': bb_middle,
-                        'bb_lower': bb_lower,
-                        'rsi': rsi_value
-                    },
-                    'profit_pct': profit_pct,
-                    'exit_reason': 'TAKE_PROFIT_TIER2',
-                    'position_pct_closed': self.params.take_profit_tier2_size_pct * 100
-                }
-                
-                # If we haven't recorded any exit yet, create a new exit record
-                if not hasattr(self, 'current_trade') or 'exits' not in self.current_trade:
-                    self.current_trade['exits'] = []
-                
-                self.current_trade['exits'].append(exit_data)
-                
-            # Check for tier 1 if not already hit
-            elif not position_tracker['tier1'] and self.data.close[0] >= self.position.price * (1 + self.params.take_profit_tier1_pct):
-                tier1_size = original_size * self.params.take_profit_tier1_size_pct
-                if tier1_size > self.position.size:
-                    tier1_size = self.position.size  # Ensure we don't sell more than we have
-                    
-                profit_pct = (self.data.close[0] / self.position.price - 1) * 100
-                self.log(f'TAKE PROFIT TIER 1, Price: {self.data.close[0]:.2f}, Size: {tier1_size:.6f}, Profit: {profit_pct:.2f}%, RSI: {rsi_value:.2f}')
-                
-                # Create sell order for tier 1
-                self.order = self.sell(size=tier1_size)
-                position_tracker['tier1'] = True
-                
-                # Record signal with detailed data
-                signal_data = {
-                    'time': current_time,
-                    'price': self.data.close[0],
-                    'action': 'SELL',
-                    'reason': 'TAKE_PROFIT',
-                    'profit_pct': profit_pct,
-                    'bb_upper': bb_upper,
-                    'bb_middle': bb_middle,
-                    'bb_lower': bb_lower,
-                    'rsi': rsi_value,
-                    'sma': sma_value
-                }
-                self.sell_signals.append(signal_data)
-                
-                # Complete the trade record (first check if it was added previously to avoid duplicates)
-                # We will mark the trade for completion, actual recording happens in notify_order
-                if hasattr(self, 'current_trade') and 'exit_time' not in self.current_trade:
-                    self.current_trade.update({
-                        'exit_time': current_time,
-                        'exit_price': self.data.close[0],
-                        'exit_indicators': {
-                            'bb_upper': bb_upper,
-                            'bb_middle': bb_middle,
-                            'bb_lower': bb_lower,
-                            'rsi': rsi_value,
-                            'sma': sma_value
-                        },
-                        'profit_pct': profit_pct,
-                        'exit_reason': 'TAKE_PROFIT'
-                    })
-                    # We'll add the trade to the list when the order is actually executed
-                
-                # Update last trade time
-                self.last_trade_time = current_time
+            # Take profit at the highest tier reached that hasn't been hit yet, or stop out
+            current_time = np.datetime64(int(bar_ns), 'ns')
+            self._exit_position(exit_action, position_tracker, close, current_time, bar_ns, indicators)
+
+    def _exit_position(self, action, position_tracker, close, current_time, bar_ns, indicators):
+        """
+        Sell one take-profit tier, or the whole position on a stop loss, and record the exit.
+
+        Tier 1 and the stop loss complete the trade record and start the
+        cool-down; tiers 2 and 3 are recorded as partial exits.
+        """
+        position = self._position
+        position_size, position_price = position.size, position.price
+        if action == EXIT_STOP_LOSS:
+            # Sell the entire position, the P&L is reported as a positive loss
+            size = position_size
+            pct_field, pct = 'loss_pct', (1 - close / position_price) * 100
+            tier_fields = {}
+        else:
+            size_pct = self._tier_size_pcts[action]
+            size = min(position_tracker.take(action), position_size)  # Don't sell more than we have
+            pct_field, pct = 'profit_pct', (close / position_price - 1) * 100
+            tier_fields = {'position_pct': size_pct * 100, 'size': size}
+        self.log(_EXIT_LOG[action], close, size, pct, indicators['rsi'])
+        
+        # Create the sell order
+        self.order = self.sell(size=size)
+        
+        # Record signal with detailed data
+        self.sell_signals.append(
+            time=current_time,
+            price=close,
+            reason=action,
+            **{pct_field: pct},
+            **tier_fields,
+            **indicators
+        )
+        
+        current_trade = self.current_trade
+        if action in (EXIT_TIER1, EXIT_STOP_LOSS):
+            # Complete the trade record (first check if it was added previously to avoid duplicates)
+            # We will mark the trade for completion, actual recording happens in notify_order
+            if current_trade is not None and current_trade.exit_time is None:
+                current_trade.update(
+                    exit_time=current_time,
+                    exit_price=close,
+                    exit_indicators={**indicators, 'sma': close},
+                    exit_reason=EXIT_REASONS[action],
+                    **{pct_field: pct}
+                )
             
-            # Check for stop loss
-            elif self.data.close[0] < self.position.price * (1 - self.params.stop_loss_pct):
-                loss_pct = (1 - self.data.close[0] / self.position.price) * 100
-                # Sell the entire position by specifying size
-                position_size = self.position.size
-                self.log(f'STOP LOSS, Price: {self.data.close[0]:.2f}, Size: {position_size:.6f}, Loss: {loss_pct:.2f}%, RSI: {rsi_value:.2f}')
-                self.order = self.sell(size=position_size)
-                
-                # Record signal with detailed data
-                signal_data = {
-                    'time': current_time,
-                    'price': self.data.close[0],
-                    'action': 'SELL',
-                    'reason': 'STOP_LOSS',
-                    'loss_pct': loss_pct,
-                    'bb_upper': bb_upper,
-                    'bb_middle': bb_middle,
-                    'bb_lower': bb_lower,
-                    'rsi': rsi_value,
-                    'sma': sma_value
-                }
-                self.sell_signals.append(signal_data)
-                
-                # Complete the trade record (first check if it was added previously to avoid duplicates)
-                if hasattr(self, 'current_trade') and 'exit_time' not in self.current_trade:
-                    self.current_trade.update({
-                        'exit_time': current_time,
-                        'exit_price': self.data.close[0],
-                        'exit_indicators': {
-                            'bb_upper': bb_upper,
-                            'bb_middle': bb_middle,
-                            'bb_lower': bb_lower,
-                            'rsi': rsi_value,
-                            'sma': sma_value
-                        },
-                        'loss_pct': loss_pct,
-                        'exit_reason': 'STOP_LOSS'
-                    })
-                    # We'll add the trade to the list when the order is actually executed
-                
-                # Update last trade time
-                self.last_trade_time = current_time
+            # Update last trade time
+            self.last_trade_time = current_time
+            self._cool_down_end_ns = bar_ns + self._cool_down_ns
+        elif current_trade is not None:
+            current_trade.add_exit({
+                'exit_time': current_time,
+                'exit_price': close,
+                'exit_indicators': dict(indicators),
+                pct_field: pct,
+                'exit_reason': EXIT_REASONS[action],
+                'position_pct_closed': tier_fields['position_pct']
+            })
 
 
 class MultiAssetMeanReversionBT(bt.Strategy):
@@ -425,445 +867,361 @@ class MultiAssetMeanReversionBT(bt.Strategy):
         ('take_profit_tier3_size_pct', 0.34),  # Sell 34% at third tier (remaining)
         ('position_size_pct', 0.333),  # Default to 1/3 of equity per symbol
         ('cool_down_hours', 4), # Default cool-down period in hours
-        ('cool_down_minutes', 0) # Default cool-down period in minutes
+        ('cool_down_minutes', 0), # Default cool-down period in minutes
+        ('verbose', True),  # Log trade events; turn off for parameter sweeps
+        ('event_log_path', None)  # Stream trade events to this CSV instead of keeping them in memory
     )
     
     def __init__(self):
         """Initialize indicators and variables for the strategy."""
         # Initialize dictionaries to track data for each symbol
-        self.indicators = {}
-        self.orders = {}
-        self.position_info = {}  # Promenili smo ime iz positions u position_info
-        self.last_trade_time = {}
+        n_feeds = len(self.datas)
+        self.orders = [None] * n_feeds  # Pending order per feed index
+        self.last_trade_time = {}  # Time of the last order per symbol, NaT before the first
         self.trade_logs = {}
         
         # Initialize trade tracking
-        self.trades = []  # To store individual trade P&L
-        self.buy_signals = []
-        self.sell_signals = []
+        self.trades = []  # Completed TradeRecords
+        self.trade_pnls = []  # Net P&L of each closed backtrader trade
+        self._trade_open_value = {}  # Opening value per trade ref, for P&L %
         self.trade_event_logs = [] # For detailed logging of events
-        self.profit_tiers_hit = {}  # Dict to track which tiers have been hit for each symbol's position
+        self._log_events = []  # Console log events, written by _flush_log()
+        self._feed_idx = {id(data): i for i, data in enumerate(self.datas)}
+        self._tiers: List[Optional[PosTracker]] = [None] * n_feeds  # Per feed, None when flat
+        self._event_file = self._event_writer = None  # Streamed event log, opened in start()
+        self._cool_down_end_ns = [_NO_COOL_DOWN] * n_feeds  # Per feed, bar time in ns before which it is skipped
+
+        # Parameters read on every bar, hoisted out of the AutoInfoClass lookups
+        self._tp1_pct = self.params.take_profit_tier1_pct
+        self._tp2_pct = self.params.take_profit_tier2_pct
+        self._tp3_pct = self.params.take_profit_tier3_pct
+        self._tp1_size_pct = self.params.take_profit_tier1_size_pct
+        self._tp2_size_pct = self.params.take_profit_tier2_size_pct
+        self._tp3_size_pct = self.params.take_profit_tier3_size_pct
+        self._sl_pct = self.params.stop_loss_pct
+        self._position_size_pct = self.params.position_size_pct
+        self._verbose = self.params.verbose  # Checked by every log() call
+        self._tier_size_pcts = {
+            EXIT_TIER1: self._tp1_size_pct,
+            EXIT_TIER2: self._tp2_size_pct,
+            EXIT_TIER3: self._tp3_size_pct
+        }
+        # Cool-down compared as POSIX nanoseconds against the bar time
+        self._cool_down_ns = int(
+            timedelta(hours=self.params.cool_down_hours, minutes=self.params.cool_down_minutes).total_seconds() * 10**9
+        )
+        
+        # Per-feed (data, symbol, position, close, entry signal, bb upper, bb middle, bb lower, rsi, bar ns) for next(), built in start()
+        self._feeds = []
+        self._symbols = []
         
-        # Setup indicators for each data feed
         for i, data in enumerate(self.datas):
             # Get the name of the data feed (symbol)
             symbol = data._name if hasattr(data, '_name') else f'Data{i}'
-            
-            # Initialize indicators for this symbol
-            self.indicators[symbol] = {
-                'bband': bt.indicators.BollingerBands(
-                    data, 
-                    period=self.params.bb_length, 
-                    devfactor=self.params.bb_std
-                ),
-                'rsi': bt.indicators.RelativeStrengthIndex(data, period=self.params.rsi_length)
-            }
-            
-            # Initialize orders and positions tracking
-            self.orders[symbol] = None
-            self.position_info[symbol] = {
-                'size': 0,
-                'price': 0,
-                'value': 0
-            }
-            
-            # Initialize last trade time
-            self.last_trade_time[symbol] = datetime.min
+            self._symbols.append(symbol)
+            self.last_trade_time[symbol] = np.datetime64('NaT', 'ns')
             
             # Initialize trade logs
             self.trade_logs[symbol] = {
-                'current_trade': {},
-                'buy_signals': [],
-                'sell_signals': []
+                'current_trade': None  # Open trade record, None when flat
             }
+        
+        # Signals of all feeds are stored column-wise, use .to_frame() for analysis
+        symbol_labels = {'symbol': dict(enumerate(self._symbols))}
+        self.buy_signals = SignalBuffer(MULTI_BUY_SIGNAL_COLUMNS, labels=symbol_labels)
+        self.sell_signals = SignalBuffer(
+            MULTI_SELL_SIGNAL_COLUMNS, labels={**symbol_labels, 'reason': EXIT_REASONS}
+        )
+
+    def start(self):
+        """Precompute each feed's indicators over the preloaded data and open the event log."""
+        for data, symbol in zip(self.datas, self._symbols):
+            close = np.asarray(data.close.array, dtype=np.float64)
+            bb_upper, bb_middle, bb_lower, rsi, entry_cond = MeanReversionBT.precompute_signals(
+                close, self.params.bb_length, self.params.bb_std,
+                self.params.rsi_length, self.params.rsi_oversold
+            )
+            # One boolean per bar, so a flat feed is skipped with a single array read
+            entry = entry_cond == ENTRY_CONDITIONS
+            bar_ns = _bar_times_ns(data)
+            # The broker updates each Position in place, so one lookup per feed is enough
+            position = self.broker.getposition(data)
+            self._feeds.append((data, symbol, position, close, entry, bb_upper, bb_middle, bb_lower, rsi, bar_ns))
+        total_bars = sum(len(feed[3]) for feed in self._feeds)
+        self.buy_signals.reserve(total_bars // _BARS_PER_SIGNAL)
+        self.sell_signals.reserve(total_bars // _BARS_PER_SIGNAL)
+        self._event_file, self._event_writer = _open_event_log(
+            self.params.event_log_path, ('time', 'symbol', 'event')
+        )
+
+    def stop(self):
+        """Write the deferred console log, then flush and close the streamed event log."""
+        self._flush_log()
+        if self._event_file is not None:
+            self._event_file.close()
+            self._event_file = None
     
-    def log(self, txt, dt=None, symbol=None):
-        """Log strategy information with timestamp and optional symbol."""
-        dt = dt or self.datas[0].datetime.datetime(0)
-        symbol_prefix = f"[{symbol}] " if symbol else ""
-        log_message = f"{dt} {symbol_prefix}{txt}"
+    def log(self, txt, *args, dt=None, symbol=None):
+        """
+        Log strategy information with timestamp and optional symbol.
+
+        txt is a str.format template; it is only formatted with args when a
+        log sink accepts the message or the event log is exported. Console
+        output is deferred to _flush_log(), outside of next().
+        """
+        if not self._verbose:
+            return
+        # The first feed's bar time stays in nanoseconds until the event is formatted
+        dt = dt or self._feeds[0][-1][len(self.datas[0]) - 1]
         
-        # Log to console via the logger
-        logger.info(log_message)
+        # Queue for the console log
+        self._log_events.append((dt, symbol, txt, args))
+        if len(self._log_events) >= _LOG_FLUSH_EVENTS:
+            self._flush_log()
         
         # Add to trade events log if it's a trade-related message
         if any(keyword in txt for keyword in ['BUY', 'SELL', 'STOP LOSS', 'TAKE PROFIT', 'TRADE COMPLETED']):
-            self.trade_event_logs.append(log_message)
-        
-        return log_message
+            if self._event_writer is not None:
+                self._event_writer.writerow((_event_datetime(dt).isoformat(), symbol or '', txt.format(*args)))
+            else:
+                self.trade_event_logs.append((dt, symbol, txt, args))
+
+    def _flush_log(self):
+        """Write the deferred console log events through the logger as one message."""
+        events, self._log_events = self._log_events, []
+        if events:
+            # Lazy, so the batch is only formatted when a sink accepts INFO
+            logger.opt(lazy=True).info("{}", lambda: "\n".join(
+                f"{_event_datetime(dt)} {f'[{symbol}] ' if symbol else ''}{txt.format(*args)}"
+                for dt, symbol, txt, args in events
+            ))
+
+    def event_log_lines(self) -> List[str]:
+        """Format the recorded trade events for file logging."""
+        return [
+            f"{_event_datetime(dt)} {f'[{symbol}] ' if symbol else ''}{txt.format(*args)}"
+            for dt, symbol, txt, args in self.trade_event_logs
+        ]
     
     def notify_order(self, order):
         """Handle order status notifications."""
-        # Get the data name (symbol)
-        data = order.data
-        symbol = data._name if hasattr(data, '_name') else 'Unknown'
+        # Feed index and symbol come from the mapping built in __init__
+        feed = self._feed_idx[id(order.data)]
+        symbol = self._symbols[feed]
         
         if order.status in [order.Submitted, order.Accepted]:
             return
             
         if order.status in [order.Completed]:
+            # One lookup of the open trade record, None when the feed is flat
+            current_trade = self.trade_logs[symbol]['current_trade']
             if order.isbuy():
-                self.log(f'BUY EXECUTED, Price: {order.executed.price:.2f}, Size: {order.executed.size:.6f}, Value: ${order.executed.value:.2f}, Comm: ${order.executed.comm:.2f}', symbol=symbol)
-                
-                # Update position tracking
-                self.position_info[symbol]['size'] = order.executed.size
-                self.position_info[symbol]['price'] = order.executed.price
-                self.position_info[symbol]['value'] = order.executed.value
+                self.log('BUY EXECUTED, Price: {:.2f}, Size: {:.6f}, Value: ${:.2f}, Comm: ${:.2f}', order.executed.price, order.executed.size, order.executed.value, order.executed.comm, symbol=symbol)
                 
                 # Update current trade record if it exists
-                if self.trade_logs[symbol].get('current_trade', {}):
-                    self.trade_logs[symbol]['current_trade']['executed_entry_price'] = order.executed.price
-                    self.trade_logs[symbol]['current_trade']['executed_size'] = order.executed.size
-                    self.trade_logs[symbol]['current_trade']['executed_value'] = order.executed.value
-                    self.trade_logs[symbol]['current_trade']['commission'] = order.executed.comm
+                if current_trade is not None:
+                    current_trade.executed_entry_price = order.executed.price
+                    current_trade.executed_size = order.executed.size
+                    current_trade.executed_value = order.executed.value
+                    current_trade.commission = order.executed.comm
                 
             else:  # sell order
                 # Calculate the actual dollar amount received from the sale
                 sell_value = order.executed.price * order.executed.size
-                self.log(f'SELL EXECUTED, Price: {order.executed.price:.2f}, Size: {order.executed.size:.6f}, Value: ${sell_value:.2f}, Comm: ${order.executed.comm:.2f}', symbol=symbol)
-                
-                # Reset position tracking
-                self.position_info[symbol]['size'] = 0
-                self.position_info[symbol]['price'] = 0
-                self.position_info[symbol]['value'] = 0
+                self.log('SELL EXECUTED, Price: {:.2f}, Size: {:.6f}, Value: ${:.2f}, Comm: ${:.2f}', order.executed.price, order.executed.size, sell_value, order.executed.comm, symbol=symbol)
                 
                 # Complete the trade record if it exists
-                if self.trade_logs[symbol].get('current_trade', {}) and 'exit_time' in self.trade_logs[symbol]['current_trade']:
-                    self.trade_logs[symbol]['current_trade']['executed_exit_price'] = order.executed.price
-                    self.trade_logs[symbol]['current_trade']['executed_exit_value'] = sell_value
-                    self.trade_logs[symbol]['current_trade']['exit_commission'] = order.executed.comm
+                if current_trade is not None and current_trade.exit_time is not None:
+                    current_trade.executed_exit_price = order.executed.price
+                    current_trade.executed_exit_value = sell_value
+                    current_trade.exit_commission = order.executed.comm
                     
                     # Calculate realized P&L
-                    entry_value = self.trade_logs[symbol]['current_trade'].get('executed_value', 0)
+                    entry_value = current_trade.executed_value or 0
                     if entry_value > 0:
                         profit_pct = ((sell_value - entry_value) / entry_value) * 100
-                        self.trade_logs[symbol]['current_trade']['realized_profit_pct'] = profit_pct
+                        current_trade.realized_profit_pct = profit_pct
                     
-                    # Add the completed trade to the overall trades list
-                    self.trades.append(self.trade_logs[symbol]['current_trade'].copy())
+                    # Add the completed trade to the overall trades list; the record
+                    # is released below, so it is stored without a copy
+                    self.trades.append(current_trade)
                     
                     # Reset current trade
-                    self.trade_logs[symbol]['current_trade'] = {}
+                    self.trade_logs[symbol]['current_trade'] = None
         
         elif order.status in [order.Canceled, order.Margin, order.Rejected]:
-            self.log(f'Order Canceled/Margin/Rejected: {order.status}', symbol=symbol)
+            self.log('Order Canceled/Margin/Rejected: {}', order.status, symbol=symbol)
         
         # Store the order
-        self.orders[symbol] = None
+        self.orders[feed] = None
     
     def notify_trade(self, trade):
-        """Handle trade completed notifications."""
+        """Handle trade opened/closed notifications."""
+        if trade.justopened:
+            # A closed trade reports a value of 0, so keep the opening value for the P&L %
+            self._trade_open_value[trade.ref] = abs(trade.value)
+            return
         if not trade.isclosed:
             return
         
-        # Get the data name (symbol)
-        data = trade.data
-        symbol = data._name if hasattr(data, '_name') else 'Unknown'
-        
-        self.log(f'TRADE COMPLETED, Gross: {trade.pnl:.2f}, Net: {trade.pnlcomm:.2f}', symbol=symbol)
-        
-        # Add trade P&L data
-        if trade.value != 0:  # Avoid division by zero
-            pnl_pct = (trade.pnlcomm / abs(trade.value)) * 100
-            self.trades.append({
-                'symbol': symbol,
-                'pnl_pct': pnl_pct,
-                'net_pnl': trade.pnlcomm,
-                'entry_time': getattr(trade, 'entry_time', None),
-                'exit_time': getattr(trade, 'exit_time', None)
-            })
-        else:
-            self.trades.append({
-                'symbol': symbol,
-                'pnl_pct': 0,
-                'net_pnl': trade.pnlcomm,
-                'entry_time': getattr(trade, 'entry_time', None),
-                'exit_time': getattr(trade, 'exit_time', None)
-            })
+        feed = self._feed_idx[id(trade.data)]
+        symbol = self._symbols[feed]
+        self._tiers[feed] = None
+        
+        self.log('TRADE COMPLETED, Gross: {:.2f}, Net: {:.2f}', trade.pnl, trade.pnlcomm, symbol=symbol)
+        
+        # P&L goes to its own list, the trade record itself is stored by notify_order
+        open_value = self._trade_open_value.pop(trade.ref, 0)
+        self.trade_pnls.append({
+            'symbol': symbol,
+            'pnl_pct': (trade.pnlcomm / open_value) * 100 if open_value else 0,
+            'net_pnl': trade.pnlcomm,
+            'entry_time': bt.num2date(trade.dtopen),
+            'exit_time': bt.num2date(trade.dtclose)
+        })
     
     def next(self):
         """Strategy logic executed on each bar for all data feeds."""
         # Process each data feed (symbol)
-        for i, data in enumerate(self.datas):
-            # Get the symbol name
-            symbol = data._name if hasattr(data, '_name') else f'Data{i}'
-            
+        for i, (data, symbol, position, close_arr, entry_arr, upper_arr, middle_arr, lower_arr, rsi_arr, bar_ns_arr) in enumerate(self._feeds):
             # Skip if an order is pending
-            if self.orders[symbol]:
+            if self.orders[i]:
                 continue
-                
+            
+            # Index of the feed's current bar in its precomputed arrays; a feed
+            # without a bar at this time keeps its last index, like data.close[0]
+            idx = len(data) - 1
+            
             # Skip if in cool-down period
-            current_time = data.datetime.datetime(0)
-            if (self.params.cool_down_hours > 0 or self.params.cool_down_minutes > 0) and self.last_trade_time[symbol] != datetime.min:
-                if (current_time - self.last_trade_time[symbol]) < timedelta(hours=self.params.cool_down_hours, minutes=self.params.cool_down_minutes):
-                    continue
+            bar_ns = bar_ns_arr[idx]
+            if bar_ns < self._cool_down_end_ns[i]:
+                continue
             
-            # Get indicators for this symbol
-            bb = self.indicators[symbol]['bband']
-            rsi = self.indicators[symbol]['rsi']
+            close = close_arr[idx]
             
-            # Check for buy signal
-            if (data.close[0] <= bb.lines.bot[0] and 
-                rsi[0] < self.params.rsi_oversold and 
-                not self.getposition(data).size):  # Check if we don't have a position
+            # Check for buy signal if we don't have a position; the indicators
+            # are only read on bars where the precomputed entry signal fires
+            if not position.size:
+                if not entry_arr[idx]:
+                    continue
+                bb_lower = lower_arr[idx]
+                rsi_value = rsi_arr[idx]
+                bb_upper = upper_arr[idx]
+                bb_middle = middle_arr[idx]
+                
+                # The bar's time is only built on bars that place an order
+                current_time = np.datetime64(int(bar_ns), 'ns')
                 
                 # Calculate position size based on equity percentage
                 # The idea is to allocate a fixed percentage of the total equity to each symbol
                 # Koristimo total portfolio value koji već uključuje i cash i vrednost svih pozicija
                 equity = self.broker.getvalue()
-                size = equity * self.params.position_size_pct / data.close[0]
-                
-                # Store detailed indicator values
-                bb_upper = bb.lines.top[0]
-                bb_middle = bb.lines.mid[0]
-                bb_lower = bb.lines.bot[0]
-                rsi_value = rsi[0]
+                size = equity * self._position_size_pct / close
                 
                 # Log buy signal
-                self.log(f'BUY CREATE, Price: {data.close[0]:.2f}, Size: {size:.6f}, Value: ${data.close[0] * size:.2f}, RSI: {rsi_value:.2f}, BB Lower: {bb_lower:.2f}', symbol=symbol)
+                self.log('BUY CREATE, Price: {:.2f}, Size: {:.6f}, Value: ${:.2f}, RSI: {:.2f}, BB Lower: {:.2f}', close, size, close * size, rsi_value, bb_lower, symbol=symbol)
                 
                 # Create buy order
-                self.orders[symbol] = self.buy(data=data, size=size)
+                self.orders[i] = self.buy(data=data, size=size)
                 
                 # Record signal data
-                signal_data = {
-                    'time': current_time,
-                    'price': data.close[0],
-                    'action': 'BUY',
-                    'bb_upper': bb_upper,
-                    'bb_middle': bb_middle,
-                    'bb_lower': bb_lower,
-                    'rsi': rsi_value,
-                    'size': size
-                }
-                self.buy_signals.append(signal_data)
-                self.trade_logs[symbol]['buy_signals'].append(signal_data)
+                self.buy_signals.append(
+                    time=current_time,
+                    symbol=i,
+                    price=close,
+                    bb_upper=bb_upper,
+                    bb_middle=bb_middle,
+                    bb_lower=bb_lower,
+                    rsi=rsi_value,
+                    size=size
+                )
                 
                 # Start a new trade record
-                self.trade_logs[symbol]['current_trade'] = {
-                    'symbol': symbol,
-                    'entry_time': current_time,
-                    'entry_price': data.close[0],
-                    'entry_indicators': {
+                self.trade_logs[symbol]['current_trade'] = TradeRecord(
+                    symbol=symbol,
+                    entry_time=current_time,
+                    entry_price=close,
+                    entry_indicators={
                         'bb_upper': bb_upper,
                         'bb_middle': bb_middle,
                         'bb_lower': bb_lower,
                         'rsi': rsi_value
                     },
-                    'size': size
-                }
+                    size=size
+                )
                 
                 # Update last trade time
                 self.last_trade_time[symbol] = current_time
+                self._cool_down_end_ns[i] = bar_ns + self._cool_down_ns
             
             # Check for sell signals if we have a position
-            elif self.getposition(data).size > 0:  # We have a position in this symbol
-                position = self.getposition(data)
-                bb_upper = bb.lines.top[0]
-                bb_middle = bb.lines.mid[0]
-                bb_lower = bb.lines.bot[0]
-                rsi_value = rsi[0]
+            elif position.size > 0:  # We have a position in this symbol
+                # Start tracking the profit tiers on the first bar of a new position
+                position_tracker = self._tiers[i]
+                if position_tracker is None:
+                    position_tracker = self._tiers[i] = PosTracker.open(self, position.price, position.size)
                 
-                # Initialize profit tiers tracker for this position if it doesn't exist
-                # Use a combination of symbol, date and position price as the key
-                position_key = f"{symbol}-{current_time.date()}-{position.price}"
-                if position_key not in self.profit_tiers_hit:
-                    self.profit_tiers_hit[position_key] = {
-                        'tier1': False,
-                        'tier2': False,
-                        'tier3': False,
-                        'original_size': position.size
-                    }
+                # The exit decision only needs the close, the indicators are read for the record
+                exit_action = position_tracker.decide(close)
+                if exit_action == EXIT_NONE:
+                    continue
                 
-                position_tracker = self.profit_tiers_hit[position_key]
-                original_size = position_tracker['original_size']
+                indicators = {
+                    'bb_upper': upper_arr[idx],
+                    'bb_middle': middle_arr[idx],
+                    'bb_lower': lower_arr[idx],
+                    'rsi': rsi_arr[idx]
+                }
+                current_time = np.datetime64(int(bar_ns), 'ns')
                 
-                # Check for tier 3 (highest) if not already hit
-                if not position_tracker['tier3'] and data.close[0] >= position.price * (1 + self.params.take_profit_tier3_pct):
-                    tier3_size = original_size * self.params.take_profit_tier3_size_pct
-                    if tier3_size > position.size:
-                        tier3_size = position.size  # Ensure we don't sell more than we have
-                        
-                    profit_pct = (data.close[0] / position.price - 1) * 100
-                    self.log(f'TAKE PROFIT TIER 3 (FINAL), Price: {data.close[0]:.2f}, Size: {tier3_size:.6f}, Profit: {profit_pct:.2f}%, RSI: {rsi_value:.2f}', symbol=symbol)
-                    
-                    # Create sell order for tier 3
-                    self.orders[symbol] = self.sell(data=data, size=tier3_size)
-                    position_tracker['tier3'] = True
-                    
-                    # Record signal data
-                    signal_data = {
-                        'time': current_time,
-                        'price': data.close[0],
-                        'action': 'SELL',
-                        'reason': 'TAKE_PROFIT_TIER3',
-                        'profit_pct': profit_pct,
-                        'position_pct': self.params.take_profit_tier3_size_pct * 100,
-                        'size': tier3_size,
-                        'bb_upper': bb_upper,
-                        'bb_middle': bb_middle,
-                        'bb_lower': bb_lower,
-                        'rsi': rsi_value
-                    }
-                    self.sell_signals.append(signal_data)
-                    self.trade_logs[symbol]['sell_signals'].append(signal_data)
-                    
-                    # Complete the trade record
-                    if 'exit_time' not in self.trade_logs[symbol]['current_trade']:
-                        self.trade_logs[symbol]['current_trade'].update({
-                            'exit_time': current_time,
-                            'exit_price': data.close[0],
-                            'exit_indicators': {
-                                'bb_upper': bb_upper,
-                                'bb_middle': bb_middle,
-                                'bb_lower': bb_lower,
-                                'rsi': rsi_value
-                            },
-                            'profit_pct': profit_pct,
-                            'exit_reason': 'TAKE_PROFIT_TIER3',
-                            'position_pct_closed': self.params.take_profit_tier3_size_pct * 100
-                        })
-                    
-                    # Update last trade time
-                    self.last_trade_time[symbol] = current_time
+                # Take profit at the highest tier reached that hasn't been hit yet, or stop out
+                self._exit_position(i, exit_action, position, position_tracker, close, current_time, indicators)
                 
-                # Check for tier 2 if not already hit
-                elif not position_tracker['tier2'] and data.close[0] >= position.price * (1 + self.params.take_profit_tier2_pct):
-                    tier2_size = original_size * self.params.take_profit_tier2_size_pct
-                    if tier2_size > position.size:
-                        tier2_size = position.size  # Ensure we don't sell more than we have
-                        
-                    profit_pct = (data.close[0] / position.price - 1) * 100
-                    self.log(f'TAKE PROFIT TIER 2, Price: {data.close[0]:.2f}, Size: {tier2_size:.6f}, Profit: {profit_pct:.2f}%, RSI: {rsi_value:.2f}', symbol=symbol)
-                    
-                    # Create sell order for tier 2
-                    self.orders[symbol] = self.sell(data=data, size=tier2_size)
-                    position_tracker['tier2'] = True
-                    
-                    # Record signal data
-                    signal_data = {
-                        'time': current_time,
-                        'price': data.close[0],
-                        'action': 'SELL',
-                        'reason': 'TAKE_PROFIT_TIER2',
-                        'profit_pct': profit_pct,
-                        'position_pct': self.params.take_profit_tier2_size_pct * 100,
-                        'size': tier2_size,
-                        'bb_upper': bb_upper,
-                        'bb_middle': bb_middle,
-                        'bb_lower': bb_lower,
-                        'rsi': rsi_value
-                    }
-                    self.sell_signals.append(signal_data)
-                    self.trade_logs[symbol]['sell_signals'].append(signal_data)
-                    
-                    # Complete the trade record
-                    if 'exit_time' not in self.trade_logs[symbol]['current_trade']:
-                        self.trade_logs[symbol]['current_trade'].update({
-                            'exit_time': current_time,
-                            'exit_price': data.close[0],
-                            'exit_indicators': {
-                                'bb_upper': bb_upper,
-                                'bb_middle': bb_middle,
-                                'bb_lower': bb_lower,
-                                'rsi': rsi_value
-                            },
-                            'profit_pct': profit_pct,
-                            'exit_reason': 'TAKE_PROFIT_TIER2',
-                            'position_pct_closed': self.params.take_profit_tier2_size_pct * 100
-                        })
-                    
-                    # Update last trade time
-                    self.last_trade_time[symbol] = current_time
-                
-                # Check for tier 1 if not already hit
-                elif not position_tracker['tier1'] and data.close[0] >= position.price * (1 + self.params.take_profit_tier1_pct):
-                    tier1_size = original_size * self.params.take_profit_tier1_size_pct
-                    if tier1_size > position.size:
-                        tier1_size = position.size  # Ensure we don't sell more than we have
-                        
-                    profit_pct = (data.close[0] / position.price - 1) * 100
-                    self.log(f'TAKE PROFIT TIER 1, Price: {data.close[0]:.2f}, Size: {tier1_size:.6f}, Profit: {profit_pct:.2f}%, RSI: {rsi_value:.2f}', symbol=symbol)
-                    
-                    # Create sell order for tier 1
-                    self.orders[symbol] = self.sell(data=data, size=tier1_size)
-                    position_tracker['tier1'] = True
-                    
-                    # Record signal data
-                    signal_data = {
-                        'time': current_time,
-                        'price': data.close[0],
-                        'action': 'SELL',
-                        'reason': 'TAKE_PROFIT',
-                        'profit_pct': profit_pct,
-                        'bb_upper': bb_upper,
-                        'bb_middle': bb_middle,
-                        'bb_lower': bb_lower,
-                        'rsi': rsi_value
-                    }
-                    self.sell_signals.append(signal_data)
-                    self.trade_logs[symbol]['sell_signals'].append(signal_data)
-                    
-                    # Complete the trade record
-                    if 'exit_time' not in self.trade_logs[symbol]['current_trade']:
-                        self.trade_logs[symbol]['current_trade'].update({
-                            'exit_time': current_time,
-                            'exit_price': data.close[0],
-                            'exit_indicators': {
-                                'bb_upper': bb_upper,
-                                'bb_middle': bb_middle,
-                                'bb_lower': bb_lower,
-                                'rsi': rsi_value
-                            },
-                            'profit_pct': profit_pct,
-                            'exit_reason': 'TAKE_PROFIT'
-                        })
-                    
-                    # Update last trade time
-                    self.last_trade_time[symbol] = current_time
-                
-                # Stop loss condition
-                elif data.close[0] < position.price * (1 - self.params.stop_loss_pct):
-                    loss_pct = (1 - data.close[0] / position.price) * 100
-                    
-                    # Log stop loss signal
-                    self.log(f'STOP LOSS, Price: {data.close[0]:.2f}, Size: {position.size:.6f}, Loss: {loss_pct:.2f}%, RSI: {rsi_value:.2f}', symbol=symbol)
-                    
-                    # Create sell order
-                    self.orders[symbol] = self.sell(data=data, size=position.size)
-                    
-                    # Record signal data
-                    signal_data = {
-                        'time': current_time,
-                        'price': data.close[0],
-                        'action': 'SELL',
-                        'reason': 'STOP_LOSS',
-                        'loss_pct': loss_pct,
-                        'bb_upper': bb_upper,
-                        'bb_middle': bb_middle,
-                        'bb_lower': bb_lower,
-                        'rsi': rsi_value
-                    }
-                    self.sell_signals.append(signal_data)
-                    self.trade_logs[symbol]['sell_signals'].append(signal_data)
-                    
-                    # Complete the trade record
-                    if 'exit_time' not in self.trade_logs[symbol]['current_trade']:
-                        self.trade_logs[symbol]['current_trade'].update({
-                            'exit_time': current_time,
-                            'exit_price': data.close[0],
-                            'exit_indicators': {
-                                'bb_upper': bb_upper,
-                                'bb_middle': bb_middle,
-                                'bb_lower': bb_lower,
-                                'rsi': rsi_value
-                            },
-                            'loss_pct': loss_pct,
-                            'exit_reason': 'STOP_LOSS'
-                        })
-                    
-                    # Update last trade time
-                    self.last_trade_time[symbol] = current_time
+                # Every exit starts the cool-down
+                self.last_trade_time[symbol] = current_time
+                self._cool_down_end_ns[i] = bar_ns + self._cool_down_ns
+
+    def _exit_position(self, i, action, position, position_tracker, close, current_time, indicators):
+        """Sell one take-profit tier of feed i's position, or all of it on a stop loss, and complete its trade record."""
+        data, symbol = self._feeds[i][:2]
+        if action == EXIT_STOP_LOSS:
+            # Sell the entire position, the P&L is reported as a positive loss
+            size = position.size
+            pct_field, pct = 'loss_pct', (1 - close / position.price) * 100
+            tier_fields = {}
+        else:
+            size_pct = self._tier_size_pcts[action]
+            size = min(position_tracker.take(action), position.size)  # Don't sell more than we have
+            pct_field, pct = 'profit_pct', (close / position.price - 1) * 100
+            tier_fields = {'position_pct': size_pct * 100, 'size': size}
+        self.log(_EXIT_LOG[action], close, size, pct, indicators['rsi'], symbol=symbol)
+        
+        # Create the sell order
+        self.orders[i] = self.sell(data=data, size=size)
+        
+        # Record signal data
+        self.sell_signals.append(
+            time=current_time,
+            symbol=i,
+            price=close,
+            reason=action,
+            **{pct_field: pct},
+            **tier_fields,
+            **indicators
+        )
+        
+        # Complete the trade record
+        current_trade = self.trade_logs[symbol]['current_trade']
+        if current_trade is not None and current_trade.exit_time is None:
+            closed_fields = {'position_pct_closed': tier_fields['position_pct']} if tier_fields else {}
+            current_trade.update(
+                exit_time=current_time,
+                exit_price=close,
+                exit_indicators=dict(indicators),
+                exit_reason=EXIT_REASONS[action],
+                **{pct_field: pct},
+                **closed_fields
+            )
 
 
 class BacktestHarness:
@@ -892,12 +1250,51 @@ class BacktestHarness:
         self.json_logs_dir = os.path.join(self.performances_dir, "detailed_logs")
         self.csv_log_path = os.path.join(self.performances_dir, "backtest_summary.csv")
 
+        # Stream trade events to CSV during the run instead of holding them for the JSON log
+        self.stream_event_logs = config.get('backtest', {}).get('stream_event_logs', False)
+        # Log trades and trade events with each run, off leaves only the summary
+        self.detailed_logs = config.get('backtest', {}).get('detailed_logs', True)
+        # Write trades and trade events as JSON Lines next to a summary-only JSON log
+        self.jsonl_logs = config.get('backtest', {}).get('jsonl_logs', False)
+        # Run single-symbol backtests with the array simulation instead of Cerebro
+        self.vectorized = config.get('backtest', {}).get('vectorized', False)
+        # Summary CSV rows waiting for flush_csv(), guarded by the lock
+        self._pending_csv_rows: List[Dict] = []
+        self._csv_fieldnames: Optional[List[str]] = None  # Summary CSV column order, fixed by the first flush
+        self._csv_lock = threading.Lock()
+        _open_harnesses.add(self)
+        self._params_cache: Dict[Tuple, Tuple] = {}  # Parsed strategy parameters, see _mean_reversion_params()
+        # JSON logs are written on the shared background thread, flush_logs() waits for them
+        self._log_futures = []
+
         # Create directories if they don't exist
         os.makedirs(self.performances_dir, exist_ok=True)
         os.makedirs(self.json_logs_dir, exist_ok=True)
 
+    def _run_id(self) -> str:
+        """
+        Return a unique id for a run, used in its log file names.
+
+        The process id and a process-wide counter keep runs started in the same
+        microsecond, by any harness or in parallel worker processes, from
+        sharing log files.
+        """
+        return f"{datetime.now():%Y%m%d_%H%M%S_%f}_{os.getpid():x}_{next(_run_counter)}"
+
+    def _event_log_path(self, log_basename: str) -> Optional[str]:
+        """Return the CSV path trade events are streamed to, or None to keep them in the JSON log."""
+        if not self.stream_event_logs:
+            return None
+        return os.path.join(self.json_logs_dir, f"{log_basename}_events.csv")
+
+    def _records_log_path(self, log_basename: str) -> Optional[str]:
+        """Return the JSON Lines path for trades and trade events, or None to keep them in the JSON log."""
+        if not self.jsonl_logs:
+            return None
+        return os.path.join(self.json_logs_dir, f"{log_basename}_trades.jsonl")
+
+    @staticmethod
     def prepare_data(
-        self, 
         df: pd.DataFrame,
         datetime_col: str = 'timestamp'
     ) -> bt.feeds.PandasData:
@@ -922,8 +1319,13 @@ class BacktestHarness:
                 logger.error(f"Missing required column: {col}")
                 return None
         
-        # Create backtrader data feed
-        data = bt.feeds.PandasData(
+        # Keep only what the feed reads. Prices stay float64 since backtrader's
+        # lines are doubles anyway, volume is informational so float32 is enough.
+        df = df[[datetime_col, *required_columns]].astype({'volume': 'float32'})
+        
+        # Create backtrader data feed; _ArrayPandasData reads the columns as
+        # arrays instead of one DataFrame.iloc lookup per field and bar
+        data = _ArrayPandasData(
             dataname=df,
             datetime=df.columns.get_loc(datetime_col),
             open=df.columns.get_loc('open'),
@@ -942,138 +1344,81 @@ class BacktestHarness:
         interval: str, # Added interval
         data: Union[pd.DataFrame, bt.feeds.PandasData],
         initial_cash: float = 10000.0,
-        commission: float = 0.001  # 0.1% taker fee
-    ) -> Tuple[bt.Strategy, Dict]:
+        commission: float = 0.001,  # 0.1% taker fee
+        write_summary: bool = True
+    ) -> Tuple[Union[bt.Strategy, VectorizedBacktest], Dict]:
         """
         Run backtest with mean reversion strategy.
         
+        DataFrame input goes through vectorized_run() instead of Cerebro when
+        backtest.vectorized is set in the config.
+        
         Args:
             symbol: Symbol of the asset
             interval: Interval of the data
             data: DataFrame with OHLCV data or backtrader data feed
             initial_cash: Initial account balance
             commission: Commission rate
+            write_summary: Queue the metrics for the summary CSV, see flush_csv()
             
         Returns:
-            Tuple of (strategy instance, metrics dictionary)
+            Tuple of (strategy instance or VectorizedBacktest, metrics dictionary)
         """
-        # Create cerebro instance
-        cerebro = bt.Cerebro()
+        strategy_params = self._mean_reversion_params()
+        
+        run_timestamp = self._run_id()
+        # Sanitize symbol for filename
+        safe_symbol = symbol.replace("/", "_") 
+        log_basename = f"backtest_{safe_symbol}_{interval}_{run_timestamp}"
         
-        # Add data
-        if isinstance(data, pd.DataFrame):
-            data_feed = self.prepare_data(data)
-            if data_feed is None:
+        if self.vectorized and isinstance(data, pd.DataFrame):
+            # Single-symbol runs don't need Cerebro's per-bar loop, see vectorized_run()
+            logger.info(f"Starting vectorized backtest for {symbol} ({interval}) with params: {strategy_params}...")
+            event_log_path = None
+            strategy, summary_metrics = self.vectorized_run(data, strategy_params, initial_cash, commission)
+            if strategy is None:
                 logger.error(f"Failed to prepare data for backtesting {symbol} {interval}")
                 return None, {}
-            cerebro.adddata(data_feed)
-        else:
-            cerebro.adddata(data)
-        
-        # Set strategy parameters
-        strategy_params = {
-            'bb_length': self.bb_config.get('length', 20),
-            'bb_std': self.bb_config.get('std', 2.0),
-            'rsi_length': self.rsi_config.get('length', 14),
-            'rsi_oversold': self.rsi_config.get('oversold', 30),
-            'rsi_overbought': self.rsi_config.get('overbought', 70),
-        }
-        
-        # Get take profit configuration
-        take_profit_config = self.risk_config.get('take_profit', {})
-        
-        # If take_profit is a nested dictionary, use those values
-        if isinstance(take_profit_config, dict) and take_profit_config:
-            take_profit_tier1_pct = take_profit_config.get('tier1_pct', 0.02)
-            take_profit_tier2_pct = take_profit_config.get('tier2_pct', 0.03)
-            take_profit_tier3_pct = take_profit_config.get('tier3_pct', 0.04)
-            take_profit_tier1_size_pct = take_profit_config.get('tier1_size_pct', 0.33)
-            take_profit_tier2_size_pct = take_profit_config.get('tier2_size_pct', 0.33)
-            take_profit_tier3_size_pct = take_profit_config.get('tier3_size_pct', 0.34)
         else:
-            # Backward compatibility for old config format with single take_profit_pct
-            take_profit_pct = self.risk_config.get('take_profit_pct', 0.04)
-            take_profit_tier1_pct = 0.02
-            take_profit_tier2_pct = 0.03
-            take_profit_tier3_pct = take_profit_pct
-            take_profit_tier1_size_pct = 0.33
-            take_profit_tier2_size_pct = 0.33
-            take_profit_tier3_size_pct = 0.34
+            # Create cerebro instance
+            cerebro = bt.Cerebro(**_CEREBRO_OPTIONS)
             
-        stop_loss_pct = self.risk_config.get('stop_loss_pct', 0.02)
-        position_size_pct = self.risk_config.get('position_size_pct', 0.01)
-        
-        strategy_params.update({
-            'take_profit_tier1_pct': take_profit_tier1_pct,
-            'take_profit_tier2_pct': take_profit_tier2_pct,
-            'take_profit_tier3_pct': take_profit_tier3_pct,
-            'take_profit_tier1_size_pct': take_profit_tier1_size_pct,
-            'take_profit_tier2_size_pct': take_profit_tier2_size_pct,
-            'take_profit_tier3_size_pct': take_profit_tier3_size_pct,
-            'stop_loss_pct': stop_loss_pct,
-            'position_size_pct': position_size_pct,
-            'cool_down_hours': 0,
-            'cool_down_minutes': 0
-        })
-        
-        # Parse cool_down parameter
-        cool_down_value = self.cool_down.get('hours', 4)
-        if isinstance(cool_down_value, str):
-            if cool_down_value.endswith('m'):
-                try:
-                    strategy_params['cool_down_minutes'] = int(cool_down_value.rstrip('m'))
-                    logger.info(f"Cool-down set to {strategy_params['cool_down_minutes']} minutes")
-                except ValueError:
-                    logger.error(f"Invalid cool_down format: {cool_down_value}, using default 4 hours")
-                    strategy_params['cool_down_hours'] = 4
-            elif cool_down_value.endswith('h'):
-                try:
-                    strategy_params['cool_down_hours'] = int(cool_down_value.rstrip('h'))
-                    logger.info(f"Cool-down set to {strategy_params['cool_down_hours']} hours")
-                except ValueError:
-                    logger.error(f"Invalid cool_down format: {cool_down_value}, using default 4 hours")
-                    strategy_params['cool_down_hours'] = 4
+            # Add data
+            if isinstance(data, pd.DataFrame):
+                data_feed = self.prepare_data(data)
+                if data_feed is None:
+                    logger.error(f"Failed to prepare data for backtesting {symbol} {interval}")
+                    return None, {}
+                cerebro.adddata(data_feed)
             else:
-                try:
-                    # Assume hours if no unit is specified
-                    strategy_params['cool_down_hours'] = float(cool_down_value)
-                    logger.info(f"Cool-down set to {strategy_params['cool_down_hours']} hours")
-                except ValueError:
-                    logger.error(f"Invalid cool_down format: {cool_down_value}, using default 4 hours")
-                    strategy_params['cool_down_hours'] = 4
-        else:
-            # If a numeric value, assume it's hours
-            strategy_params['cool_down_hours'] = float(cool_down_value)
+                cerebro.adddata(data)
+            
+            event_log_path = self._event_log_path(log_basename)
+            
+            # Add strategy
+            cerebro.addstrategy(MeanReversionBT, event_log_path=event_log_path, **strategy_params)
         
-        # Add strategy
-        cerebro.addstrategy(MeanReversionBT, **strategy_params)
+            # Set broker parameters
+            cerebro.broker.setcash(initial_cash)
+            cerebro.broker.setcommission(commission=commission)
         
-        # Set broker parameters
-        cerebro.broker.setcash(initial_cash)
-        cerebro.broker.setcommission(commission=commission)
+            # Add analyzers
+            for analyzer, kwargs in _ANALYZERS:
+                cerebro.addanalyzer(analyzer, **kwargs)
         
-        # Add analyzers
-        cerebro.addanalyzer(bt.analyzers.SharpeRatio, _name='sharpe', riskfreerate=0.0)
-        cerebro.addanalyzer(bt.analyzers.Returns, _name='returns')
-        cerebro.addanalyzer(bt.analyzers.DrawDown, _name='drawdown')
-        cerebro.addanalyzer(bt.analyzers.TradeAnalyzer, _name='trades')
+            # Run backtest
+            logger.info(f"Starting backtest for {symbol} ({interval}) with params: {strategy_params}...")
+            results = cerebro.run()
+            strategy = results[0]
         
-        # Run backtest
-        logger.info(f"Starting backtest for {symbol} ({interval}) with params: {strategy_params}...")
-        results = cerebro.run()
-        strategy = results[0]
+            # Calculate metrics
+            summary_metrics = self._calculate_metrics(strategy, initial_cash)
         
-        # Calculate metrics
-        summary_metrics = self._calculate_metrics(strategy, initial_cash)
-        
-        logger.info(f"Backtest for {symbol} ({interval}) completed. Final portfolio value: ${cerebro.broker.getvalue():.2f}")
+        logger.info(f"Backtest for {symbol} ({interval}) completed. Final portfolio value: ${summary_metrics.get('final_value', initial_cash):.2f}")
         logger.info(f"Metrics for {symbol} ({interval}): {summary_metrics}")
 
         # --- Logging to files ---
-        run_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-        # Sanitize symbol for filename
-        safe_symbol = symbol.replace("/", "_") 
-        json_filename = f"backtest_{safe_symbol}_{interval}_{run_timestamp}.json"
+        json_filename = f"{log_basename}.json"
         json_filepath = os.path.join(self.json_logs_dir, json_filename)
 
         input_parameters_log = {
@@ -1087,17 +1432,39 @@ class BacktestHarness:
         log_data_for_json = {
             "run_timestamp": run_timestamp,
             "input_parameters": input_parameters_log,
-            "detailed_trade_events": strategy.trade_event_logs if hasattr(strategy, 'trade_event_logs') else [],
             "summary_metrics": summary_metrics
         }
+        records_path = self._records_log_path(log_basename) if self.detailed_logs else None
+        if event_log_path is not None:
+            log_data_for_json["detailed_trade_events_file"] = event_log_path
+        elif records_path is not None:
+            log_data_for_json["trade_records_file"] = records_path
+        elif self.detailed_logs:
+            log_data_for_json["detailed_trade_events"] = strategy.event_log_lines()
 
-        try:
-            with open(json_filepath, 'w') as f_json:
-                json.dump(log_data_for_json, f_json, indent=4)
-            logger.info(f"Detailed log saved to {json_filepath}")
-        except Exception as e:
-            logger.error(f"Failed to save JSON log to {json_filepath}: {e}")
+        if records_path is not None and event_log_path is None:
+            records = [{'record': 'event', 'symbol': symbol, 'event': event} for event in strategy.event_log_lines()]
+            self._submit_log(json_filepath, log_data_for_json, records_path, records)
+        else:
+            self._submit_log(json_filepath, log_data_for_json)
+
+        if write_summary:
+            self._append_summary(input_parameters_log, summary_metrics)
+        # --- End Logging to files ---
+        
+        return strategy, summary_metrics
 
+    def _append_summary(self, input_parameters_log: Dict, summary_metrics: Dict) -> None:
+        """
+        Queue one backtest's parameters and metrics for the summary CSV.
+        
+        Rows are written by flush_csv() once _CSV_FLUSH_ROWS are queued, and
+        at interpreter exit.
+        
+        Args:
+            input_parameters_log: Backtest input parameters
+            summary_metrics: Metrics returned by the backtest
+        """
         # Prepare data for CSV
         csv_row = {**input_parameters_log, **summary_metrics}
         # Flatten any nested dicts in metrics for CSV, e.g. if Sharpe was a dict
@@ -1111,19 +1478,443 @@ class BacktestHarness:
             else:
                 flat_csv_row[k] = v
         
-        try:
-            file_exists = os.path.isfile(self.csv_log_path)
-            with open(self.csv_log_path, 'a', newline='') as f_csv:
-                writer = csv.DictWriter(f_csv, fieldnames=sorted(flat_csv_row.keys())) # Sort keys for consistent order
-                if not file_exists or os.path.getsize(self.csv_log_path) == 0:
-                    writer.writeheader()
-                writer.writerow(flat_csv_row)
-            logger.info(f"Summary appended to {self.csv_log_path}")
-        except Exception as e:
-            logger.error(f"Failed to append to CSV log {self.csv_log_path}: {e}")
-        # --- End Logging to files ---
+        with self._csv_lock:
+            self._pending_csv_rows.append(flat_csv_row)
+            pending = len(self._pending_csv_rows)
+        if pending >= _CSV_FLUSH_ROWS:
+            self.flush_csv()
+
+    def _submit_log(
+        self,
+        json_filepath: str,
+        log_data: Dict,
+        records_path: Optional[str] = None,
+        records: Iterable[Dict] = ()
+    ) -> None:
+        """Queue a run's log files for the background writer, see _write_run_logs()."""
+        self._log_futures = [future for future in self._log_futures if not future.done()]
+        self._log_futures.append(
+            _get_log_writer().submit(_write_run_logs, json_filepath, log_data, records_path, records)
+        )
+
+    def flush_logs(self) -> None:
+        """Wait until every queued JSON log has been written."""
+        wait(self._log_futures)
+        self._log_futures = []
+
+    def flush_csv(self) -> None:
+        """Append the queued summary rows to the summary CSV in a single write."""
+        with self._csv_lock:
+            rows, self._pending_csv_rows = self._pending_csv_rows, []
+            if not rows:
+                return
+            try:
+                write_header = not os.path.isfile(self.csv_log_path) or os.path.getsize(self.csv_log_path) == 0
+                summary = pd.DataFrame(rows)
+                if self._csv_fieldnames is None:
+                    if write_header:
+                        self._csv_fieldnames = sorted(summary.columns)  # Sort keys for consistent order
+                    else:
+                        # Appending to an earlier session's file, keep its column order
+                        self._csv_fieldnames = list(pd.read_csv(self.csv_log_path, nrows=0).columns)
+                dropped = set(summary.columns) - set(self._csv_fieldnames)
+                if dropped:
+                    logger.warning(f"Columns missing from the {self.csv_log_path} header were not written: {sorted(dropped)}")
+                summary = summary.reindex(columns=self._csv_fieldnames)
+                summary.to_csv(self.csv_log_path, mode='a', header=write_header, index=False)
+                logger.info(f"{len(rows)} summary row(s) appended to {self.csv_log_path}")
+            except Exception as e:
+                logger.error(f"Failed to append to CSV log {self.csv_log_path}: {e}")
+
+    def run_backtests_parallel(
+        self,
+        jobs: List[Tuple[str, str, pd.DataFrame]],
+        initial_cash: float = 10000.0,
+        commission: float = 0.001,
+        max_workers: Optional[int] = None
+    ) -> Dict[Tuple[str, str], Dict]:
+        """
+        Run independent single-symbol backtests in worker processes.
         
-        return strategy, summary_metrics
+        Each worker runs run_backtest() and writes its own JSON log; the
+        summary CSV rows are queued here as runs finish and written together
+        once all of them are done.
+        
+        Args:
+            jobs: List of (symbol, interval, OHLCV DataFrame) tuples
+            initial_cash: Initial account balance of each backtest
+            commission: Commission rate
+            max_workers: Number of worker processes, backtest.max_workers or the CPU count when None
+            
+        Returns:
+            Dictionary mapping (symbol, interval) to the backtest metrics
+        """
+        if max_workers is None:
+            max_workers = self.config.get('backtest', {}).get('max_workers') or os.cpu_count()
+        
+        results = {}
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_run_backtest_worker, self.config, symbol, interval, df, initial_cash, commission): (symbol, interval)
+                for symbol, interval, df in jobs
+            }
+            for future in as_completed(futures):
+                symbol, interval = futures[future]
+                try:
+                    input_parameters_log, summary_metrics = future.result()
+                except Exception as e:
+                    logger.error(f"Backtest for {symbol} ({interval}) failed: {e}")
+                    continue
+                if summary_metrics:
+                    self._append_summary(input_parameters_log, summary_metrics)
+                results[(symbol, interval)] = summary_metrics
+        
+        self.flush_csv()
+        return results
+
+    def _mean_reversion_params(self, default_position_size_pct: float = 0.01) -> Dict:
+        """
+        Build the MeanReversionBT parameters from the configuration.
+        
+        The result is cached per set of config sections, so repeated runs
+        don't parse the take-profit and cool-down settings again.
+        
+        Args:
+            default_position_size_pct: Position size used when the config has none
+            
+        Returns:
+            Dictionary of strategy parameters, a copy the caller may modify
+        """
+        sections = (self.bb_config, self.rsi_config, self.risk_config, self.cool_down)
+        key = (*map(id, sections), default_position_size_pct)
+        cached = self._params_cache.get(key)
+        if cached is None:
+            # Keep the sections alive with the entry, so their ids can't be reused
+            cached = self._params_cache[key] = (sections, self._parse_mean_reversion_params(default_position_size_pct))
+        return dict(cached[1])
+
+    def _parse_mean_reversion_params(self, default_position_size_pct: float) -> Dict:
+        """Parse the MeanReversionBT parameters out of the config sections."""
+        bb_config, rsi_config, risk_config = self.bb_config, self.rsi_config, self.risk_config
+        
+        # Take profit tiers from the nested take_profit section, or the old
+        # config format with a single take_profit_pct for the last tier
+        take_profit_config = risk_config.get('take_profit', {})
+        if not (isinstance(take_profit_config, dict) and take_profit_config):
+            take_profit_config = {'tier3_pct': risk_config.get('take_profit_pct', 0.04)}
+        
+        strategy_params = {
+            'bb_length': bb_config.get('length', 20),
+            'bb_std': bb_config.get('std', 2.0),
+            'rsi_length': rsi_config.get('length', 14),
+            'rsi_oversold': rsi_config.get('oversold', 30),
+            'rsi_overbought': rsi_config.get('overbought', 70),
+            **{
+                f'take_profit_{name}': take_profit_config.get(name, default)
+                for name, default in _TAKE_PROFIT_DEFAULTS.items()
+            },
+            'stop_loss_pct': risk_config.get('stop_loss_pct', 0.02),
+            'position_size_pct': risk_config.get('position_size_pct', default_position_size_pct),
+        }
+        
+        # Parse cool_down parameter: '15m', '4h', or hours as a plain number
+        strategy_params['cool_down_hours'], strategy_params['cool_down_minutes'] = parse_cool_down(
+            self.cool_down.get('hours', 4)
+        )
+        
+        return strategy_params
+
+    def vectorized_run(
+        self,
+        df: pd.DataFrame,
+        strategy_params: Optional[Dict] = None,
+        initial_cash: float = 10000.0,
+        commission: float = 0.001,
+        datetime_col: str = 'timestamp'
+    ) -> Tuple[Optional[VectorizedBacktest], Dict]:
+        """
+        Run the mean reversion strategy on one symbol without Cerebro.
+        
+        Indicators and entry conditions are computed over whole arrays and the
+        simulation only visits the bars where an order is placed. Orders fill
+        at the next bar's open like backtrader's market orders, so results
+        match run_backtest() on the Cerebro path.
+        
+        Args:
+            df: DataFrame with OHLCV data
+            strategy_params: MeanReversionBT parameters, from the config when None
+            initial_cash: Initial account balance
+            commission: Commission rate
+            datetime_col: Column name for datetime
+            
+        Returns:
+            Tuple of (VectorizedBacktest, metrics dictionary), (None, {}) if the data is unusable
+        """
+        if strategy_params is None:
+            strategy_params = self._mean_reversion_params()
+        params = dict(MeanReversionBT.params._getpairs())
+        params.update(strategy_params)
+        
+        arrays = self._simulation_arrays(df, params, datetime_col)
+        if arrays is None:
+            return None, {}
+        times, open_, close, entry_signal = arrays
+        cool_down = timedelta(hours=params['cool_down_hours'], minutes=params['cool_down_minutes'])
+        
+        result = simulate_mean_reversion(
+            open_,
+            close,
+            entry_signal,
+            times.view(np.int64),
+            SimulationParams(
+                position_size_pct=params['position_size_pct'],
+                stop_loss_pct=params['stop_loss_pct'],
+                take_profit_tier1_pct=params['take_profit_tier1_pct'],
+                take_profit_tier2_pct=params['take_profit_tier2_pct'],
+                take_profit_tier3_pct=params['take_profit_tier3_pct'],
+                take_profit_tier1_size_pct=params['take_profit_tier1_size_pct'],
+                take_profit_tier2_size_pct=params['take_profit_tier2_size_pct'],
+                take_profit_tier3_size_pct=params['take_profit_tier3_size_pct'],
+                cool_down_ns=int(cool_down.total_seconds() * 10**9)
+            ),
+            initial_cash,
+            commission
+        )
+        backtest = VectorizedBacktest(result=result, times=times, close=close)
+        return backtest, self._simulation_metrics(backtest, initial_cash)
+
+    @staticmethod
+    def _simulation_arrays(
+        df: pd.DataFrame,
+        params: Dict,
+        datetime_col: str
+    ) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Extract the bar arrays and the entry signal a simulation runs on.
+        
+        Args:
+            df: DataFrame with OHLCV data
+            params: Complete MeanReversionBT parameters
+            datetime_col: Column name for datetime
+            
+        Returns:
+            Tuple of (times, open, close, entry signal) arrays, None if a column is missing
+        """
+        if df.index.name == datetime_col:
+            df = df.reset_index()
+        for col in (datetime_col, 'open', 'close'):
+            if col not in df.columns:
+                logger.error(f"Missing required column: {col}")
+                return None
+        
+        times = pd.to_datetime(df[datetime_col]).to_numpy(dtype='datetime64[ns]')
+        open_ = df['open'].to_numpy(dtype=np.float64)
+        close = df['close'].to_numpy(dtype=np.float64)
+        
+        entry_cond = MeanReversionBT.precompute_signals(
+            close, params['bb_length'], params['bb_std'], params['rsi_length'], params['rsi_oversold']
+        )[-1]
+        return times, open_, close, entry_cond == ENTRY_CONDITIONS
+
+    def exit_level_sweep(
+        self,
+        df: pd.DataFrame,
+        param_grid: Dict[str, List[float]],
+        initial_cash: float = 10000.0,
+        commission: float = 0.001,
+        datetime_col: str = 'timestamp'
+    ) -> pd.DataFrame:
+        """
+        Sweep take-profit and stop-loss levels with the sweep_exit_levels() kernel.
+        
+        Entries don't depend on the exit levels, so the indicators and entry
+        signal are computed once and every grid point runs in the same call;
+        with numba installed the points run in parallel threads. Only final
+        values are returned, use parameter_sweep() for the full metrics.
+        
+        Args:
+            df: DataFrame with OHLCV data
+            param_grid: Values to try for any of stop_loss_pct and take_profit_tier1/2/3_pct;
+                the other parameters come from the config
+            initial_cash: Initial account balance of each run
+            commission: Commission rate
+            datetime_col: Column name for datetime
+            
+        Returns:
+            DataFrame with one row per combination: the four exit levels,
+            final_value and total_return_pct
+        """
+        exit_levels = ('stop_loss_pct', 'take_profit_tier1_pct', 'take_profit_tier2_pct', 'take_profit_tier3_pct')
+        unknown = set(param_grid) - set(exit_levels)
+        if unknown:
+            raise ValueError(f"exit_level_sweep() only sweeps {exit_levels}, got {sorted(unknown)}")
+        
+        params = dict(MeanReversionBT.params._getpairs())
+        params.update(self._mean_reversion_params())
+        arrays = self._simulation_arrays(df, params, datetime_col)
+        if arrays is None:
+            return pd.DataFrame()
+        times, open_, close, entry_signal = arrays
+        cool_down = timedelta(hours=params['cool_down_hours'], minutes=params['cool_down_minutes'])
+        
+        # Flatten the grid, levels that aren't swept keep their configured value
+        grid = pd.MultiIndex.from_product(
+            [param_grid.get(name, [params[name]]) for name in exit_levels], names=exit_levels
+        ).to_frame(index=False)
+        cool_down_ns = int(cool_down.total_seconds() * 10**9)
+        if HAVE_NUMBA:
+            final_values = sweep_exit_levels(
+                np.ascontiguousarray(open_),
+                np.ascontiguousarray(close),
+                np.ascontiguousarray(entry_signal),
+                np.ascontiguousarray(times.view(np.int64)),
+                params['position_size_pct'],
+                *(grid[name].to_numpy(dtype=np.float64) for name in exit_levels),
+                params['take_profit_tier1_size_pct'],
+                params['take_profit_tier2_size_pct'],
+                params['take_profit_tier3_size_pct'],
+                cool_down_ns,
+                float(initial_cash),
+                float(commission)
+            )
+        else:
+            # Uncompiled, the event-jump simulation is much faster than the per-bar kernel
+            final_values = np.array([
+                simulate_mean_reversion(
+                    open_, close, entry_signal, times.view(np.int64),
+                    SimulationParams(
+                        position_size_pct=params['position_size_pct'],
+                        stop_loss_pct=point.stop_loss_pct,
+                        take_profit_tier1_pct=point.take_profit_tier1_pct,
+                        take_profit_tier2_pct=point.take_profit_tier2_pct,
+                        take_profit_tier3_pct=point.take_profit_tier3_pct,
+                        take_profit_tier1_size_pct=params['take_profit_tier1_size_pct'],
+                        take_profit_tier2_size_pct=params['take_profit_tier2_size_pct'],
+                        take_profit_tier3_size_pct=params['take_profit_tier3_size_pct'],
+                        cool_down_ns=cool_down_ns
+                    ),
+                    initial_cash,
+                    commission
+                ).final_value
+                for point in grid.itertuples(index=False)
+            ])
+        grid['final_value'] = final_values
+        grid['total_return_pct'] = (final_values / initial_cash - 1) * 100 if initial_cash != 0 else 0.0
+        logger.info(f"Exit level sweep finished: {len(grid)} combinations")
+        return grid
+
+    def parameter_sweep(
+        self,
+        df: pd.DataFrame,
+        param_grid: Dict[str, List],
+        initial_cash: float = 10000.0,
+        commission: float = 0.001,
+        datetime_col: str = 'timestamp',
+        max_workers: Optional[int] = 1
+    ) -> pd.DataFrame:
+        """
+        Run vectorized_run() over every combination of a parameter grid.
+        
+        Parameters missing from the grid come from the config. Indicators are
+        memoized, so only combinations that change bb_length, bb_std or
+        rsi_length recompute them. With several workers the combinations are
+        split into contiguous chunks, one per process, so each worker's
+        indicator cache still sees runs of equal indicator settings.
+        
+        Args:
+            df: DataFrame with OHLCV data
+            param_grid: MeanReversionBT parameter names mapped to the values to try
+            initial_cash: Initial account balance of each run
+            commission: Commission rate
+            datetime_col: Column name for datetime
+            max_workers: Number of worker processes; 1 runs in this process,
+                None uses backtest.max_workers or the CPU count
+            
+        Returns:
+            DataFrame with one row per combination: its parameters and metrics
+        """
+        base_params = self._mean_reversion_params()
+        names = list(param_grid)
+        combinations = [
+            dict(zip(names, values))
+            for values in itertools.product(*(param_grid[name] for name in names))
+        ]
+        if max_workers is None:
+            max_workers = self.config.get('backtest', {}).get('max_workers') or os.cpu_count()
+        
+        if max_workers <= 1 or len(combinations) <= 1:
+            rows = _run_sweep_chunk(self, df, base_params, combinations, initial_cash, commission, datetime_col)
+        else:
+            chunk_size = -(-len(combinations) // max_workers)
+            chunks = [combinations[i:i + chunk_size] for i in range(0, len(combinations), chunk_size)]
+            with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+                # map() keeps the chunks, and so the rows, in grid order
+                results = executor.map(
+                    _run_sweep_chunk, itertools.repeat(self.config), itertools.repeat(df),
+                    itertools.repeat(base_params), chunks, itertools.repeat(initial_cash),
+                    itertools.repeat(commission), itertools.repeat(datetime_col)
+                )
+                rows = [row for chunk_rows in results for row in chunk_rows]
+        logger.info(f"Parameter sweep finished: {len(rows)} combinations")
+        return pd.DataFrame(rows)
+
+    @staticmethod
+    def _simulation_metrics(backtest: VectorizedBacktest, initial_cash: float) -> Dict:
+        """
+        Calculate the _calculate_metrics() summary for a vectorized run.
+        
+        Sharpe ratio, drawdown and trade counts follow the definitions of the
+        backtrader analyzers run_backtest() attaches on the Cerebro path.
+        
+        Args:
+            backtest: Vectorized backtest result
+            initial_cash: Initial account balance
+            
+        Returns:
+            Dictionary with performance metrics
+        """
+        result = backtest.result
+        final_value = result.final_value
+        
+        # SharpeRatio analyzer: yearly returns, population standard deviation, no risk-free rate
+        sharpe_ratio = None
+        if len(result.equity):
+            year_end_values = pd.Series(result.equity).groupby(pd.DatetimeIndex(backtest.times).year).last().to_numpy()
+            yearly_returns = year_end_values / np.concatenate(([initial_cash], year_end_values[:-1])) - 1
+            if yearly_returns.std() > 0:
+                sharpe_ratio = float(yearly_returns.mean() / yearly_returns.std())
+        
+        # DrawDown analyzer: largest drop from the running peak of the account value
+        if len(result.equity):
+            peak = np.maximum.accumulate(result.equity)
+            max_drawdown_pct = float(((peak - result.equity) / peak).max() * 100)
+        else:
+            max_drawdown_pct = 0.0
+        
+        # TradeAnalyzer counts breakeven trades as won
+        wins = int((result.trade_pnl >= 0).sum())
+        losses = len(result.trade_pnl) - wins
+        pnl_pcts = result.trade_pnl / result.trade_open_value * 100
+        sells = int((result.action != ACTION_BUY).sum())
+        
+        return {
+            'initial_cash': float(initial_cash),
+            'final_value': final_value,
+            'total_return_pct': (final_value / initial_cash - 1) * 100 if initial_cash != 0 else 0.0,
+            'sharpe_ratio': sharpe_ratio,
+            'max_drawdown_pct': max_drawdown_pct,
+            'total_trades_analyzer': result.trades_opened,
+            'win_rate_analyzer_pct': (wins / result.trades_opened * 100) if result.trades_opened > 0 else 0.0,
+            'wins_analyzer': wins,
+            'losses_analyzer': losses,
+            'avg_trade_pnl_pct_strat': float(pnl_pcts.mean()) if len(pnl_pcts) else 0.0,
+            'sum_pnl_pct_strat': float(pnl_pcts.sum()),
+            'total_trades_strat': len(result.trade_pnl),
+            'winning_trades_strat': int((result.trade_pnl > 0).sum()),
+            'losing_trades_strat': int((result.trade_pnl < 0).sum()),
+            'buy_signals': len(result.action) - sells,
+            'sell_signals': sells,
+        }
 
     def _calculate_metrics(self, strategy: bt.Strategy, initial_cash: float) -> Dict:
         """
@@ -1165,8 +1956,8 @@ class BacktestHarness:
             max_drawdown_pct = drawdown_analysis.get('max', {}).get('drawdown', 0.0)
             max_drawdown_pct = float(max_drawdown_pct) # Already a percentage from analyzer
             
-            # Calculate metrics based on self.trades populated by notify_trade
-            strategy_trades_list = getattr(strategy, 'trades', [])
+            # Calculate metrics based on the closed-trade P&L populated by notify_trade
+            strategy_trades_list = getattr(strategy, 'trade_pnls', [])
             trade_based_pnl_pct_sum = 0.0
             winning_strategy_trades = 0
             losing_strategy_trades = 0
@@ -1184,7 +1975,7 @@ class BacktestHarness:
             else:
                 avg_trade_pnl_pct = 0.0
 
-            # Win rate from strategy.trades can be a cross-check but primary is TradeAnalyzer
+            # Win rate from strategy.trade_pnls can be a cross-check but primary is TradeAnalyzer
             # total_strategy_trades = len(strategy_trades_list)
             # win_rate_from_strategy_trades_pct = (winning_strategy_trades / total_strategy_trades * 100) if total_strategy_trades > 0 else 0.0
             
@@ -1201,9 +1992,9 @@ class BacktestHarness:
                 'wins_analyzer': wins,
                 'losses_analyzer': losses,
                 
-                # Metrics from strategy.trades (for detailed P&L per trade)
-                'avg_trade_pnl_pct_strat': avg_trade_pnl_pct, # Average P&L % per trade from strategy.trades
-                'sum_pnl_pct_strat': trade_based_pnl_pct_sum, # Sum of P&L % from strategy.trades
+                # Metrics from strategy.trade_pnls (for detailed P&L per trade)
+                'avg_trade_pnl_pct_strat': avg_trade_pnl_pct, # Average P&L % per trade from strategy.trade_pnls
+                'sum_pnl_pct_strat': trade_based_pnl_pct_sum, # Sum of P&L % from strategy.trade_pnls
                 'total_trades_strat': len(strategy_trades_list),
                 'winning_trades_strat': winning_strategy_trades,
                 'losing_trades_strat': losing_strategy_trades,
@@ -1239,6 +2030,34 @@ class BacktestHarness:
         
         return metrics
     
+    def _add_portfolio_feeds(
+        self,
+        cerebro: bt.Cerebro,
+        symbol_data_dict: Dict[str, Union[pd.DataFrame, bt.feeds.PandasData]]
+    ) -> List[str]:
+        """
+        Add one data feed per symbol to a Cerebro.
+        
+        Args:
+            cerebro: Cerebro to add the feeds to
+            symbol_data_dict: Dictionary mapping symbols to their data (DataFrame or bt.feeds.PandasData)
+            
+        Returns:
+            Symbols that made it into the run, without those whose data failed to prepare
+        """
+        symbols = []
+        for symbol, data in symbol_data_dict.items():
+            if isinstance(data, pd.DataFrame):
+                data_feed = self.prepare_data(data)
+                if data_feed is None:
+                    logger.error(f"Failed to prepare data for {symbol}")
+                    continue
+                cerebro.adddata(data_feed, name=symbol)
+            else:
+                cerebro.adddata(data, name=symbol)
+            symbols.append(symbol)
+        return symbols
+
     def run_portfolio_backtest(
         self,
         symbol_data_dict: Dict[str, Union[pd.DataFrame, bt.feeds.PandasData]],
@@ -1257,107 +2076,28 @@ class BacktestHarness:
             Tuple of (strategy instance, metrics dictionary)
         """
         # Create cerebro instance
-        cerebro = bt.Cerebro()
-        
-        # Add data for each symbol
-        for symbol, data in symbol_data_dict.items():
-            if isinstance(data, pd.DataFrame):
-                data_feed = self.prepare_data(data)
-                if data_feed is None:
-                    logger.error(f"Failed to prepare data for {symbol}")
-                    continue
-                cerebro.adddata(data_feed, name=symbol)
-            else:
-                cerebro.adddata(data, name=symbol)
+        cerebro = bt.Cerebro(**_CEREBRO_OPTIONS)
+        symbols = self._add_portfolio_feeds(cerebro, symbol_data_dict)
         
         # Set strategy parameters
-        strategy_params = {
-            'bb_length': self.bb_config.get('length', 20),
-            'bb_std': self.bb_config.get('std', 2.0),
-            'rsi_length': self.rsi_config.get('length', 14),
-            'rsi_oversold': self.rsi_config.get('oversold', 30),
-            'rsi_overbought': self.rsi_config.get('overbought', 70),
-            'position_size_pct': self.risk_config.get('position_size_pct', 0.333),  # Use from config
-            'cool_down_hours': 0,
-            'cool_down_minutes': 0
-        }
-        
-        # Get take profit configuration
-        take_profit_config = self.risk_config.get('take_profit', {})
-        
-        # If take_profit is a nested dictionary, use those values
-        if isinstance(take_profit_config, dict) and take_profit_config:
-            take_profit_tier1_pct = take_profit_config.get('tier1_pct', 0.02)
-            take_profit_tier2_pct = take_profit_config.get('tier2_pct', 0.03)
-            take_profit_tier3_pct = take_profit_config.get('tier3_pct', 0.04)
-            take_profit_tier1_size_pct = take_profit_config.get('tier1_size_pct', 0.33)
-            take_profit_tier2_size_pct = take_profit_config.get('tier2_size_pct', 0.33)
-            take_profit_tier3_size_pct = take_profit_config.get('tier3_size_pct', 0.34)
-        else:
-            # Backward compatibility for old config format with single take_profit_pct
-            take_profit_pct = self.risk_config.get('take_profit_pct', 0.04)
-            take_profit_tier1_pct = 0.02
-            take_profit_tier2_pct = 0.03
-            take_profit_tier3_pct = take_profit_pct
-            take_profit_tier1_size_pct = 0.33
-            take_profit_tier2_size_pct = 0.33
-            take_profit_tier3_size_pct = 0.34
-        
-        # Add stop loss and take profit parameters
-        strategy_params.update({
-            'stop_loss_pct': self.risk_config.get('stop_loss_pct', 0.02),
-            'take_profit_tier1_pct': take_profit_tier1_pct,
-            'take_profit_tier2_pct': take_profit_tier2_pct,
-            'take_profit_tier3_pct': take_profit_tier3_pct,
-            'take_profit_tier1_size_pct': take_profit_tier1_size_pct,
-            'take_profit_tier2_size_pct': take_profit_tier2_size_pct,
-            'take_profit_tier3_size_pct': take_profit_tier3_size_pct
-        })
-        
-        # Parse cool_down parameter
-        cool_down_value = self.cool_down.get('hours', 4)
-        if isinstance(cool_down_value, str):
-            if cool_down_value.endswith('m'):
-                try:
-                    strategy_params['cool_down_minutes'] = int(cool_down_value.rstrip('m'))
-                    logger.info(f"Cool-down set to {strategy_params['cool_down_minutes']} minutes")
-                except ValueError:
-                    logger.error(f"Invalid cool_down format: {cool_down_value}, using default 4 hours")
-                    strategy_params['cool_down_hours'] = 4
-            elif cool_down_value.endswith('h'):
-                try:
-                    strategy_params['cool_down_hours'] = int(cool_down_value.rstrip('h'))
-                    logger.info(f"Cool-down set to {strategy_params['cool_down_hours']} hours")
-                except ValueError:
-                    logger.error(f"Invalid cool_down format: {cool_down_value}, using default 4 hours")
-                    strategy_params['cool_down_hours'] = 4
-            else:
-                try:
-                    # Assume hours if no unit is specified
-                    strategy_params['cool_down_hours'] = float(cool_down_value)
-                    logger.info(f"Cool-down set to {strategy_params['cool_down_hours']} hours")
-                except ValueError:
-                    logger.error(f"Invalid cool_down format: {cool_down_value}, using default 4 hours")
-                    strategy_params['cool_down_hours'] = 4
-        else:
-            # If a numeric value, assume it's hours
-            strategy_params['cool_down_hours'] = float(cool_down_value)
+        strategy_params = self._mean_reversion_params(default_position_size_pct=0.333)
         
         # Add multi-asset strategy
-        cerebro.addstrategy(MultiAssetMeanReversionBT, **strategy_params)
+        run_timestamp = self._run_id()
+        log_basename = f"portfolio_backtest_{run_timestamp}"
+        event_log_path = self._event_log_path(log_basename)
+        cerebro.addstrategy(MultiAssetMeanReversionBT, event_log_path=event_log_path, **strategy_params)
         
         # Set broker parameters
         cerebro.broker.setcash(initial_cash)
         cerebro.broker.setcommission(commission=commission)
         
         # Add analyzers
-        cerebro.addanalyzer(bt.analyzers.SharpeRatio, _name='sharpe', riskfreerate=0.0)
-        cerebro.addanalyzer(bt.analyzers.Returns, _name='returns')
-        cerebro.addanalyzer(bt.analyzers.DrawDown, _name='drawdown')
-        cerebro.addanalyzer(bt.analyzers.TradeAnalyzer, _name='trades')
+        for analyzer, kwargs in _ANALYZERS:
+            cerebro.addanalyzer(analyzer, **kwargs)
         
         # Run backtest
-        logger.info(f"Starting portfolio backtest with {len(symbol_data_dict)} symbols...")
+        logger.info(f"Starting portfolio backtest with {len(symbols)} symbols...")
         results = cerebro.run()
         strategy = results[0]
         
@@ -1369,12 +2109,11 @@ class BacktestHarness:
         logger.info(f"Portfolio metrics: {metrics}")
 
         # --- Logging to files ---
-        run_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-        json_filename = f"portfolio_backtest_{run_timestamp}.json"
+        json_filename = f"{log_basename}.json"
         json_filepath = os.path.join(self.json_logs_dir, json_filename)
 
         # Create portfolio input parameters log
-        symbols_str = ",".join(symbol_data_dict.keys())
+        symbols_str = ",".join(symbols)
         input_parameters_log = {
             "symbols": symbols_str,
             "initial_cash": initial_cash,
@@ -1382,34 +2121,247 @@ class BacktestHarness:
             **strategy_params
         }
 
-        # Get trade events by symbol
-        trade_events_by_symbol = {}
-        for event in strategy.trade_event_logs:
-            for symbol in symbol_data_dict.keys():
-                if f"[{symbol}]" in event:
-                    if symbol not in trade_events_by_symbol:
-                        trade_events_by_symbol[symbol] = []
-                    trade_events_by_symbol[symbol].append(event)
-        
-        # Get all trades with symbol information
-        trades_with_symbols = []
-        for trade in getattr(strategy, 'trades', []):
-            if isinstance(trade, dict) and 'symbol' in trade:
-                trades_with_symbols.append(trade)
-
         log_data_for_json = {
             "run_timestamp": run_timestamp,
             "input_parameters": input_parameters_log,
-            "detailed_trade_events_by_symbol": trade_events_by_symbol,
-            "trades": trades_with_symbols,
             "summary_metrics": metrics
         }
+        if event_log_path is not None:
+            # Events were streamed to CSV (with a symbol column) instead of kept in memory
+            log_data_for_json["detailed_trade_events_file"] = event_log_path
+        records_path = self._records_log_path(log_basename) if self.detailed_logs else None
+        if records_path is not None:
+            log_data_for_json["trade_records_file"] = records_path
+        elif self.detailed_logs:
+            # Get trade events by symbol, from the symbol each event was recorded with
+            trade_events_by_symbol = defaultdict(list)
+            for event, line in zip(strategy.trade_event_logs, strategy.event_log_lines()):
+                if event[1] is not None:
+                    trade_events_by_symbol[event[1]].append(line)
+            log_data_for_json.update({
+                "detailed_trade_events_by_symbol": dict(trade_events_by_symbol),
+                "trades": [trade.to_dict() for trade in strategy.trades if trade.symbol is not None],
+                "trade_pnls": strategy.trade_pnls
+            })
 
-        try:
-            with open(json_filepath, 'w') as f_json:
-                json.dump(log_data_for_json, f_json, indent=4, cls=DateTimeEncoder)
-            logger.info(f"Detailed portfolio log saved to {json_filepath}")
-        except Exception as e:
-            logger.error(f"Failed to save portfolio JSON log: {e}")
+        if records_path is not None:
+            # Built here, so the writer thread never reads the strategy's state
+            records = [
+                {'record': 'event', 'symbol': event[1], 'event': line}
+                for event, line in zip(strategy.trade_event_logs, strategy.event_log_lines())
+            ]
+            records.extend({'record': 'trade', **trade.to_dict()} for trade in strategy.trades if trade.symbol is not None)
+            records.extend({'record': 'trade_pnl', **pnl} for pnl in strategy.trade_pnls)
+            self._submit_log(json_filepath, log_data_for_json, records_path, records)
+        else:
+            self._submit_log(json_filepath, log_data_for_json)
+        
+        return strategy, metrics
+
+    def run_portfolio_backtest_sweep(
+        self,
+        symbol_data_dict: Dict[str, Union[pd.DataFrame, bt.feeds.PandasData]],
+        param_grid: Dict[str, List],
+        initial_cash: float = 1000.0,
+        commission: float = 0.001
+    ) -> pd.DataFrame:
+        """
+        Run the portfolio backtest over every combination of a parameter grid.
+        
+        One Cerebro runs all combinations with optstrategy(), so the feeds are
+        prepared and preloaded once instead of once per combination. Parameters
+        missing from the grid come from the config; trade logging is off
+        unless verbose is in the grid. Runs stay in this process: the metrics
+        read each run's broker, which is only current while the run finishes.
+        
+        Args:
+            symbol_data_dict: Dictionary mapping symbols to their data (DataFrame or bt.feeds.PandasData)
+            param_grid: MultiAssetMeanReversionBT parameter names mapped to the values to try
+            initial_cash: Initial account balance of each run
+            commission: Commission rate
+            
+        Returns:
+            DataFrame with one row per combination: its parameters and metrics
+        """
+        cerebro = bt.Cerebro(**_CEREBRO_OPTIONS, optreturn=False)
+        self._add_portfolio_feeds(cerebro, symbol_data_dict)
+        
+        strategy_params = {'verbose': False, **self._mean_reversion_params(default_position_size_pct=0.333)}
+        # optstrategy() takes single values as one-element choices
+        cerebro.optstrategy(MultiAssetMeanReversionBT, **{**strategy_params, **param_grid})
+        
+        cerebro.broker.setcash(initial_cash)
+        cerebro.broker.setcommission(commission=commission)
+        for analyzer, kwargs in _ANALYZERS:
+            cerebro.addanalyzer(analyzer, **kwargs)
         
-        return strategy, metrics
\ No newline at end of file
+        rows = []
+        
+        def collect(strategies):
+            # Called after each run with its strategy instances, while the broker holds its final value
+            strategy = strategies[0]
+            combination = {name: getattr(strategy.params, name) for name in param_grid}
+            rows.append({**combination, **self._calculate_metrics(strategy, initial_cash)})
+        
+        cerebro.optcallback(collect)
+        cerebro.run(maxcpus=1)
+        logger.info(f"Portfolio parameter sweep finished: {len(rows)} combinations")
+        return pd.DataFrame(rows)
+
+
+def _run_backtest_worker(
+    config: Dict,
+    symbol: str,
+    interval: str,
+    df: pd.DataFrame,
+    initial_cash: float,
+    commission: float
+) -> Tuple[Dict, Dict]:
+    """
+    Run one single-symbol backtest in a worker process.
+
+    Module level so only the plain config dict and the DataFrame are pickled,
+    not the harness. The summary CSV row is left to the parent process.
+
+    Returns:
+        Tuple of (input parameters, metrics dictionary)
+    """
+    harness = BacktestHarness(config)
+    _, summary_metrics = harness.run_backtest(
+        symbol, interval, df, initial_cash, commission, write_summary=False
+    )
+    harness.flush_logs()
+    input_parameters_log = {
+        "symbol": symbol,
+        "interval": interval,
+        "initial_cash": initial_cash,
+        "commission": commission,
+        **harness._mean_reversion_params()
+    }
+    return input_parameters_log, summary_metrics
+
+
+def _run_sweep_chunk(
+    harness: Union['BacktestHarness', Dict],
+    df: pd.DataFrame,
+    base_params: Dict,
+    combinations: List[Dict],
+    initial_cash: float,
+    commission: float,
+    datetime_col: str
+) -> List[Dict]:
+    """
+    Run vectorized_run() for a chunk of parameter_sweep() combinations.
+
+    Module level so worker processes receive the plain config dict instead
+    of the harness; in-process sweeps pass the harness itself.
+
+    Returns:
+        One row of parameters and metrics per combination
+    """
+    if not isinstance(harness, BacktestHarness):
+        harness = BacktestHarness(harness)
+    rows = []
+    for combination in combinations:
+        _, metrics = harness.vectorized_run(
+            df, {**base_params, **combination}, initial_cash, commission, datetime_col
+        )
+        rows.append({**combination, **metrics})
+    return rows
+
+
+def _run_symbol_backtest(
+    symbol: str,
+    df: pd.DataFrame,
+    strategy_params: Dict,
+    initial_cash: float,
+    commission: float
+) -> Dict[str, Any]:
+    """
+    Run a single-symbol MeanReversionBT backtest in a worker process.
+
+    Backtrader strategies can't be pickled, so the worker builds its own
+    Cerebro from the DataFrame and returns plain Python results.
+    """
+    cerebro = bt.Cerebro(**_CEREBRO_OPTIONS)
+    data_feed = BacktestHarness.prepare_data(df)
+    if data_feed is None:
+        # Raised in the worker, the parent logs it with the symbol
+        raise ValueError(f"Failed to prepare data for {symbol}")
+    cerebro.adddata(data_feed, name=symbol)
+    cerebro.addstrategy(MeanReversionBT, **strategy_params)
+    cerebro.broker.setcash(initial_cash)
+    cerebro.broker.setcommission(commission=commission)
+    strategy = cerebro.run()[0]
+
+    return {
+        'trades': [{**trade.to_dict(), 'symbol': symbol} for trade in strategy.trades],
+        'trade_pnls': [{**pnl, 'symbol': symbol} for pnl in strategy.trade_pnls],
+        'buy_signals': strategy.buy_signals.to_frame().assign(symbol=symbol),
+        'sell_signals': strategy.sell_signals.to_frame().assign(symbol=symbol),
+        'trade_event_logs': strategy.event_log_lines(),
+        'final_value': cerebro.broker.getvalue()
+    }
+
+
+def run_multi_asset_parallel(
+    symbol_data_dict: Dict[str, Union[pd.DataFrame, bt.feeds.PandasData]],
+    strategy_params: Dict,
+    initial_cash: float = 10000.0,
+    commission: float = 0.001,
+    workers: Optional[int] = None,
+    independent_capital: bool = False
+) -> Dict[str, Any]:
+    """
+    Backtest each symbol in its own process and merge the results.
+
+    Unlike MultiAssetMeanReversionBT, every symbol trades its own initial_cash,
+    so there is no capital shared between symbols. Callers must acknowledge
+    that with independent_capital=True.
+
+    Args:
+        symbol_data_dict: Dictionary mapping symbols to their data
+        strategy_params: MeanReversionBT parameters
+        initial_cash: Starting cash for each symbol
+        commission: Commission rate
+        workers: Number of worker processes (defaults to the CPU count)
+        independent_capital: Confirms that symbols don't share capital
+
+    Returns:
+        Dictionary with merged trades and event logs, signal DataFrames and the
+        final value per symbol
+    """
+    if not independent_capital:
+        raise ValueError(
+            "Parallel backtests give every symbol its own capital; "
+            "pass independent_capital=True or use run_portfolio_backtest"
+        )
+
+    merged = {
+        'trades': [], 'trade_pnls': [], 'buy_signals': [], 'sell_signals': [],
+        'trade_event_logs': [], 'final_values': {}
+    }
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {}
+        for symbol, data in symbol_data_dict.items():
+            # Data feeds don't pickle, send the underlying DataFrame instead
+            df = data if isinstance(data, pd.DataFrame) else data.p.dataname
+            futures[executor.submit(_run_symbol_backtest, symbol, df, strategy_params, initial_cash, commission)] = symbol
+
+        for future in as_completed(futures):
+            symbol = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.error(f"Backtest for {symbol} failed: {e}")
+                continue
+            merged['trades'].extend(result['trades'])
+            merged['trade_pnls'].extend(result['trade_pnls'])
+            merged['trade_event_logs'].extend(result['trade_event_logs'])
+            merged['buy_signals'].append(result['buy_signals'])
+            merged['sell_signals'].append(result['sell_signals'])
+            merged['final_values'][symbol] = result['final_value']
+
+    for key in ('buy_signals', 'sell_signals'):
+        merged[key] = pd.concat(merged[key], ignore_index=True) if merged[key] else pd.DataFrame()
+    return merged
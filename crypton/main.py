@@ -26,8 +26,14 @@ from crypton.utils.notify import notify_trade_execution, notify_trade_completed,
 from crypton.utils.debug import ensure_indicator_columns, debug_dataframe
 
 
-def setup_environment(config_path: Optional[str] = None):
-    """Initialize environment variables and logger."""
+def setup_environment(config_path: Optional[str] = None, enqueue_logs: bool = False):
+    """
+    Initialize environment variables and logger.
+    
+    Args:
+        config_path: Path to configuration file
+        enqueue_logs: Write log records on a background thread, for the backtest modes
+    """
     # Load environment variables from .env file
     load_dotenv()
     
@@ -47,7 +53,7 @@ def setup_environment(config_path: Optional[str] = None):
     
     # Set up logging with file
     log_level = os.getenv("LOG_LEVEL", "INFO")
-    setup_logger(log_level=log_level, debug_mode=debug_mode, log_file=log_file)
+    setup_logger(log_level=log_level, debug_mode=debug_mode, log_file=log_file, enqueue=enqueue_logs)
     
     logger.info(f"Logging to file: {log_file}")
     
@@ -518,8 +524,9 @@ def main():
     # Parse arguments
     args = parser.parse_args()
     
-    # Set up environment with config path
-    setup_environment(args.config)
+    # Set up environment with config path; only backtests hand log writes to a
+    # background thread, paper and live trading keep logging synchronously
+    setup_environment(args.config, enqueue_logs=args.mode in ('backtest', 'portfolio'))
     
     # Run in selected mode
     if args.mode == 'backtest':
@@ -15,6 +15,7 @@ import pandas as pd
 from loguru import logger
 
 from crypton.indicators.technical import IndicatorEngine
+from crypton.utils.config import parse_cool_down
 from crypton.utils.trade_history import TradeHistoryManager
 
 
@@ -74,35 +75,7 @@ class MeanReversionStrategy:
             logger.info(f"Cool-down set to {self.cool_down_minutes} minutes")
         else:
             # Support for time interval formats like '15m' or legacy hours config
-            self.cool_down_hours = 0
-            self.cool_down_minutes = 0
-            
-            if isinstance(cool_down_value, str):
-                if cool_down_value.endswith('m'):
-                    try:
-                        self.cool_down_minutes = int(cool_down_value.rstrip('m'))
-                        logger.info(f"Cool-down set to {self.cool_down_minutes} minutes")
-                    except ValueError:
-                        logger.error(f"Invalid cool_down format: {cool_down_value}, using default 4 hours")
-                        self.cool_down_hours = 4
-                elif cool_down_value.endswith('h'):
-                    try:
-                        self.cool_down_hours = int(cool_down_value.rstrip('h'))
-                        logger.info(f"Cool-down set to {self.cool_down_hours} hours")
-                    except ValueError:
-                        logger.error(f"Invalid cool_down format: {cool_down_value}, using default 4 hours")
-                        self.cool_down_hours = 4
-                else:
-                    try:
-                        # Assume hours if no unit is specified
-                        self.cool_down_hours = float(cool_down_value)
-                        logger.info(f"Cool-down set to {self.cool_down_hours} hours")
-                    except ValueError:
-                        logger.error(f"Invalid cool_down format: {cool_down_value}, using default 4 hours")
-                        self.cool_down_hours = 4
-            else:
-                # If a numeric value, assume it's hours
-                self.cool_down_hours = float(cool_down_value)
+            self.cool_down_hours, self.cool_down_minutes = parse_cool_down(cool_down_value)
         
         # Track last trade time per symbol
         self.last_trade_time: Dict[str, datetime] = {}
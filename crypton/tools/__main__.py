@@ -0,0 +1,34 @@
+"""
+Command dispatcher for the Crypton Testnet account tools.
+
+Usage: python -m crypton.tools <command> [options]
+"""
+import sys
+
+from crypton.tools import (
+    cancel_all_orders,
+    check_balance,
+    check_open_positions,
+    check_spec_balance,
+)
+
+COMMANDS = {
+    "cancel_all_orders": cancel_all_orders.main,
+    "check_balance": check_balance.main,
+    "check_open_positions": check_open_positions.main,
+    "check_spec_balance": check_spec_balance.main,
+}
+
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] not in COMMANDS:
+        print(f"Usage: python -m crypton.tools <{'|'.join(COMMANDS)}> [options]")
+        sys.exit(1)
+
+    # Drop the command name so each tool parses only its own options
+    command = sys.argv.pop(1)
+    COMMANDS[command]()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Cancel all open orders on Binance Testnet to free up locked balances.
+"""
+import argparse
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from crypton.utils.binance_client import testnet_client, with_backoff
+
+MAX_CANCEL_WORKERS = 10  # keeps parallel cancels inside Binance request-weight limits
+ORDER_FMT = "  {symbol}: {side} {type} - Qty: {origQty} - Price: {price} - Stop: {stopPrice} - ID: {orderId}"
+REMAINING_ORDER_FMT = "  {symbol}: {side} {type} - ID: {orderId}"
+
+class _OrderFields(dict):
+    """Order mapping for str.format_map that prints N/A for fields Binance omitted."""
+
+    def __missing__(self, key):
+        return "N/A"
+
+def cancel_open_orders(client, symbol):
+    """Cancel every open order for a symbol with one request."""
+    if hasattr(client, "cancel_open_orders"):
+        return client.cancel_open_orders(symbol=symbol)
+    # Older python-binance releases don't wrap DELETE /api/v3/openOrders
+    return client._delete("openOrders", True, data={"symbol": symbol})
+
+def cancel_order(client, order):
+    """Cancel a single order, backing off when Binance signals a rate limit."""
+    return with_backoff(client.cancel_order, symbol=order['symbol'], orderId=order['orderId'])
+
+def cancel_orders_individually(client, orders):
+    """
+    Fallback: cancel orders one by one, overlapping the HTTPS round trips.
+
+    Returns the number of orders that were canceled.
+    """
+    canceled = 0
+    with ThreadPoolExecutor(max_workers=MAX_CANCEL_WORKERS) as executor:
+        futures = {executor.submit(cancel_order, client, order): order for order in orders}
+        for future in as_completed(futures):
+            order = futures[future]
+            order_id, symbol = order['orderId'], order['symbol']
+            try:
+                future.result()
+                canceled += 1
+                print(f"✓ Canceled order {order_id} for {symbol} ({order['side']} {order['type']})")
+            except Exception as e:
+                print(f"✗ Error canceling order {order_id} for {symbol}: {e}")
+    return canceled
+
+async def cancel_all(client, orders=None):
+    """
+    Cancel all open orders, batching the requests per symbol.
+
+    Args:
+        client: Binance client
+        orders: Open orders the caller already tracks (e.g. from the user data
+            stream); fetched from the API when None
+
+    Returns:
+        Number of orders canceled, or None if there were no open orders
+    """
+    if orders is None:
+        print("=== CHECKING OPEN ORDERS BEFORE CANCELLATION ===")
+        orders = await asyncio.to_thread(with_backoff, client.get_open_orders)
+    if not orders:
+        print("No open orders found.")
+        return None
+
+    print(f"Found {len(orders)} open orders:")
+    for order in orders:
+        print(ORDER_FMT.format_map(_OrderFields(order)))
+
+    print("\n=== CANCELLING ALL ORDERS ===")
+
+    # Group orders by symbol so each symbol needs a single DELETE /openOrders call
+    orders_by_symbol = {}
+    for order in orders:
+        orders_by_symbol.setdefault(order['symbol'], []).append(order)
+
+    canceled_count = 0
+    for symbol, symbol_orders in orders_by_symbol.items():
+        try:
+            await asyncio.to_thread(with_backoff, cancel_open_orders, client, symbol)
+            canceled_count += len(symbol_orders)
+            print(f"✓ Canceled {len(symbol_orders)} orders for {symbol}")
+        except Exception as e:
+            print(f"✗ Batch cancel failed for {symbol} ({e}), canceling orders individually")
+            canceled_count += await asyncio.to_thread(cancel_orders_individually, client, symbol_orders)
+
+    print(f"\nCanceled {canceled_count}/{len(orders)} orders")
+    return canceled_count
+
+def main():
+    parser = argparse.ArgumentParser(description="Cancel all open orders on Binance Testnet")
+    parser.add_argument("--verify", action="store_true",
+                        help="Re-query open orders after cancelling to confirm none remain")
+    args = parser.parse_args()
+
+    client = testnet_client()
+    if client is None:
+        print("ERROR: API credentials not found in environment variables")
+        return
+
+    try:
+        if asyncio.run(cancel_all(client)) is None:
+            return
+
+        # The local counters are enough for the common case, only re-query on request
+        if args.verify:
+            print("\n=== CHECKING OPEN ORDERS AFTER CANCELLATION ===")
+            remaining_orders = with_backoff(client.get_open_orders)
+            if remaining_orders:
+                print(f"⚠ Warning: {len(remaining_orders)} orders still open:")
+                for order in remaining_orders:
+                    print(REMAINING_ORDER_FMT.format_map(order))
+            else:
+                print("✓ All orders successfully canceled!")
+
+        print("\n=== CHECKING BALANCES AFTER CANCELLATION ===")
+        account = with_backoff(client.get_account)
+        target_assets = {"BTC", "ETH", "SUI", "USDT"}
+        
+        print("Asset\tFree\t\tLocked")
+        print("-" * 32)
+        for balance in account['balances']:
+            if balance['asset'] in target_assets:
+                free_amt = float(balance['free'])
+                locked_amt = float(balance['locked'])
+                if free_amt > 0 or locked_amt > 0:
+                    print(f"{balance['asset']:<8}{free_amt:<16.8f}{locked_amt:.8f}")
+
+    except Exception as exc:
+        print(f"ERROR: {exc}")
+
+if __name__ == "__main__":
+    main() 
\ No newline at end of file
@@ -0,0 +1,162 @@
+"""
+Simple script to check your Binance Testnet account balance.
+"""
+import argparse
+import asyncio
+import sys
+import time
+
+from crypton.utils.binance_client import testnet_client, with_backoff
+
+TESTNET_STREAM_URL = 'wss://testnet.binance.vision/'
+
+def parse_balances(raw_balances):
+    """
+    Parse non-empty balances in a single pass over the API response.
+
+    Returns (asset, free, locked) tuples sorted by total amount, largest first.
+    """
+    kept = []
+    for b in raw_balances:
+        free = float(b['free'])
+        locked = float(b['locked'])
+        if free or locked:
+            kept.append((b['asset'], free, locked))
+    kept.sort(key=lambda t: t[1] + t[2], reverse=True)
+    return kept
+
+def sort_balances(balances):
+    """Drop balances emptied by stream updates and re-sort by total amount."""
+    return sorted((t for t in balances if t[1] or t[2]), key=lambda t: t[1] + t[2], reverse=True)
+
+def format_balances(balances):
+    """Format (asset, free, locked) balance tuples as table lines."""
+    lines = [
+        "\n=== BALANCES ===",
+        "Asset\t\tFree\t\tLocked",
+        "-" * 40
+    ]
+    lines.extend(f"{asset:<8}\t{free:<16.8f}{locked:.8f}" for asset, free, locked in balances)
+    return lines
+
+def write_lines(lines):
+    """Write buffered output lines with a single stdout write."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+def watch_balances(client):
+    """
+    Keep balances in memory from the user data stream instead of polling.
+
+    One REST snapshot bootstraps the state; after that every
+    outboundAccountPosition event merges its deltas and reprints the table.
+    """
+    from binance.websockets import BinanceSocketManager
+
+    account = with_backoff(client.get_account)
+    balances = {t[0]: t for t in parse_balances(account['balances'])}
+    write_lines(format_balances(balances.values()))
+
+    def handle_message(msg):
+        if msg.get('e') == 'error':
+            print(f"WebSocket error: {msg}")
+        elif msg.get('e') == 'outboundAccountPosition':
+            for update in msg['B']:
+                balances[update['a']] = (update['a'], float(update['f']), float(update['l']))
+            write_lines(format_balances(sort_balances(balances.values())))
+
+    socket_manager = BinanceSocketManager(client)
+    socket_manager.STREAM_URL = TESTNET_STREAM_URL
+    socket_manager.start_user_socket(handle_message)
+    socket_manager.start()
+    print("\nWatching balance updates (Ctrl+C to stop)...")
+
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        socket_manager.close()
+        from twisted.internet import reactor
+        reactor.stop()
+
+async def check_balance():
+    parser = argparse.ArgumentParser(description="Check Binance Testnet account balance")
+    parser.add_argument("--watch", action="store_true",
+                        help="Stream balance updates over the user data WebSocket")
+    args = parser.parse_args()
+
+    client = testnet_client()
+    if client is None:
+        print("ERROR: API credentials not found in environment variables")
+        return
+    
+    print(f"Using API key: {client.API_KEY[:5]}...{client.API_KEY[-5:]}")
+    
+    if args.watch:
+        watch_balances(client)
+        return
+    
+    # Collect the report and write it out once at the end
+    out = []
+    try:
+        # Get account information and prices concurrently, the calls are independent
+        print("Fetching account information...")
+        account, tickers = await asyncio.gather(
+            asyncio.to_thread(with_backoff, client.get_account),
+            asyncio.to_thread(with_backoff, client.get_all_tickers)
+        )
+        
+        # Account status
+        out.append(f"\nAccount Status: {account['accountType']}")
+        out.append(f"Can Trade: {account['canTrade']}")
+        out.append(f"Can Withdraw: {account['canWithdraw']}")
+        out.append(f"Can Deposit: {account['canDeposit']}")
+        
+        # Non-zero balances, sorted; shared by the table and the valuation loop
+        balances = parse_balances(account['balances'])
+        
+        # Format them nicely
+        out.extend(format_balances(balances))
+        
+        # Get current prices for the assets with USDT
+        out.append("\n=== ESTIMATED VALUES IN USDT ===")
+        prices = {t['symbol']: float(t['price']) for t in tickers}
+        total_value = 0.0
+        
+        for asset, free, locked in balances:
+            total = free + locked
+            
+            # Skip USDT itself
+            if asset == 'USDT':
+                total_value += total
+                out.append(f"{asset}: {total} USDT")
+                continue
+                
+            # Skip assets with very small balances
+            if total < 0.00001:
+                continue
+                
+            price = prices.get(f"{asset}USDT")
+            if price is None:
+                # No USDT pair, just show the asset without USD value
+                out.append(f"{asset}: {total} (price unavailable)")
+                continue
+            
+            value = total * price
+            total_value += value
+            out.append(f"{asset}: {total} × {price} = {value:.2f} USDT")
+        
+        out.append(f"\nTotal Estimated Value: {total_value:.2f} USDT")
+        
+    except Exception as e:
+        out.append(f"ERROR: {e}")
+    finally:
+        write_lines(out)
+
+def main():
+    asyncio.run(check_balance())
+
+if __name__ == "__main__":
+    main()
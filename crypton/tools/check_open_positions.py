@@ -0,0 +1,68 @@
+"""
+Check for open positions and pending orders on Binance Testnet.
+"""
+import sys
+
+from crypton.utils.binance_client import get_symbol_info, testnet_client, with_backoff
+
+ORDER_FMT = (
+    "Symbol: {symbol}\n"
+    "  Order ID: {orderId}\n"
+    "  Side: {side}\n"
+    "  Type: {type}\n"
+    "  Quantity: {origQty}\n"
+    "  Price: {price}\n"
+    "  Status: {status}\n"
+    "  Time: {time}\n"
+    + "-" * 40
+)
+
+def main():
+    client = testnet_client()
+    if client is None:
+        print("ERROR: API credentials not found in environment variables")
+        return
+
+    # Collect the report and write it out once at the end
+    out = []
+    try:
+        out.append("=== CHECKING OPEN ORDERS ===")
+        open_orders = with_backoff(client.get_open_orders)
+        if open_orders:
+            out.extend(ORDER_FMT.format_map(order) for order in open_orders)
+        else:
+            out.append("No open orders found.")
+
+        out.append("\n=== CHECKING ACCOUNT INFO ===")
+        account = with_backoff(client.get_account)
+        
+        # Show balances with locked amounts
+        out.append("Balances with locked amounts:")
+        for balance in account['balances']:
+            free_amt = float(balance['free'])
+            locked_amt = float(balance['locked'])
+            if free_amt > 0 or locked_amt > 0:
+                out.append(f"{balance['asset']}: Free={free_amt}, Locked={locked_amt}")
+
+        out.append(f"\nAccount Type: {account.get('accountType', 'N/A')}")
+        out.append(f"Can Trade: {account.get('canTrade', 'N/A')}")
+        out.append(f"Can Withdraw: {account.get('canWithdraw', 'N/A')}")
+        out.append(f"Can Deposit: {account.get('canDeposit', 'N/A')}")
+
+        # Check trading status for specific symbols
+        out.append("\n=== CHECKING SYMBOL INFO ===")
+        target_symbols = ["ETHUSDT", "BTCUSDT", "SUIUSDT"]
+        for symbol in target_symbols:
+            try:
+                symbol_info = get_symbol_info(client, symbol)
+                out.append(f"{symbol}: Status = {symbol_info['status']}")
+            except Exception as e:
+                out.append(f"{symbol}: Error getting info - {e}")
+
+    except Exception as exc:
+        out.append(f"ERROR: {exc}")
+    finally:
+        sys.stdout.write("\n".join(out) + "\n")
+
+if __name__ == "__main__":
+    main() 
\ No newline at end of file
@@ -0,0 +1,59 @@
+"""
+Check Testnet balance only for BTC, ETH, SUI and USDT.
+"""
+from crypton.utils.binance_client import testnet_client, with_backoff
+
+TARGET_ASSETS = {"BTC", "ETH", "SUI", "USDT"}   # <-- dodali smo USDT
+
+def main():
+    client = testnet_client()
+    if client is None:
+        print("ERROR: API credentials not found in environment variables")
+        return
+
+    try:
+        account = with_backoff(client.get_account)
+        # Parse each balance string once: asset -> (free, locked)
+        balances = {
+            b["asset"]: (float(b["free"]), float(b["locked"]))
+            for b in account["balances"] if b["asset"] in TARGET_ASSETS
+        }
+
+        print("\n=== BALANCES (BTC / ETH / SUI / USDT) ===")
+        print("Asset\tFree\t\tLocked")
+        print("-" * 36)
+        for asset in TARGET_ASSETS:
+            free, locked = balances.get(asset, (0.0, 0.0))
+            print(f"{asset:<8}{free:<16.8f}{locked:.8f}")
+
+        print("\n=== ESTIMATED VALUE IN USDT ===")
+        total_value = 0.0
+        usdt_qty = sum(balances.get("USDT", (0.0, 0.0)))
+        if usdt_qty > 0:
+            total_value += usdt_qty
+            print(f"USDT: {usdt_qty} USDT")
+
+        # Only assets actually held need a price, skip the ticker request otherwise
+        active = [
+            (asset, qty) for asset in TARGET_ASSETS
+            if asset != "USDT" and (qty := sum(balances.get(asset, (0.0, 0.0)))) > 0
+        ]
+        prices = {t["symbol"]: float(t["price"]) for t in with_backoff(client.get_all_tickers)} if active else {}
+
+        for asset, qty in active:
+            price = prices.get(f"{asset}USDT")
+            if price is None:
+                print(f"{asset}: {qty} (price unavailable)")
+                continue
+
+            value  = qty * price
+            total_value += value
+            print(f"{asset}: {qty} × {price} = {value:.2f} USDT")
+
+        print(f"\nTotal Estimated Value (BTC/ETH/SUI/USDT): {total_value:.2f} USDT")
+
+    except Exception as exc:
+        print(f"ERROR: {exc}")
+
+if __name__ == "__main__":
+    main()
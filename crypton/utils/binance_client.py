@@ -0,0 +1,164 @@
+"""
+Binance client helpers for the Crypton command-line tools.
+
+This module provides a shared testnet client (one HTTP session per process,
+multiplexed over HTTP/2 when httpx is installed) and a disk-cached
+exchangeInfo lookup so repeated script runs don't re-download the full
+exchange metadata every time.
+"""
+import json
+import os
+import random
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+
+from dotenv import load_dotenv
+
+if TYPE_CHECKING:
+    from binance.client import Client
+
+TESTNET_API_URL = "https://testnet.binance.vision/api"
+CACHE_DIR = Path.home() / ".cache" / "crypton"
+EXCHANGE_INFO_TTL_S = 3600
+RATE_LIMIT_CODES = {-1003, -1015}  # too many requests / too many new orders
+
+# Per-process index of symbol -> symbol info, built from the cached exchangeInfo
+_symbol_index: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+
+@lru_cache(maxsize=1)
+def testnet_client() -> Optional["Client"]:
+    """
+    Get the process-wide Binance Testnet client.
+
+    The .env file and credentials are read on the first call only; later
+    calls return the same client, so its session (and the TLS connection
+    behind it) stays alive across every request. With httpx installed the
+    client speaks HTTP/2, otherwise it uses a keep-alive requests.Session.
+
+    Returns:
+        Binance client configured for the testnet, or None if credentials are missing
+    """
+    load_dotenv()
+
+    api_key = os.getenv("BINANCE_TESTNET_API_KEY") or os.getenv("BINANCE_API_KEY")
+    api_secret = os.getenv("BINANCE_TESTNET_API_SECRET") or os.getenv("BINANCE_API_SECRET")
+    if not (api_key and api_secret):
+        return None
+
+    # Import the client stack only once we know it will be used
+    try:
+        from crypton.utils.http2_client import Http2Client
+        client = Http2Client(api_key=api_key, api_secret=api_secret)
+    except ImportError:
+        from binance.client import Client
+        client = Client(api_key=api_key, api_secret=api_secret)
+        client.session.headers["Connection"] = "keep-alive"
+    client.API_URL = TESTNET_API_URL
+    return client
+
+
+def _is_rate_limited(exc: Exception) -> bool:
+    """Check whether an API error is Binance asking the client to slow down."""
+    return getattr(exc, "status_code", None) == 429 or getattr(exc, "code", None) in RATE_LIMIT_CODES
+
+
+def with_backoff(fn: Callable[..., Any], *args: Any, tries: int = 5, base: float = 1.0, **kwargs: Any) -> Any:
+    """
+    Call a client method, retrying with exponential backoff and jitter on rate limits.
+
+    Args:
+        fn: Client method to call (e.g. client.get_account)
+        *args: Positional arguments for fn
+        tries: Maximum number of attempts
+        base: Delay in seconds before the first retry, doubled on every attempt
+        **kwargs: Keyword arguments for fn
+
+    Returns:
+        Whatever fn returns
+    """
+    for attempt in range(tries):
+        try:
+            return fn(*args, **kwargs)
+        except Exception as e:
+            if not _is_rate_limited(e) or attempt == tries - 1:
+                raise
+            delay = base * 2 ** attempt + random.random()
+            # Imported here, so the tools only load loguru when they have to warn
+            from loguru import logger
+            logger.warning(f"Rate limited by Binance ({e}), retrying in {delay:.1f}s")
+            time.sleep(delay)
+
+
+def _exchange_info_path(client: Any) -> Path:
+    """Return the cache file for the client's environment (testnet or production)."""
+    if "testnet" in getattr(client, "API_URL", ""):
+        return CACHE_DIR / "exchange_info_testnet.json"
+    return CACHE_DIR / "exchange_info.json"
+
+
+def get_cached_exchange_info(
+    client: Any,
+    ttl_s: int = EXCHANGE_INFO_TTL_S,
+    cache_path: Optional[Path] = None
+) -> Dict[str, Any]:
+    """
+    Get exchangeInfo, reusing the on-disk copy while it is younger than ttl_s.
+
+    Args:
+        client: Binance client used to download exchangeInfo on a cache miss
+        ttl_s: Maximum age of the cached file in seconds
+        cache_path: Cache file location (defaults to ~/.cache/crypton)
+
+    Returns:
+        Dictionary with the exchangeInfo response
+    """
+    cache_path = cache_path or _exchange_info_path(client)
+
+    try:
+        if time.time() - cache_path.stat().st_mtime < ttl_s:
+            with open(cache_path, "r") as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        # Missing or unreadable cache, fall through to the API
+        pass
+
+    exchange_info = client.get_exchange_info()
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, "w") as f:
+            json.dump(exchange_info, f)
+    except OSError as e:
+        from loguru import logger
+        logger.warning(f"Could not write exchange info cache {cache_path}: {e}")
+
+    return exchange_info
+
+
+def get_symbol_info(
+    client: Any,
+    symbol: str,
+    ttl_s: int = EXCHANGE_INFO_TTL_S
+) -> Optional[Dict[str, Any]]:
+    """
+    Look up trading information for a symbol from the cached exchangeInfo.
+
+    Args:
+        client: Binance client
+        symbol: Trading pair symbol (e.g., 'BTCUSDT' or 'BTC/USDT')
+        ttl_s: Maximum age of the cached exchangeInfo in seconds
+
+    Returns:
+        Symbol information dictionary, or None if the symbol is unknown
+    """
+    cache_path = _exchange_info_path(client)
+    index = _symbol_index.get(str(cache_path))
+    if index is None:
+        exchange_info = get_cached_exchange_info(client, ttl_s, cache_path)
+        index = {s["symbol"]: s for s in exchange_info.get("symbols", [])}
+        _symbol_index[str(cache_path)] = index
+
+    return index.get(symbol.replace("/", ""))
@@ -4,13 +4,18 @@ Configuration utilities for the Crypton trading bot.
 This module provides functions for loading and managing configuration settings.
 """
 import os
+import re
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple, Union
 
 import yaml
 from loguru import logger
 
 
+# Cool-down setting: a number with an optional m/h unit, hours when it has none
+_COOL_DOWN_RE = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*([mh]?)\s*$')
+
+
 def get_project_root() -> Path:
     """
     Get the project root directory.
@@ -57,3 +62,31 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     except Exception as e:
         logger.error(f"Error loading configuration: {e}")
         return {}
+
+
+def parse_cool_down(value: Any, default_hours: float = 4) -> Tuple[Union[int, float], Union[int, float]]:
+    """
+    Parse a cool-down setting such as '15m', '4h' or a plain number of hours.
+    
+    Args:
+        value: Cool-down from the config, a string with an optional unit or a number
+        default_hours: Hours used when the value can't be parsed
+        
+    Returns:
+        Tuple of (hours, minutes); values with a unit suffix stay whole numbers
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        # Numbers are hours, taken as they are like float() always did
+        logger.info(f"Cool-down set to {float(value)} hours")
+        return float(value), 0
+    match = _COOL_DOWN_RE.match(str(value))
+    if match is None:
+        logger.error(f"Invalid cool_down format: {value}, using default {default_hours} hours")
+        return default_hours, 0
+    number, unit = match.groups()
+    amount = int(number) if unit and number.isdigit() else float(number)
+    if unit == 'm':
+        logger.info(f"Cool-down set to {amount} minutes")
+        return 0, amount
+    logger.info(f"Cool-down set to {amount} hours")
+    return amount, 0
@@ -0,0 +1,56 @@
+"""
+HTTP/2 transport for the python-binance REST client.
+
+Requires the optional httpx[http2] dependency; importing this module raises
+ImportError when it is not installed.
+"""
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode
+
+import h2  # noqa: F401 - required by httpx for HTTP/2
+import httpx
+from binance.client import Client
+
+
+class _HttpxSession:
+    """
+    Minimal requests.Session stand-in backed by an HTTP/2 httpx client.
+
+    python-binance only calls session.get/post/put/delete(uri, **kwargs) and
+    reads status_code, json() and text from the response, which httpx provides.
+    """
+
+    def __init__(self, headers: Dict[str, str]):
+        self._client = httpx.Client(http2=True, headers=dict(headers))
+        self.headers = self._client.headers
+
+    def _request(self, method: str, url: str, params: Any = None, data: Any = None,
+                 timeout: Optional[float] = None, **kwargs: Any) -> Any:
+        headers = None
+        content = None
+        if data:
+            # python-binance passes signed bodies as ordered (key, value) pairs
+            content = urlencode(data)
+            headers = {"Content-Type": "application/x-www-form-urlencoded"}
+        return self._client.request(
+            method, url, params=params, content=content, headers=headers, timeout=timeout
+        )
+
+    def get(self, url: str, **kwargs: Any) -> Any:
+        return self._request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> Any:
+        return self._request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any) -> Any:
+        return self._request("PUT", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> Any:
+        return self._request("DELETE", url, **kwargs)
+
+
+class Http2Client(Client):
+    """Binance client whose REST calls share one multiplexed HTTP/2 connection."""
+
+    def _init_session(self) -> _HttpxSession:
+        return _HttpxSession(super()._init_session().headers)
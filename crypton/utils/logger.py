@@ -22,7 +22,8 @@ def setup_logger(
     log_level: str = "INFO",
     log_file: Optional[str] = None,
     json_format: bool = True,
-    debug_mode: bool = False
+    debug_mode: bool = False,
+    enqueue: bool = False
 ) -> None:
     """
     Configure and set up the Loguru logger.
@@ -31,6 +32,8 @@ def setup_logger(
         log_level: Logging level (default: INFO)
         log_file: Path to log file (optional)
         json_format: Whether to use JSON format for structured logging
+        enqueue: Write records on a background thread instead of the calling
+            one (default: False); used by the backtest modes
     """
     global _LOGGER_INITIALIZED
     if _LOGGER_INITIALIZED:
@@ -68,7 +71,8 @@ def setup_logger(
         sys.stderr,
         format=log_format,
         level=log_level,
-        colorize=not current_json_format
+        colorize=not current_json_format,
+        enqueue=enqueue
     )
     
     # Add file logger if specified
@@ -78,7 +82,8 @@ def setup_logger(
             format=log_format,
             level=log_level,
             rotation="10 MB",
-            retention="7 days"
+            retention="7 days",
+            enqueue=enqueue
         )
     
     logger.info(f"Logger initialized with level={log_level}, json_format={current_json_format}, debug_mode={debug_mode}")
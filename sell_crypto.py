@@ -1,32 +1,21 @@
 """
 Script to sell BTC, ETH, and SUI to USDT on Binance Testnet.
 """
-import os
 import time
 import math
 from decimal import Decimal
-from dotenv import load_dotenv
-from binance.client import Client
 from binance.enums import *
 from loguru import logger
 
+from crypton.utils.binance_client import get_symbol_info, testnet_client, with_backoff
+
 def main():
-    # Load environment variables
-    load_dotenv()
-    
-    # Get API credentials
-    api_key = os.getenv("BINANCE_TESTNET_API_KEY") or os.getenv("BINANCE_API_KEY")
-    api_secret = os.getenv("BINANCE_TESTNET_API_SECRET") or os.getenv("BINANCE_API_SECRET")
-    
-    if not api_key or not api_secret:
+    client = testnet_client()
+    if client is None:
         print("ERROR: API credentials not found in environment variables")
         return
     
-    print(f"Using API key: {api_key[:5]}...{api_key[-5:]}")
-    
-    # Initialize Binance client for testnet
-    client = Client(api_key=api_key, api_secret=api_secret)
-    client.API_URL = 'https://testnet.binance.vision/api'
+    print(f"Using API key: {client.API_KEY[:5]}...{client.API_KEY[-5:]}")
     
     # Symbols to sell
     symbols_to_sell = [
@@ -55,7 +44,7 @@ def main():
 
 def get_usdt_balance(client):
     """Get USDT balance from account."""
-    account = client.get_account()
+    account = with_backoff(client.get_account)
     for balance in account['balances']:
         if balance['asset'] == 'USDT':
             return float(balance['free'])
@@ -63,7 +52,7 @@ def get_usdt_balance(client):
 
 def get_asset_balance(client, asset):
     """Get specific asset balance from account."""
-    account = client.get_account()
+    account = with_backoff(client.get_account)
     for balance in account['balances']:
         if balance['asset'] == asset:
             return float(balance['free'])
@@ -81,7 +70,7 @@ def sell_all(client, symbol, asset):
     print(f"Selling {balance} {asset}...")
     
     # Get symbol info to ensure valid quantity precision
-    symbol_info = client.get_symbol_info(symbol)
+    symbol_info = get_symbol_info(client, symbol)
     
     # Find the lot size filter
     lot_size = next((filter for filter in symbol_info['filters'] if filter['filterType'] == 'LOT_SIZE'), None)
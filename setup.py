@@ -0,0 +1,30 @@
+"""
+Build the optional Cython simulation kernel.
+
+Project metadata lives in pyproject.toml. The extension is only built when
+Cython and NumPy are importable at build time, and a failed compile is not
+fatal: crypton then falls back to numba or the Python simulation. To build
+it, install Cython first and skip build isolation:
+
+    pip install cython && pip install --no-build-isolation -e .
+"""
+from setuptools import setup
+
+try:
+    import numpy as np
+    from Cython.Build import cythonize
+    from setuptools import Extension
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        [Extension(
+            "crypton.backtesting._kernels_cy",
+            ["crypton/backtesting/_kernels_cy.pyx"],
+            include_dirs=[np.get_include()],
+            optional=True
+        )],
+        language_level=3
+    )
+
+setup(ext_modules=ext_modules)
@@ -0,0 +1,68 @@
+"""
+Tests for the backtest harness.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from crypton.backtesting.backtest import BacktestHarness
+
+
+class TestVectorizedParity:
+    """Test that vectorized_run() reproduces run_backtest() on the Cerebro path."""
+
+    @pytest.fixture
+    def ohlcv(self):
+        """Fixture for hourly bars of a random walk with sharp dips that trigger entries."""
+        rng = np.random.default_rng(7)
+        close = 100 + np.cumsum(rng.normal(0, 0.5, 600))
+        close[rng.choice(np.arange(50, 600), 15, replace=False)] -= 4
+        open_ = np.concatenate(([close[0]], close[:-1])) + rng.normal(0, 0.1, 600)
+        return pd.DataFrame({
+            'timestamp': pd.date_range('2024-01-01', periods=600, freq='h'),
+            'open': open_,
+            'high': np.maximum(open_, close) + 0.2,
+            'low': np.minimum(open_, close) - 0.2,
+            'close': close,
+            'volume': rng.uniform(1, 10, 600),
+        })
+
+    @pytest.fixture
+    def harness(self, tmp_path, monkeypatch):
+        """Fixture for a harness that writes its logs under a temporary directory."""
+        monkeypatch.chdir(tmp_path)
+        return BacktestHarness({
+            'backtest': {'detailed_logs': False},
+            'risk': {'position_size_pct': 0.5},
+            'cool_down': {'hours': '1h'},
+        })
+
+    def test_trades_and_final_value(self, harness, ohlcv):
+        """Test that both paths place the same trades and end with the same account value."""
+        strategy, cerebro_metrics = harness.run_backtest('TEST/USDT', '1h', ohlcv, write_summary=False)
+        backtest, vectorized_metrics = harness.vectorized_run(ohlcv)
+        harness.flush_logs()
+
+        assert cerebro_metrics['total_trades_analyzer'] > 0
+        for key in ('total_trades_analyzer', 'wins_analyzer', 'losses_analyzer'):
+            assert vectorized_metrics[key] == cerebro_metrics[key]
+        assert vectorized_metrics['final_value'] == pytest.approx(cerebro_metrics['final_value'])
+        np.testing.assert_allclose(backtest.result.trade_pnl, [pnl['net_pnl'] for pnl in strategy.trade_pnls])
+
+        buys = strategy.buy_signals.to_frame()
+        sells = strategy.sell_signals.to_frame()
+        assert len(buys) + len(sells) == len(backtest.result.action)
+
+
+class TestRunId:
+    """Test cases for the ids that name a run's log files."""
+
+    def test_harnesses_get_distinct_ids(self, tmp_path, monkeypatch):
+        """Test that runs of separate harnesses in the same process never share an id."""
+        monkeypatch.chdir(tmp_path)
+        first = BacktestHarness({})
+        second = BacktestHarness({})
+
+        ids = [first._run_id(), second._run_id(), first._run_id(), second._run_id()]
+
+        assert len(set(ids)) == len(ids)
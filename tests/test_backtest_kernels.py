@@ -0,0 +1,33 @@
+"""
+Tests for the backtesting decision kernels.
+"""
+import pytest
+
+from crypton.backtesting._kernels import (
+    EXIT_NONE,
+    EXIT_STOP_LOSS,
+    EXIT_TIER1,
+    EXIT_TIER2,
+    EXIT_TIER3,
+    decide_exit,
+)
+
+
+class TestDecideExit:
+    """Test cases for the take-profit / stop-loss decision kernel."""
+
+    TIERS = (0.02, 0.03, 0.04, 0.02)
+
+    @pytest.mark.parametrize("close, hits, expected", [
+        (100.0, (False, False, False), EXIT_NONE),
+        (102.5, (False, False, False), EXIT_TIER1),
+        (103.5, (False, False, False), EXIT_TIER2),
+        (105.0, (False, False, False), EXIT_TIER3),
+        (105.0, (False, False, True), EXIT_TIER2),
+        (105.0, (True, True, True), EXIT_NONE),
+        (97.0, (False, False, False), EXIT_STOP_LOSS),
+        (97.0, (True, False, False), EXIT_STOP_LOSS),
+    ])
+    def test_decide_exit(self, close, hits, expected):
+        """Test that the highest untaken tier wins and the stop loss fires below the entry."""
+        assert decide_exit(close, 100.0, *hits, *self.TIERS) == expected
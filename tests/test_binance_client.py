@@ -0,0 +1,117 @@
+"""
+Tests for the Binance client helpers.
+"""
+import json
+import os
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from crypton.utils import binance_client
+from crypton.utils.binance_client import get_cached_exchange_info, get_symbol_info, with_backoff
+
+
+class TestExchangeInfoCache:
+    """Test cases for the cached exchangeInfo lookup."""
+
+    @pytest.fixture
+    def exchange_info(self):
+        """Fixture for a minimal exchangeInfo response."""
+        return {
+            'symbols': [
+                {'symbol': 'BTCUSDT', 'status': 'TRADING'},
+                {'symbol': 'ETHUSDT', 'status': 'BREAK'}
+            ]
+        }
+
+    @pytest.fixture
+    def mock_client(self, exchange_info):
+        """Fixture for a mocked testnet client."""
+        client = MagicMock()
+        client.API_URL = 'https://testnet.binance.vision/api'
+        client.get_exchange_info.return_value = exchange_info
+        return client
+
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, tmp_path, monkeypatch):
+        """Point the cache at a temporary directory."""
+        monkeypatch.setattr(binance_client, 'CACHE_DIR', tmp_path)
+        monkeypatch.setattr(binance_client, '_symbol_index', {})
+        return tmp_path
+
+    def test_fresh_cache_is_reused(self, mock_client, exchange_info, cache_dir):
+        """Test that a second call within the TTL does not hit the API."""
+        assert get_cached_exchange_info(mock_client) == exchange_info
+        assert get_cached_exchange_info(mock_client) == exchange_info
+
+        mock_client.get_exchange_info.assert_called_once()
+        assert (cache_dir / 'exchange_info_testnet.json').exists()
+
+    def test_stale_cache_is_refreshed(self, mock_client, cache_dir):
+        """Test that a cache file older than the TTL is downloaded again."""
+        cache_file = cache_dir / 'exchange_info_testnet.json'
+        cache_file.write_text(json.dumps({'symbols': []}))
+        stale = time.time() - 7200
+        os.utime(cache_file, (stale, stale))
+
+        info = get_cached_exchange_info(mock_client, ttl_s=3600)
+
+        mock_client.get_exchange_info.assert_called_once()
+        assert len(info['symbols']) == 2
+
+    def test_get_symbol_info(self, mock_client):
+        """Test symbol lookups from the cached index."""
+        assert get_symbol_info(mock_client, 'BTC/USDT')['status'] == 'TRADING'
+        assert get_symbol_info(mock_client, 'ETHUSDT')['status'] == 'BREAK'
+        assert get_symbol_info(mock_client, 'DOGEUSDT') is None
+
+        mock_client.get_exchange_info.assert_called_once()
+
+
+class TestWithBackoff:
+    """Test cases for the rate-limit retry helper."""
+
+    @staticmethod
+    def api_error(code, status_code=400):
+        """Build an exception shaped like BinanceAPIException."""
+        error = Exception(f"APIError(code={code})")
+        error.code = code
+        error.status_code = status_code
+        return error
+
+    @pytest.fixture(autouse=True)
+    def no_sleep(self, monkeypatch):
+        """Skip the real backoff delays."""
+        sleep = MagicMock()
+        monkeypatch.setattr(binance_client.time, 'sleep', sleep)
+        return sleep
+
+    def test_retries_on_rate_limit(self, no_sleep):
+        """Test that rate-limit errors are retried until the call succeeds."""
+        fn = MagicMock(side_effect=[self.api_error(-1003), self.api_error(0, 429), {'ok': True}])
+
+        assert with_backoff(fn, 'BTCUSDT', base=0.5, limit=10) == {'ok': True}
+
+        assert fn.call_count == 3
+        fn.assert_called_with('BTCUSDT', limit=10)
+        assert no_sleep.call_count == 2
+
+    def test_other_errors_are_raised(self, no_sleep):
+        """Test that non rate-limit errors are not retried."""
+        fn = MagicMock(side_effect=self.api_error(-2011))
+
+        with pytest.raises(Exception):
+            with_backoff(fn)
+
+        fn.assert_called_once()
+        no_sleep.assert_not_called()
+
+    def test_gives_up_after_tries(self, no_sleep):
+        """Test that the last rate-limit error is raised once tries run out."""
+        fn = MagicMock(side_effect=self.api_error(-1015))
+
+        with pytest.raises(Exception):
+            with_backoff(fn, tries=3)
+
+        assert fn.call_count == 3
@@ -0,0 +1,32 @@
+"""
+Tests for the configuration utilities.
+"""
+import pytest
+
+from crypton.utils.config import parse_cool_down
+
+
+class TestParseCoolDown:
+    """Test cases for parse_cool_down."""
+
+    @pytest.mark.parametrize('value, expected', [
+        ('15m', (0, 15)),
+        ('4h', (4, 0)),
+        ('1.5h', (1.5, 0)),
+        ('2.5', (2.5, 0)),
+        (4, (4.0, 0)),
+        (' 30m ', (0, 30)),
+    ])
+    def test_valid(self, value, expected):
+        """Test minutes, hours and unitless hours, as strings and numbers."""
+        assert parse_cool_down(value) == expected
+
+    @pytest.mark.parametrize('value', [2, 2.5, 1e-05, -1, 0])
+    def test_numbers_are_hours(self, value):
+        """Test that numeric settings are used as hours without going through the string format."""
+        assert parse_cool_down(value, default_hours=7) == (float(value), 0)
+
+    @pytest.mark.parametrize('value', ['soon', '15s', '-1', ''])
+    def test_invalid_uses_default(self, value):
+        """Test that unparsable settings fall back to the default hours."""
+        assert parse_cool_down(value, default_hours=2) == (2, 0)
@@ -0,0 +1,98 @@
+"""
+Tests for the vectorized backtesting indicators.
+"""
+import numpy as np
+import pytest
+
+from crypton.backtesting import _fast_indicators
+from crypton.backtesting._fast_indicators import bollinger_bands, wilder_rsi
+from crypton.backtesting._indicator_cache import (
+    _cached_bollinger_bands,
+    _cached_rsi,
+    cached_bollinger_bands,
+    cached_rsi,
+)
+
+
+class TestFastIndicators:
+    """Test cases for the vectorized Bollinger Bands and RSI."""
+
+    @pytest.fixture
+    def close(self):
+        """Fixture for a random-walk close price series."""
+        rng = np.random.default_rng(42)
+        return 100 + np.cumsum(rng.normal(0, 1, 200))
+
+    @pytest.mark.parametrize('fused', [False, True])
+    def test_bollinger_bands(self, close, fused, monkeypatch):
+        """Test the pandas and streaming bands against a per-window population standard deviation."""
+        monkeypatch.setattr(_fast_indicators, 'bn', None)
+        monkeypatch.setattr(_fast_indicators, 'HAVE_NUMBA', fused)
+        upper, middle, lower = bollinger_bands(close, 20, 2.0)
+
+        assert np.isnan(middle[:19]).all()
+        for i in (19, 100, 199):
+            window = close[i - 19:i + 1]
+            assert middle[i] == pytest.approx(window.mean())
+            assert upper[i] == pytest.approx(window.mean() + 2.0 * window.std())
+            assert lower[i] == pytest.approx(window.mean() - 2.0 * window.std())
+
+    @pytest.mark.parametrize('fused', [False, True])
+    def test_wilder_rsi(self, close, fused, monkeypatch):
+        """Test the pandas and fused RSI against a bar-by-bar Wilder smoothing loop."""
+        # The fused kernel runs as plain Python without numba, so both paths are testable either way
+        monkeypatch.setattr(_fast_indicators, 'HAVE_NUMBA', fused)
+        length = 14
+        rsi = wilder_rsi(close, length)
+
+        delta = np.diff(close)
+        avg_up = np.maximum(delta[:length], 0).mean()
+        avg_down = np.maximum(-delta[:length], 0).mean()
+        expected = [100 - 100 / (1 + avg_up / avg_down)]
+        for d in delta[length:]:
+            avg_up += (max(d, 0) - avg_up) / length
+            avg_down += (max(-d, 0) - avg_down) / length
+            expected.append(100 - 100 / (1 + avg_up / avg_down))
+
+        assert np.isnan(rsi[:length]).all()
+        np.testing.assert_allclose(rsi[length:], expected)
+
+    def test_wilder_rsi_short_series(self):
+        """Test that a series shorter than the period is all warmup."""
+        assert np.isnan(wilder_rsi(np.array([1.0, 2.0, 3.0]), 14)).all()
+
+
+class TestIndicatorCache:
+    """Test cases for the memoized indicators."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Start every test with an empty in-memory cache."""
+        _cached_bollinger_bands.cache_clear()
+        _cached_rsi.cache_clear()
+
+    def test_memory_cache(self, monkeypatch):
+        """Test that equal price series share one computation."""
+        monkeypatch.delenv('CRYPTON_INDICATOR_CACHE_DIR', raising=False)
+        close = np.linspace(100, 120, 50)
+
+        first = cached_bollinger_bands(close, 20, 2.0)
+        second = cached_bollinger_bands(close.copy(), 20, 2.0)
+        cached_bollinger_bands(close, 10, 2.0)
+
+        assert first[1] is second[1]
+        assert not first[1].flags.writeable
+        assert _cached_bollinger_bands.cache_info().misses == 2
+        np.testing.assert_array_equal(cached_rsi(close, 14), wilder_rsi(close, 14))
+
+    def test_disk_cache(self, tmp_path, monkeypatch):
+        """Test that results written to disk are reused by a fresh process cache."""
+        monkeypatch.setenv('CRYPTON_INDICATOR_CACHE_DIR', str(tmp_path))
+        close = np.linspace(100, 120, 50)
+
+        expected = cached_bollinger_bands(close, 20, 2.0)
+        assert len(list(tmp_path.glob('bb_*.npz'))) == 1
+
+        _cached_bollinger_bands.cache_clear()
+        for cached, reference in zip(cached_bollinger_bands(close, 20, 2.0), expected):
+            np.testing.assert_array_equal(cached, reference)
@@ -0,0 +1,47 @@
+"""
+Tests for the columnar signal buffer.
+"""
+from datetime import datetime
+
+import numpy as np
+
+from crypton.backtesting._buffers import SignalBuffer
+
+
+class TestSignalBuffer:
+    """Test cases for SignalBuffer."""
+
+    COLUMNS = {'time': 'datetime64[s]', 'price': 'float64', 'reason': 'int8', 'pct': 'float32'}
+
+    def test_append_grows_and_fills_missing(self):
+        """Test growth past the initial capacity and NaN for omitted columns."""
+        buffer = SignalBuffer(self.COLUMNS, labels={'reason': {1: 'TP', 2: 'SL'}}, capacity=2)
+        for i in range(5):
+            buffer.append(time=datetime(2024, 1, 1, i), price=100.0 + i, reason=1 + i % 2)
+        buffer.append(price=99.0, reason=2, pct=1.5)
+
+        assert len(buffer) == 6
+        np.testing.assert_array_equal(buffer.column('price'), [100, 101, 102, 103, 104, 99])
+        assert np.isnan(buffer.column('pct')[:5]).all()
+
+        frame = buffer.to_frame()
+        assert list(frame['reason']) == ['TP', 'SL', 'TP', 'SL', 'TP', 'SL']
+        assert frame['time'].iloc[1] == datetime(2024, 1, 1, 1)
+        assert frame['time'].isna().iloc[5]
+
+    def test_empty_buffer(self):
+        """Test that an empty buffer converts to an empty frame with the schema."""
+        frame = SignalBuffer(self.COLUMNS).to_frame()
+        assert frame.empty
+        assert list(frame.columns) == list(self.COLUMNS)
+
+    def test_reserve_keeps_rows(self):
+        """Test that reserving capacity keeps the recorded rows and never shrinks."""
+        buffer = SignalBuffer(self.COLUMNS, capacity=2)
+        buffer.append(price=1.0)
+        buffer.reserve(100)
+        buffer.reserve(10)
+
+        assert buffer._capacity == 100
+        np.testing.assert_array_equal(buffer.column('price'), [1.0])
+        assert np.isnan(buffer._columns['price'][1:]).all()
@@ -0,0 +1,165 @@
+"""
+Tests for the array-based mean reversion simulation.
+"""
+import numpy as np
+import pytest
+
+from crypton.backtesting._kernels import (
+    EXIT_NONE,
+    EXIT_STOP_LOSS,
+    EXIT_TIER1,
+    EXIT_TIER2,
+    EXIT_TIER3,
+    decide_exit,
+    simulate_trades,
+    sweep_exit_levels,
+)
+from crypton.backtesting import _vectorized
+from crypton.backtesting._vectorized import ACTION_BUY, SimulationParams, closed_trades, simulate_mean_reversion
+
+
+def reference_run(open_, close, entry_signal, bar_ns, params, cash, commission):
+    """Bar-by-bar replay of MeanReversionBT with fills at the next open."""
+    tier_pcts = (params.take_profit_tier1_pct, params.take_profit_tier2_pct, params.take_profit_tier3_pct)
+    tier_size_pcts = (params.take_profit_tier1_size_pct, params.take_profit_tier2_size_pct,
+                      params.take_profit_tier3_size_pct)
+    orders, pending = [], None
+    position = entry_price = original_size = 0.0
+    tiers_hit = [False] * 3
+    cool_down_end = -np.inf
+    for i in range(len(close)):
+        if pending is not None:
+            action, size = pending
+            value = size * open_[i]
+            if action == ACTION_BUY:
+                if value * (1 + commission) <= cash:
+                    cash -= value * (1 + commission)
+                    position = original_size = size
+                    entry_price = open_[i]
+                    tiers_hit = [False] * 3
+            else:
+                cash += value * (1 - commission)
+                position -= size
+            pending = None
+        if bar_ns[i] < cool_down_end:
+            continue
+        if entry_signal[i] and position == 0:
+            pending = (ACTION_BUY, cash * params.position_size_pct / close[i])
+            cool_down_end = bar_ns[i] + params.cool_down_ns
+        elif position:
+            action = decide_exit(close[i], entry_price, *tiers_hit, *tier_pcts, params.stop_loss_pct)
+            if action == EXIT_NONE:
+                continue
+            if action == EXIT_STOP_LOSS:
+                size = position
+            else:
+                size = min(original_size * tier_size_pcts[action - EXIT_TIER1], position)
+                tiers_hit[action - EXIT_TIER1] = True
+            if action in (EXIT_TIER1, EXIT_STOP_LOSS):
+                cool_down_end = bar_ns[i] + params.cool_down_ns
+            pending = (action, size)
+        else:
+            continue
+        orders.append((i, pending[0], pending[1]))
+    return orders, cash + position * close[-1]
+
+
+class TestSimulateMeanReversion:
+    """Test cases for simulate_mean_reversion."""
+
+    @pytest.fixture
+    def bars(self):
+        """Fixture for a volatile random walk with a random entry signal."""
+        rng = np.random.default_rng(7)
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 3000)))
+        open_ = np.concatenate(([close[0]], close[:-1])) * (1 + rng.normal(0, 0.001, 3000))
+        entry_signal = rng.random(3000) < 0.02
+        bar_ns = np.arange(3000, dtype=np.int64) * 15 * 60 * 10**9
+        return open_, close, entry_signal, bar_ns
+
+    @pytest.mark.parametrize('compiled', [False, True])
+    @pytest.mark.parametrize('cool_down_minutes', [0, 60])
+    def test_matches_bar_by_bar_replay(self, bars, cool_down_minutes, compiled, monkeypatch):
+        """Test that both simulation paths give the same orders as a per-bar replay."""
+        # The kernel runs as plain Python without numba, so both paths are testable either way
+        monkeypatch.setattr(_vectorized, 'HAVE_NUMBA', compiled)
+        params = SimulationParams(
+            position_size_pct=0.5,
+            stop_loss_pct=0.02,
+            take_profit_tier1_pct=0.01,
+            take_profit_tier2_pct=0.02,
+            take_profit_tier3_pct=0.03,
+            take_profit_tier1_size_pct=0.5,
+            take_profit_tier2_size_pct=0.3,
+            take_profit_tier3_size_pct=1.0,
+            cool_down_ns=cool_down_minutes * 60 * 10**9
+        )
+        result = simulate_mean_reversion(*bars, params, 1000.0, 0.001)
+        orders, final_value = reference_run(*bars, params, 1000.0, 0.001)
+
+        assert len(orders) > 20
+        np.testing.assert_array_equal(result.signal_bar, [bar for bar, _, _ in orders])
+        np.testing.assert_array_equal(result.action, [action for _, action, _ in orders])
+        np.testing.assert_allclose(result.size, [size for _, _, size in orders])
+        assert result.final_value == pytest.approx(final_value)
+        assert len(result.trade_pnl) >= result.trades_opened - 1
+
+    def test_closed_trades(self, bars):
+        """Test that the trade summary lines up with the closed-trade P&L."""
+        params = SimulationParams(
+            position_size_pct=0.5,
+            stop_loss_pct=0.02,
+            take_profit_tier1_pct=0.01,
+            take_profit_tier2_pct=0.02,
+            take_profit_tier3_pct=0.03,
+            take_profit_tier1_size_pct=0.5,
+            take_profit_tier2_size_pct=0.3,
+            take_profit_tier3_size_pct=1.0,
+            cool_down_ns=0
+        )
+        result = simulate_mean_reversion(*bars, params, 1000.0, 0.001)
+        trades = closed_trades(result)
+
+        assert all(len(column) == len(result.trade_pnl) for column in trades.values())
+        assert (trades['exit_bar'] > trades['entry_bar']).all()
+        assert (trades['entry_bar'][1:] > trades['exit_bar'][:-1]).all()
+        assert set(trades['exit_reason']) <= {EXIT_TIER1, EXIT_TIER2, EXIT_TIER3, EXIT_STOP_LOSS}
+        np.testing.assert_allclose(trades['pnl_pct'], result.trade_pnl / result.trade_open_value * 100)
+
+    def test_cython_kernel(self, bars):
+        """Test that the Cython kernel, when built, matches the Python one."""
+        kernels_cy = pytest.importorskip('crypton.backtesting._kernels_cy')
+        open_, close, entry_signal, bar_ns = bars
+        args = (0.5, 0.02, 0.01, 0.02, 0.03, 0.5, 0.3, 1.0, 3600 * 10**9, 1000.0, 0.001)
+
+        expected = simulate_trades(open_, close, entry_signal, bar_ns, *args)
+        result = kernels_cy.simulate_trades(open_, close, entry_signal.view(np.uint8), bar_ns, *args)
+
+        n_orders = expected[7]
+        assert result[7] == n_orders
+        for got, want in zip(result[:7], expected[:7]):
+            np.testing.assert_array_equal(got[:n_orders], want[:n_orders])
+        np.testing.assert_allclose(result[8][:result[10]], expected[8][:expected[10]])
+
+    def test_sweep_exit_levels(self, bars):
+        """Test that each grid point of the sweep kernel matches a single simulation."""
+        stop_loss_pcts = np.array([0.01, 0.02, 0.03])
+        tier1_pcts = np.array([0.01, 0.01, 0.02])
+        final_values = sweep_exit_levels(
+            *bars, 0.5, stop_loss_pcts, tier1_pcts, tier1_pcts * 2, tier1_pcts * 3,
+            0.5, 0.3, 1.0, 0, 1000.0, 0.001
+        )
+
+        for g, final_value in enumerate(final_values):
+            params = SimulationParams(
+                position_size_pct=0.5,
+                stop_loss_pct=stop_loss_pcts[g],
+                take_profit_tier1_pct=tier1_pcts[g],
+                take_profit_tier2_pct=tier1_pcts[g] * 2,
+                take_profit_tier3_pct=tier1_pcts[g] * 3,
+                take_profit_tier1_size_pct=0.5,
+                take_profit_tier2_size_pct=0.3,
+                take_profit_tier3_size_pct=1.0,
+                cool_down_ns=0
+            )
+            assert final_value == pytest.approx(simulate_mean_reversion(*bars, params, 1000.0, 0.001).final_value)